@@ -11,6 +11,7 @@ Usage:
     SuperClaude --help
 """
 
+import os
 import sys
 import argparse
 import subprocess
@@ -23,12 +24,14 @@ from typing import Dict, Callable
 try:
     from .mcp_manager import MCPManager
     from .mcp_diagnostics import MCPDiagnostics
+    from . import daemon
     from setup.utils.localization import get_string, set_language
     from setup.utils.ui import (
         display_header, display_info, display_success, display_error,
         display_warning, Colors
     )
     from setup.utils.logger import setup_logging, get_logger, LogLevel
+    from setup.utils.trace import enable_tracing, disable_tracing
     from setup import DEFAULT_INSTALL_DIR
 except ImportError:
     # Provide minimal fallback functions and constants if imports fail
@@ -42,6 +45,8 @@ except ImportError:
     def display_header(title, subtitle): print(f"{title} - {subtitle}")
     def get_logger(): return None
     def setup_logging(*args, **kwargs): pass
+    def enable_tracing(): return None
+    def disable_tracing(): return None
     class LogLevel:
         ERROR = 40
         INFO = 20
@@ -49,6 +54,7 @@ except ImportError:
     
     # Default install directory fallback
     DEFAULT_INSTALL_DIR = Path.home() / ".claude"
+    daemon = None
 
 
 def create_global_parser() -> argparse.ArgumentParser:
@@ -67,6 +73,14 @@ def create_global_parser() -> argparse.ArgumentParser:
                                help=get_string("global.force_help"))
     global_parser.add_argument("--yes", "-y", action="store_true",
                                help=get_string("global.yes_help"))
+    global_parser.add_argument("--trace", type=Path, metavar="FILE",
+                               help=get_string("global.trace_help"))
+    global_parser.add_argument("--perf-profile", action="store_true",
+                               help=get_string("global.perf_profile_help"))
+    global_parser.add_argument("--perf-profile-memory", action="store_true",
+                               help=get_string("global.perf_profile_memory_help"))
+    global_parser.add_argument("--perf-profile-top", type=int, default=25, metavar="N",
+                               help=get_string("global.perf_profile_top_help"))
 
     return global_parser
 
@@ -127,8 +141,12 @@ def get_operation_modules() -> Dict[str, str]:
         "update": "Update existing SuperClaude installation",
         "uninstall": "Remove SuperClaude installation",
         "backup": "Backup and restore operations",
+        "analyze-context": "Report the token cost of installed framework files",
+        "commands": "List and search installed slash commands",
+        "verify": "Check installed files against the install manifest",
         "add_mcp": "Install a new MCP server on-demand",
-        "diagnose_mcp": "Run diagnostics for MCP server issues"
+        "diagnose_mcp": "Run diagnostics for MCP server issues",
+        "daemon": "Keep a warm SuperClaude process serving repeated checks"
     }
     # Try to use localization if available, but fall back to the hardcoded descriptions
     try:
@@ -137,9 +155,13 @@ def get_operation_modules() -> Dict[str, str]:
         ops["update"] = get_string("op.update")
         ops["uninstall"] = get_string("op.uninstall")
         ops["backup"] = get_string("op.backup")
+        ops["analyze-context"] = get_string("op.analyze_context")
+        ops["commands"] = get_string("op.commands")
+        ops["verify"] = get_string("op.verify")
         # For our new commands, we can keep the hardcoded description as a fallback
         ops["add_mcp"] = get_string("op.add_mcp", "Install a new MCP server on-demand")
         ops["diagnose_mcp"] = get_string("op.diagnose_mcp", "Run diagnostics for MCP server issues")
+        ops["daemon"] = get_string("op.daemon")
     except NameError:
         # This block will be hit if get_string isn't defined, which is fine.
         pass
@@ -188,8 +210,9 @@ def register_add_mcp_parser(subparsers, global_parser):
 
 def load_operation_module(name: str):
     """Try to dynamically import an operation module"""
+    module_name = name.replace("-", "_")
     try:
-        return __import__(f"setup.operations.{name}", fromlist=[name])
+        return __import__(f"setup.operations.{module_name}", fromlist=[module_name])
     except ImportError as e:
         logger = get_logger()
         if logger:
@@ -214,6 +237,65 @@ def register_diagnose_mcp_parser(subparsers, global_parser):
     parser.set_defaults(run_func=run_diagnose_mcp)
 
 
+def run_daemon(args: argparse.Namespace) -> int:
+    """Run the daemon operation (start, stop or status)."""
+    if daemon is None or not daemon.is_supported():
+        display_error(get_string("daemon.unsupported"))
+        return 1
+
+    path = args.socket or daemon.get_socket_path()
+    if args.action == "status":
+        status = daemon.request_status(path)
+        if status is None:
+            display_info(get_string("daemon.not_running", path))
+            return 1
+        display_info(get_string("daemon.status", status["pid"], path, f"{status['uptime']:.0f}", status["requests"]))
+        return 0
+
+    if args.action == "stop":
+        if not daemon.request_stop(path):
+            display_info(get_string("daemon.not_running", path))
+            return 1
+        display_success(get_string("daemon.stopped"))
+        return 0
+
+    # start: serve in the foreground, e.g. under systemd or launchd
+    parser, subparsers, global_parser = create_parser()
+    operations = register_operation_parsers(subparsers, global_parser)
+    try:
+        server = daemon.DaemonServer(path, parser, operations, setup_global_environment)
+    except (RuntimeError, OSError) as e:
+        display_error(get_string("daemon.start_error", e))
+        return 1
+
+    daemon.warm_up()
+    display_success(get_string("daemon.listening", path, os.getpid()))
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    if server.restart_requested:
+        display_info(get_string("daemon.restarting"))
+        daemon.restart(path)
+    display_info(get_string("daemon.stopped"))
+    return 0
+
+
+def register_daemon_parser(subparsers, global_parser):
+    """Register the parser for the 'daemon' command."""
+    parser = subparsers.add_parser(
+        "daemon",
+        help=get_string("daemon.parser.help"),
+        description=get_string("daemon.parser.description"),
+        parents=[global_parser]
+    )
+    parser.add_argument("action", choices=["start", "stop", "status"], help=get_string("daemon.parser.action_help"))
+    parser.add_argument("--socket", type=Path, metavar="PATH", help=get_string("daemon.parser.socket_help"))
+    parser.set_defaults(run_func=run_daemon)
+
+
 def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
     """Register subcommand parsers and map operation names to their run functions"""
     operations = {}
@@ -222,6 +304,7 @@ def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]
     command_handlers = {
         "add_mcp": {"parser": register_add_mcp_parser, "runner": run_add_mcp},
         "diagnose_mcp": {"parser": register_diagnose_mcp_parser, "runner": run_diagnose_mcp},
+        "daemon": {"parser": register_daemon_parser, "runner": run_daemon},
     }
 
     all_known_ops = get_operation_modules()
@@ -242,9 +325,51 @@ def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]
     return operations
 
 
+def save_trace(args: argparse.Namespace) -> None:
+    """Write the Chrome trace requested with --trace, if any"""
+    tracer = disable_tracing()
+    trace_file = getattr(args, 'trace', None) if args is not None else None
+    if tracer is None or trace_file is None:
+        return
+
+    try:
+        path = tracer.save(trace_file)
+        display_info(get_string("main.trace_saved", path))
+    except OSError as e:
+        display_error(get_string("main.trace_save_error", trace_file, e))
+
+
+def run_profiled(run_func, args: argparse.Namespace) -> int:
+    """Run an operation under cProfile (and tracemalloc) for --perf-profile"""
+    # Imported here so runs without --perf-profile never load the profilers
+    from setup.utils.profiling import OperationProfiler
+
+    profiler = OperationProfiler(
+        args.install_dir / "logs",
+        args.operation,
+        track_memory=args.perf_profile_memory,
+        top=args.perf_profile_top
+    )
+    try:
+        return profiler.run(run_func, args)
+    finally:
+        try:
+            prof_file, summary_file = profiler.save()
+            display_info(get_string("main.profile_saved", prof_file, summary_file))
+        except OSError as e:
+            display_error(get_string("main.profile_save_error", e))
+
+
 def main() -> int:
     """Main entry point"""
+    args = None
     try:
+        # Served by a running daemon? Checked before the parser is built
+        if daemon is not None:
+            exit_code = daemon.forward(sys.argv[1:])
+            if exit_code is not None:
+                return exit_code
+
         # Set language
         try:
             set_language('ja')
@@ -255,6 +380,10 @@ def main() -> int:
         operations = register_operation_parsers(subparsers, global_parser)
         args = parser.parse_args()
 
+        # Start recording before anything else so setup shows up in the trace
+        if getattr(args, 'trace', None):
+            enable_tracing()
+
         # Setup global context (logging, install path, etc.)
         setup_global_environment(args)
         logger = get_logger()
@@ -288,6 +417,8 @@ def main() -> int:
 
         if logger:
             logger.info(f"Executing operation: {args.operation}")
+        if getattr(args, 'perf_profile', False):
+            return run_profiled(run_func, args)
         return run_func(args)
 
     except KeyboardInterrupt:
@@ -301,6 +432,8 @@ def main() -> int:
             logger.exception(f"Unhandled error: {e}")
         print(f"{Colors.RED}[ERROR] {e}{Colors.RESET}")
         return 1
+    finally:
+        save_trace(args)
 
 
 # Entrypoint guard
@@ -0,0 +1,309 @@
+"""
+Programmatic API for embedding the SuperClaude installer
+
+The functions here never print, prompt or exit. They return plain dicts
+(JSON-serializable) with the outcome, the installer events and the messages
+the CLI would have shown, so a provisioning service can install for many
+users from one long-running process:
+
+    from SuperClaude import api
+
+    result = api.install(["core", "commands"], Path("/home/alice/.claude"),
+                         {"force": True, "optimize_core": True, "foreign_roots": ["/home"]})
+    if not result["success"]:
+        print(result["errors"])
+
+Installation directories must be inside the home directory of the calling
+process unless they are below one of options["foreign_roots"]; system
+directories are refused either way.
+
+The component registry, config files and requirement probes are loaded
+once per process and shared by all calls. Calls may come from several
+threads; installs into the same directory are serialized.
+"""
+
+import argparse
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from setup import DEFAULT_INSTALL_DIR, PROJECT_ROOT
+from setup.base.events import InstallEvent
+from setup.base.installer import Installer
+from setup.core.registry import ComponentRegistry
+from setup.core.validator import Validator
+from setup.managers.config_manager import ConfigManager
+from setup.operations.install_logic.fleet import check_target, install_fleet
+from setup.operations.install_logic.installer import build_install_config
+from setup.utils.localization import get_string
+from setup.utils.output import capture_output
+from setup.utils.security import SecurityValidator
+
+# Accepted keys of the options dict and their defaults
+DEFAULT_OPTIONS: Dict[str, Any] = {
+    "profile": None,             # profile name, used when no components are given
+    "force": False,              # ignore unmet requirements, overwrite without asking
+    "backup": True,              # back up an existing installation first
+    "dry_run": False,
+    "staged": False,             # build in a staging directory and swap on success
+    "optimize_core": False,
+    "strip_unused_docs": False,
+    "foreign_roots": [],         # directories outside the home directory that may hold targets
+}
+
+EventCallback = Callable[[str, Dict[str, Any]], None]
+
+_lock = threading.Lock()
+_registry: Optional[ComponentRegistry] = None
+_config_manager: Optional[ConfigManager] = None
+_validator: Optional[Validator] = None
+_dir_locks: Dict[Path, threading.Lock] = {}
+
+
+def _shared():
+    """Process-wide registry, config manager and validator, created on first use"""
+    global _registry, _config_manager, _validator
+    with _lock:
+        if _registry is None:
+            _registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+            _config_manager = ConfigManager(PROJECT_ROOT / "config")
+            _validator = Validator()
+        _registry.discover_components()
+        return _registry, _config_manager, _validator
+
+
+def _dir_lock(install_dir: Path) -> threading.Lock:
+    with _lock:
+        return _dir_locks.setdefault(install_dir, threading.Lock())
+
+
+def _merge_options(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    unknown = set(options or {}) - set(DEFAULT_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown install options: {', '.join(sorted(unknown))}")
+    return {**DEFAULT_OPTIONS, **(options or {})}
+
+
+def _plain(value: Any) -> Any:
+    """Event payload values as JSON-friendly types"""
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _prepare(components: Optional[List[str]], opts: Dict[str, Any], errors: List[str]):
+    """
+    Resolve components, Core selection and requirements like the install command
+
+    Returns:
+        (ordered components, core selection, args namespace), or None with
+        the reasons appended to errors
+    """
+    registry, config_manager, validator = _shared()
+
+    config_errors = config_manager.validate_config_files()
+    if config_errors:
+        errors.extend(config_errors)
+        return None
+
+    core_selection = None
+    from_profile = components is None
+    if from_profile:
+        if not opts["profile"]:
+            errors.append(get_string("api.error.no_components"))
+            return None
+        try:
+            profile = config_manager.load_profile(PROJECT_ROOT / "profiles" / f"{opts['profile']}.json")
+        except Exception as e:
+            errors.append(get_string("install.components.load_profile_error", opts["profile"], e))
+            return None
+        components = profile["components"]
+        core_selection = profile.get("core")
+
+    unknown = [name for name in components if registry.get_component_metadata(name) is None]
+    if unknown:
+        errors.append(get_string("api.error.unknown_components", ", ".join(unknown)))
+        return None
+
+    requirements = config_manager.get_requirements_for_components(components)
+    success, requirement_errors = validator.validate_component_requirements(components, requirements)
+    if not success and not opts["force"]:
+        errors.extend(requirement_errors)
+        return None
+
+    args = argparse.Namespace(
+        components=None if from_profile else list(components),
+        profile=opts["profile"],
+        quick=False,
+        force=opts["force"],
+        no_backup=not opts["backup"],
+        dry_run=opts["dry_run"],
+        staged=opts["staged"],
+        optimize_core=opts["optimize_core"],
+        strip_unused_docs=opts["strip_unused_docs"],
+        foreign_roots=[Path(root).expanduser() for root in opts["foreign_roots"]],
+        install_dir=None
+    )
+    with _lock:
+        ordered = registry.resolve_dependencies(components)
+    return ordered, core_selection, args
+
+
+def list_components() -> List[Dict[str, Any]]:
+    """
+    Installable components
+
+    Returns:
+        Metadata dicts (name, version, description, category) sorted by name
+    """
+    registry, _, _ = _shared()
+    return [dict(registry.get_component_metadata(name) or {"name": name})
+            for name in sorted(registry.list_components())]
+
+
+def install(components: Optional[List[str]] = None, install_dir: Optional[Path] = None,
+            options: Optional[Dict[str, Any]] = None,
+            on_event: Optional[EventCallback] = None) -> Dict[str, Any]:
+    """
+    Install components without any terminal I/O
+
+    Args:
+        components: Component names; dependencies are added. None installs
+            the components of options["profile"].
+        install_dir: Target directory (default: ~/.claude); must be inside
+            the home directory like for the install command, or below one
+            of options["foreign_roots"]
+        options: Overrides of DEFAULT_OPTIONS
+        on_event: Called with (event name, payload) as the install runs,
+            e.g. ("file_copied", {"component": "core", "bytes": 1234, ...})
+
+    Returns:
+        Dict with success, install_dir, components (in install order),
+        installed, failed, skipped, backup_path, dry_run, duration, errors,
+        events ([{"event": ..., **payload}]) and messages ([{"level",
+        "message"}], what the CLI would have printed)
+
+    Raises:
+        ValueError: If options contains unknown keys
+    """
+    opts = _merge_options(options)
+    install_dir = Path(install_dir or DEFAULT_INSTALL_DIR).expanduser()
+    started = time.perf_counter()
+    result: Dict[str, Any] = {
+        "success": False,
+        "install_dir": str(install_dir),
+        "components": [],
+        "installed": [],
+        "failed": [],
+        "skipped": [],
+        "backup_path": None,
+        "dry_run": opts["dry_run"],
+        "duration": 0.0,
+        "errors": [],
+        "events": [],
+        "messages": []
+    }
+
+    def collect(event: InstallEvent, data: Dict[str, Any]) -> None:
+        payload = _plain(data)
+        result["events"].append({"event": event.value, **payload})
+        if on_event is not None:
+            on_event(event.value, payload)
+
+    foreign_roots = [Path(root).expanduser() for root in opts["foreign_roots"]]
+    with capture_output() as messages, SecurityValidator.foreign_roots(foreign_roots):
+        try:
+            error = check_target(install_dir, foreign_roots)
+            prepared = None
+            if error is not None:
+                result["errors"].append(error)
+            else:
+                prepared = _prepare(components, opts, result["errors"])
+
+            if prepared is not None:
+                ordered, core_selection, args = prepared
+                args.install_dir = install_dir
+                result["components"] = ordered
+                registry, _, _ = _shared()
+
+                # The requirement checks measure free space on the parent
+                install_dir.parent.mkdir(parents=True, exist_ok=True)
+                with _dir_lock(install_dir.resolve()):
+                    with _lock:
+                        instances = registry.create_component_instances(ordered, install_dir)
+                    installer = Installer(install_dir, dry_run=opts["dry_run"], staged=opts["staged"])
+                    installer.register_components(list(instances.values()))
+                    installer.add_listener(collect)
+                    try:
+                        result["success"] = installer.install_components(
+                            ordered, build_install_config(args, ordered, core_selection))
+                    finally:
+                        installer.unregister_components()
+
+                summary = installer.get_installation_summary()
+                result["installed"] = sorted(summary["installed"])
+                result["failed"] = sorted(summary["failed"])
+                result["skipped"] = sorted(summary["skipped"])
+                result["backup_path"] = summary["backup_path"]
+                if not result["success"]:
+                    result["errors"].append(get_string("api.error.install_failed"))
+        except Exception as e:
+            result["errors"].append(get_string("install.perform.unexpected_error", e))
+
+    result["messages"] = messages
+    result["duration"] = time.perf_counter() - started
+    return result
+
+
+def install_many(targets: List[Path], components: Optional[List[str]] = None,
+                 options: Optional[Dict[str, Any]] = None,
+                 max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Install the same components into many directories concurrently
+
+    Wraps the fleet installer of `SuperClaude install --targets`, without
+    terminal I/O.
+
+    Args:
+        targets: Installation directories
+        components: Component names, or None to use options["profile"]
+        options: Overrides of DEFAULT_OPTIONS
+        max_workers: Concurrent installs (default: up to 4)
+
+    Returns:
+        Fleet summary (targets, succeeded, failed, duration, source,
+        results) plus errors and messages
+
+    Raises:
+        ValueError: If options contains unknown keys
+    """
+    opts = _merge_options(options)
+    targets = [Path(target).expanduser() for target in targets]
+    errors: List[str] = []
+    summary: Dict[str, Any] = {
+        "targets": len(targets), "succeeded": 0, "failed": len(targets),
+        "duration": 0.0, "source": None, "results": []
+    }
+
+    with capture_output() as messages:
+        try:
+            prepared = _prepare(components, opts, errors)
+            if prepared is not None:
+                ordered, core_selection, args = prepared
+                registry, _, _ = _shared()
+                with _lock:
+                    for target in targets:
+                        registry.create_component_instances(ordered, target)
+                summary = install_fleet(targets, ordered, args, registry, core_selection, max_workers)
+                errors.extend(summary["errors"])
+        except Exception as e:
+            errors.append(get_string("install.perform.unexpected_error", e))
+
+    summary["errors"] = errors
+    summary["messages"] = messages
+    return summary
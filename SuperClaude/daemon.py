@@ -0,0 +1,406 @@
+"""
+Long-running SuperClaude agent serving CLI requests over a Unix socket
+
+Frequent read-only calls (`update --check`, `diagnose_mcp`, `commands`,
+`verify`) pay for interpreter start-up, imports, registry discovery and
+external probes on every run. `SuperClaude daemon start` keeps one process
+alive that already has all of that loaded: component modules, the process
+wide config caches, cached results of version probes and of
+`claude mcp list`. The CLI forwards those operations to it when it is
+running and falls back to running them itself otherwise.
+
+Protocol: one JSON object per line in each direction.
+
+    -> {"version": 1, "argv": ["update", "--check"], "cwd": "...", "env": {...},
+        "client_version": "3.0.0", "code_fingerprint": "..."}
+    <- {"version": 1, "exit_code": 0, "output": [{"level": "INFO", "message": "..."}]}
+
+    -> {"version": 1, "command": "status"}     (or "stop")
+    <- {"version": 1, "pid": 123, "started": ..., "requests": 4, ...}
+
+Requests are handled one at a time. Each runs with the caller's working
+directory and environment, and its output is captured and sent back for the
+client to print. The socket is only accessible to the current user.
+
+The client sends a fingerprint of the source tree it would run. If the
+daemon's own tree changed since it started (`git pull`, local edits), it
+declines the request, so the client runs the current code itself, and
+restarts with the new code.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from setup import PROJECT_ROOT, __version__
+from setup.utils.cache import get_cache_root
+from setup.utils.logger import get_logger
+from setup.utils.output import capture_output
+from setup.utils.runner import MCP_LIST_TTL, VERSION_CHECK_TTL
+
+PROTOCOL_VERSION = 1
+
+# Operations forwarded to a running daemon; they must not prompt and must
+# not change anything, since they run under the daemon's process-wide
+# environment and working directory (update only with --check)
+FORWARDED_OPERATIONS = ("update", "diagnose_mcp", "commands", "verify")
+
+# Source directories and file types covered by the code fingerprint
+SOURCE_DIRS = ("setup", "SuperClaude")
+SOURCE_SUFFIXES = (".py", ".json")
+
+# Seconds to wait for the daemon to accept a connection, and for a reply
+# (verify --deep hashes every installed file)
+CONNECT_TIMEOUT = 0.5
+REPLY_TIMEOUT = 300.0
+
+# Console prefixes of the log levels, as printed by the CLI logger
+LEVEL_PREFIXES = {
+    "DEBUG": "[DEBUG]",
+    "INFO": "[INFO]",
+    "SUCCESS": "[OK]",
+    "WARNING": "[!]",
+    "ERROR": "[ERROR]",
+    "CRITICAL": "[CRITICAL]",
+}
+
+
+def is_supported() -> bool:
+    """Unix domain sockets are required"""
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_socket_path() -> Path:
+    """
+    Socket location
+
+    SUPERCLAUDE_DAEMON_SOCKET takes precedence, then XDG_RUNTIME_DIR, then
+    the SuperClaude cache directory.
+    """
+    override = os.environ.get("SUPERCLAUDE_DAEMON_SOCKET")
+    if override:
+        return Path(override).expanduser()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "superclaude.sock"
+    return get_cache_root() / "daemon.sock"
+
+
+def code_fingerprint(root: Path = PROJECT_ROOT) -> str:
+    """
+    Fingerprint of the code a process would run from this source tree
+
+    Covers path, size and modification time of the Python modules and JSON
+    data (locales, schemas) below SOURCE_DIRS, so edits, pulls and deleted
+    files all change it.
+
+    Args:
+        root: Project root
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for source_dir in SOURCE_DIRS:
+        for directory, dirnames, filenames in os.walk(root / source_dir):
+            dirnames[:] = sorted(name for name in dirnames if name != "__pycache__")
+            for filename in sorted(filenames):
+                if not filename.endswith(SOURCE_SUFFIXES):
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                relative = os.path.relpath(path, root)
+                digest.update(f"{relative}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def may_forward(argv: List[str]) -> bool:
+    """
+    Cheap pre-check on the raw arguments, before the CLI parser is built
+
+    The daemon makes the final decision with should_forward() and declines
+    anything else, in which case the CLI runs the operation itself.
+    SUPERCLAUDE_NO_DAEMON=1 disables forwarding.
+    """
+    if os.environ.get("SUPERCLAUDE_NO_DAEMON") or not is_supported():
+        return False
+    if "--trace" in argv or any(arg.startswith("--perf-profile") for arg in argv):
+        return False
+    return any(arg in FORWARDED_OPERATIONS for arg in argv)
+
+
+def should_forward(args: argparse.Namespace) -> bool:
+    """
+    Whether a parsed invocation can be served by the daemon
+
+    Only non-interactive operations are forwarded, and nothing that needs
+    the calling process (tracing, profiling).
+    """
+    operation = getattr(args, "operation", None)
+    if operation not in FORWARDED_OPERATIONS:
+        return False
+    if operation == "update" and not getattr(args, "check", False):
+        return False
+    return not (getattr(args, "trace", None) or getattr(args, "perf_profile", False))
+
+
+def _send(request: Dict[str, Any], path: Path, timeout: float) -> Optional[Dict[str, Any]]:
+    """Send one request; None if no daemon answers"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(path))
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    try:
+        reply = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(reply, dict) or reply.get("version") != PROTOCOL_VERSION:
+        return None
+    return reply
+
+
+def request_status(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Status of the running daemon, None if there is none"""
+    return _send({"version": PROTOCOL_VERSION, "command": "status"}, path or get_socket_path(), CONNECT_TIMEOUT)
+
+
+def request_stop(path: Optional[Path] = None) -> bool:
+    """Ask the running daemon to exit; False if there is none"""
+    return _send({"version": PROTOCOL_VERSION, "command": "stop"}, path or get_socket_path(),
+                 CONNECT_TIMEOUT) is not None
+
+
+def forward(argv: List[str], path: Optional[Path] = None) -> Optional[int]:
+    """
+    Run a CLI invocation in the daemon and print its output here
+
+    Args:
+        argv: Command line arguments (without the program name)
+        path: Socket path (default: get_socket_path())
+
+    Returns:
+        Exit code of the operation, or None if no compatible daemon is
+        running or it declined the request (the caller then runs the
+        operation itself)
+    """
+    if not may_forward(argv):
+        return None
+    path = path or get_socket_path()
+    if not path.exists():
+        return None
+    reply = _send({
+        "version": PROTOCOL_VERSION,
+        "client_version": __version__,
+        "code_fingerprint": code_fingerprint(),
+        "argv": list(argv),
+        "cwd": os.getcwd(),
+        "env": dict(os.environ)
+    }, path, REPLY_TIMEOUT)
+    if reply is None or "exit_code" not in reply:
+        return None
+
+    for message in reply.get("output", []):
+        prefix = LEVEL_PREFIXES.get(message.get("level"))
+        text = message.get("message", "")
+        print(f"{prefix} {text}" if prefix else text)
+    return reply["exit_code"]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            if not isinstance(request, dict):
+                raise ValueError("request must be an object")
+        except ValueError as e:
+            reply = {"error": f"invalid request: {e}"}
+        else:
+            reply = self.server.handle_request_data(request)
+        reply["version"] = PROTOCOL_VERSION
+        try:
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serves CLI requests with the parser and operations of the hub"""
+
+    def __init__(self, path: Path, parser: argparse.ArgumentParser,
+                 operations: Dict[str, Callable[[argparse.Namespace], int]],
+                 prepare: Callable[[argparse.Namespace], None]):
+        """
+        Initialize server and bind the socket
+
+        Args:
+            path: Socket path; a stale socket file is replaced
+            parser: CLI parser with all operation subparsers registered
+            operations: Operation name to run function
+            prepare: Called with the parsed args before running an
+                operation (logging setup, as in the CLI)
+
+        Raises:
+            RuntimeError: If another daemon is already listening on path
+            OSError: If the socket cannot be created
+        """
+        if request_status(path) is not None:
+            raise RuntimeError(f"A SuperClaude daemon is already listening on {path}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+        self.path = path
+        self.parser = parser
+        self.operations = operations
+        self.prepare = prepare
+        self.started = time.time()
+        self.requests = 0
+        # Source tree this process loaded its code from
+        self.fingerprint = code_fingerprint()
+        self.restart_requested = False
+        self._stopping = False
+
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def handle_request_data(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one decoded request"""
+        command = request.get("command", "run")
+        if command == "status":
+            return self.status()
+        if command == "stop":
+            self._stopping = True
+            return {"stopping": True}
+        if command != "run" or not isinstance(request.get("argv"), list):
+            return {"error": f"unknown command: {command}"}
+        if (request.get("client_version") != __version__
+                or request.get("code_fingerprint") != self.fingerprint):
+            if code_fingerprint() != self.fingerprint:
+                # The source tree changed under this process: restart with the new code
+                self.restart_requested = True
+                self._stopping = True
+            # Let the client run its own version of the code
+            return {"error": f"code mismatch (daemon {__version__})"}
+
+        self.requests += 1
+        return self.run_cli(request["argv"], request.get("cwd"), request.get("env"))
+
+    def run_cli(self, argv: List[str], cwd: Optional[str], env: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Run an operation with the caller's directory and environment
+
+        Returns:
+            Reply with exit_code and the captured output, or with only an
+            error if the invocation is not one the daemon serves
+        """
+        saved_cwd = os.getcwd()
+        saved_env = dict(os.environ)
+        exit_code = 1
+        with capture_output() as output:
+            try:
+                if env is not None:
+                    os.environ.clear()
+                    os.environ.update(env)
+                if cwd:
+                    os.chdir(cwd)
+                try:
+                    args = self.parser.parse_args(argv)
+                except SystemExit as e:
+                    # argparse errors and --help
+                    return {"exit_code": e.code if isinstance(e.code, int) else 1, "output": output}
+
+                run_func = self.operations.get(getattr(args, "operation", None))
+                if run_func is None or not should_forward(args):
+                    return {"error": f"not served by the daemon: {' '.join(argv)}"}
+                self.prepare(args)
+                exit_code = run_func(args)
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                # Traceback to the log file; the message stays in the output
+                get_logger().exception(f"Unhandled error: {e}")
+            finally:
+                os.chdir(saved_cwd)
+                os.environ.clear()
+                os.environ.update(saved_env)
+        return {"exit_code": exit_code, "output": output}
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "daemon_version": __version__,
+            "code_fingerprint": self.fingerprint,
+            "socket": str(self.path),
+            "started": self.started,
+            "uptime": time.time() - self.started,
+            "requests": self.requests
+        }
+
+    def serve(self) -> None:
+        """Handle requests until a stop request arrives"""
+        while not self._stopping:
+            self.handle_request()
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def restart(path: Path) -> None:
+    """
+    Replace this process with a freshly started daemon on the same socket
+
+    Called after the server was closed because the source tree changed.
+    Never returns.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execv(sys.executable, [sys.executable, "-m", "SuperClaude", "daemon", "start", "--socket", str(path)])
+
+
+def warm_up() -> None:
+    """
+    Load what the forwarded operations need and switch on result caching
+
+    Version probes and `claude mcp list` results are reused for the TTLs of
+    setup.utils.runner, so servers added with `add_mcp` (run by the CLI
+    itself) show up in forwarded checks after at most MCP_LIST_TTL.
+    """
+    from setup.core.registry import ComponentRegistry
+    from setup.managers.config_manager import ConfigManager
+    from .mcp_diagnostics import MCPDiagnostics
+    from .mcp_manager import MCPManager
+
+    MCPManager.list_cache_ttl = MCP_LIST_TTL
+    MCPDiagnostics.probe_cache_ttl = VERSION_CHECK_TTL
+    MCPDiagnostics.list_cache_ttl = MCP_LIST_TTL
+
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+    registry.discover_components()
+    for name in registry.list_components():
+        registry.get_component_class(name)
+    ConfigManager(PROJECT_ROOT / "config").validate_config_files()
@@ -3,15 +3,22 @@ import sys
 import json
 import os
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from setup.utils.logger import get_logger
+from setup.utils.runner import run_command, start_command
+from setup.utils.trace import trace_span
 from setup.utils.ui import display_info, display_error, display_warning
 
 
 class MCPDiagnostics:
     """Runs a series of checks to diagnose MCP server issues."""
 
+    # Seconds version probes and `claude mcp list` results are reused; None
+    # runs them every time. The daemon enables this. Liveness tests always run.
+    probe_cache_ttl: Optional[float] = None
+    list_cache_ttl: Optional[float] = None
+
     def __init__(self) -> None:
         """Initialize the diagnostics tool."""
         # To avoid circular imports we load the registry directly
@@ -50,8 +57,8 @@ class MCPDiagnostics:
     def _check_command(self, command: str) -> None:
         """Helper to check for a command and its version."""
         try:
-            result = subprocess.run(
-                [command, "--version"],
+            result = run_command(
+                [command, "--version"], cache_ttl=self.probe_cache_ttl,
                 capture_output=True, text=True, timeout=5, check=True, shell=(sys.platform == "win32")
             )
             version = result.stdout.strip()
@@ -88,8 +95,8 @@ class MCPDiagnostics:
 
         # Get installed servers from `claude mcp list`
         try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"],
+            result = run_command(
+                ["claude", "mcp", "list"], cache_ttl=self.list_cache_ttl,
                 capture_output=True, text=True, timeout=10, check=True, shell=(sys.platform == "win32")
             )
             installed_servers = result.stdout.strip().splitlines()
@@ -136,15 +143,16 @@ class MCPDiagnostics:
                 init_payload = '{"jsonrpc":"2.0","method":"initialize","params":{"protocolVersion":"2024-11-05","clientInfo":{"name":"SuperClaudeDiagnostics","version":"1.0.0"},"capabilities":{}},"id":1}'
 
                 # Use Popen to pipe the payload to the server's stdin
-                process = subprocess.Popen(
-                    command_to_run,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    shell=(sys.platform == "win32")
-                )
-                stdout, stderr = process.communicate(input=init_payload, timeout=15)
+                with trace_span(f"liveness {server_name}", "subprocess", cmd=command_to_run):
+                    process = start_command(
+                        command_to_run,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        shell=(sys.platform == "win32")
+                    )
+                    stdout, stderr = process.communicate(input=init_payload, timeout=15)
 
                 if process.returncode == 0 and '"result"' in stdout:
                     display_info(f"    ✅ Liveness check PASSED for '{server_name}'.")
@@ -6,10 +6,16 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 
+from setup.utils.runner import run_command
+
 
 class MCPManager:
     """Manages MCP server installations."""
 
+    # Seconds a `claude mcp list` result is reused; None runs it every time.
+    # The daemon enables this, `claude mcp add` drops cached results.
+    list_cache_ttl: Optional[float] = None
+
     def __init__(self, registry_path: str = None):
         """Initialize the MCPManager."""
         self.logger = logging.getLogger("SuperClaude.MCPManager")
@@ -42,8 +48,8 @@ class MCPManager:
     def _check_mcp_server_installed(self, server_name: str) -> bool:
         """Check if an MCP server is already installed via 'claude mcp list'."""
         try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"],
+            result = run_command(
+                ["claude", "mcp", "list"], cache_ttl=self.list_cache_ttl,
                 capture_output=True, text=True, timeout=15, shell=(sys.platform == "win32")
             )
             return result.returncode == 0 and server_name.lower() in result.stdout.lower()
@@ -82,7 +88,7 @@ class MCPManager:
         try:
             # Note: This assumes 'claude' CLI and 'npx' are in the system's PATH.
             cmd = ["claude", "mcp", "add", "-s", "user", "--", server_name, "npx", "-y", npm_package]
-            result = subprocess.run(
+            result = run_command(
                 cmd,
                 capture_output=True, text=True, timeout=180, shell=(sys.platform == "win32")
             )
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Throughput of file hashing at different file counts and sizes
+
+Compares the former FileManager.get_file_hash (SHA-256, 8 KB reads, one
+file at a time) with the hashing service: single-threaded reads, batches
+on a thread pool, and batches answered from a warm digest cache.
+
+Usage:
+    python benchmarks/bench_hashing.py [scale]
+
+scale multiplies the number of files of every case (default 1).
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.utils.hashing import HashCache, HashService, hash_file  # noqa: E402
+
+# (label, number of files, bytes per file)
+CASES = [
+    ("many small", 2000, 4 * 1024),
+    ("medium", 200, 256 * 1024),
+    ("few large", 12, 16 * 1024 * 1024),
+]
+
+
+def legacy_hash(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(8192), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def make_files(directory: Path, count: int, size: int) -> list:
+    paths = []
+    block = os.urandom(min(size, 1024 * 1024))
+    past = time.time() - 60
+    for i in range(count):
+        path = directory / f"file{i:05d}.bin"
+        with open(path, "wb") as f:
+            written = 0
+            while written < size:
+                chunk = block[:size - written]
+                f.write(chunk)
+                written += len(chunk)
+        # Old enough to be cached
+        os.utime(path, (past, past))
+        paths.append(path)
+    return paths
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    scale = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+
+    # Thread pools only pay off with several cores; SHA-256 is hardware
+    # accelerated on CPUs with SHA extensions and can beat BLAKE2b there
+    print(f"{os.cpu_count()} CPUs, hashing threads: {HashService().max_workers}")
+    print(f"{'case':<12} {'files':>6} {'size':>8}  {'method':<26} {'seconds':>8} {'MB/s':>9} {'files/s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, count, size in CASES:
+            count = max(1, int(count * scale))
+            directory = Path(tmp) / label.replace(" ", "_")
+            directory.mkdir()
+            paths = make_files(directory, count, size)
+            total_mb = count * size / (1024 * 1024)
+
+            cache_file = Path(tmp) / f"{directory.name}-cache.json"
+            warm = HashService(cache=HashCache(cache_file))
+            warm.hash_files(paths)
+
+            methods = [
+                ("sha256 8KB, 1 thread", lambda: [legacy_hash(path) for path in paths]),
+                ("blake2b, 1 thread", lambda: [hash_file(path) for path in paths]),
+                ("blake2b batch, no cache", lambda: HashService().hash_files(paths, use_cache=False)),
+                ("blake2b batch, warm cache", lambda: HashService(cache=HashCache(cache_file)).hash_files(paths)),
+            ]
+            for name, func in methods:
+                seconds = timed(func)
+                print(f"{label:<12} {count:>6} {size // 1024:>6}KB  {name:<26} {seconds:>8.3f} "
+                      f"{total_mb / seconds:>9.1f} {count / seconds:>10.0f}")
+            print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
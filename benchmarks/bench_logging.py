@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Cost of debug logging: eager get_string versus LazyMessage
+
+Simulates the per-file debug lines of a large install (two per copied file)
+in two configurations:
+
+- default: console at INFO, log file at DEBUG, as set up by
+  `SuperClaude <operation>` without --verbose. Debug records are written to
+  the log file, so every LazyMessage is still resolved, on the log writer
+  thread instead of the caller's.
+- file at INFO: debug records are filtered everywhere; only here does
+  LazyMessage skip the formatting altogether.
+
+"calls" is the time spent in the logging calls, "total" adds draining the
+log writer queue on close.
+
+Usage:
+    python benchmarks/bench_logging.py [files]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.utils.localization import get_string, set_language  # noqa: E402
+from setup.utils.logger import Logger, LogLevel  # noqa: E402
+from setup.utils.output import capture_output  # noqa: E402
+
+CONFIGURATIONS = [
+    ("default", LogLevel.INFO, LogLevel.DEBUG),
+    ("file at INFO", LogLevel.INFO, LogLevel.INFO),
+]
+
+
+def run(logger: Logger, files: int, lazy: bool) -> float:
+    target = Path("/home/user/.claude/commands/sc")
+    start = time.perf_counter()
+    for i in range(files):
+        name = f"command_{i}.md"
+        if lazy:
+            logger.debug(logger.lazy("component.install.copying", name, target))
+            logger.debug(logger.lazy("component.install.copy_success", name))
+        else:
+            logger.debug(get_string("component.install.copying", name, target))
+            logger.debug(get_string("component.install.copy_success", name))
+    return time.perf_counter() - start
+
+
+def measure(console_level: LogLevel, file_level: LogLevel, files: int, lazy: bool):
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = Logger(f"bench_logging_{'lazy' if lazy else 'eager'}", Path(log_dir), console_level, file_level)
+        calls = run(logger, files, lazy)
+        start = time.perf_counter()
+        # close() prints a session summary
+        with capture_output():
+            logger.close()
+        return calls, calls + time.perf_counter() - start
+
+
+def main() -> int:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    set_language("ja")
+
+    calls = files * 2
+    print(f"{calls} debug calls")
+    print(f"{'configuration':<14} {'method':<17} {'calls us/call':>14} {'total us/call':>14}")
+    for label, console_level, file_level in CONFIGURATIONS:
+        for method, lazy in (("eager get_string", False), ("LazyMessage", True)):
+            in_calls, total = measure(console_level, file_level, files, lazy)
+            print(f"{label:<14} {method:<17} {in_calls * 1e6 / calls:>14.2f} {total * 1e6 / calls:>14.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
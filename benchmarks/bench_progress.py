@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Per-event overhead of ProgressBar.update
+
+Feeds a bar one update per simulated file copy, the way installer events do,
+and reports the cost per call for a terminal and a non-terminal stream.
+
+Usage:
+    python benchmarks/bench_progress.py [events]
+"""
+
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.utils.ui import ProgressBar  # noqa: E402
+
+
+class TTYStream(io.StringIO):
+    """In-memory stream that claims to be a terminal"""
+
+    def isatty(self) -> bool:
+        return True
+
+
+def run(events: int, stream, max_refresh_hz: float) -> dict:
+    bar = ProgressBar(total=events, prefix="Installing: ", stream=stream, max_refresh_hz=max_refresh_hz)
+    start = time.perf_counter()
+    for i in range(1, events + 1):
+        bar.update(i, "core")
+    elapsed = time.perf_counter() - start
+    return {
+        "per_event_us": elapsed / events * 1e6,
+        "renders": bar.render_count,
+        "bytes_written": len(stream.getvalue()),
+    }
+
+
+def main() -> int:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    cases = [
+        ("tty, unthrottled", TTYStream, 0),
+        ("tty, 10 Hz", TTYStream, 10.0),
+        ("pipe, 10 Hz", io.StringIO, 10.0),
+    ]
+
+    print(f"{events} update() calls per case")
+    print(f"{'case':<20} {'us/event':>10} {'renders':>10} {'bytes':>12}")
+    for name, stream_cls, hz in cases:
+        result = run(events, stream_cls(), hz)
+        print(f"{name:<20} {result['per_event_us']:>10.2f} {result['renders']:>10} {result['bytes_written']:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """Base classes for SuperClaude installation system"""
 
 from .component import Component
+from .events import InstallEvent, EventEmitter
 from .installer import Installer
 
-__all__ = ['Component', 'Installer']
\ No newline at end of file
+__all__ = ['Component', 'Installer', 'InstallEvent', 'EventEmitter']
\ No newline at end of file
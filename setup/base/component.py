@@ -3,17 +3,19 @@ Abstract base class for installable components
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import List, Dict, Tuple, Optional, Any
 from pathlib import Path
 import json
+from .events import EventEmitter, InstallEvent
 from ..managers.file_manager import FileManager
 from ..managers.settings_manager import SettingsManager
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, current_span
 from ..utils.security import SecurityValidator
 from ..utils.localization import get_string
 
 
-class Component(ABC):
+class Component(EventEmitter, ABC):
     """Base class for all installable components"""
     
     def __init__(self, install_dir: Optional[Path] = None, component_subdir: Path = Path('')):
@@ -22,14 +24,39 @@ class Component(ABC):
         
         Args:
             install_dir: Target installation directory (defaults to ~/.claude)
+            component_subdir: Subdirectory of install_dir that receives the component files
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
-        self.settings_manager = SettingsManager(self.install_dir)
+        self.component_subdir = component_subdir
         self.logger = get_logger()
-        self.component_files = self._discover_component_files()
         self.file_manager = FileManager()
         self.install_component_subdir = self.install_dir / component_subdir
+
+    @cached_property
+    def settings_manager(self) -> SettingsManager:
+        """Settings manager for the current installation directory (created on first use)"""
+        return SettingsManager(self.install_dir)
+
+    @cached_property
+    def component_files(self) -> List[str]:
+        """Files shipped by this component (source directory scanned on first use)"""
+        return self._discover_component_files()
+
+    def set_install_dir(self, install_dir: Path) -> None:
+        """
+        Point the component at a different installation directory
+
+        Used by staged installs, which build the new tree in a sibling
+        directory and swap it into place afterwards.
+
+        Args:
+            install_dir: New target installation directory
+        """
+        self.install_dir = install_dir
+        self.install_component_subdir = install_dir / self.component_subdir
+        # Recreated for the new directory on next use
+        self.__dict__.pop('settings_manager', None)
     
     @abstractmethod
     def get_metadata(self) -> Dict[str, str]:
@@ -126,13 +153,78 @@ class Component(ABC):
         # Return empty dict as we don't modify Claude Code settings
         return {}
     
-    def install(self, config: Dict[str, Any]) -> bool:
+    def copy_file(self, source: Path, target: Path) -> bool:
+        """
+        Copy a single file and report it to event listeners and the open span
+
+        Args:
+            source: Source file path
+            target: Target file path
+
+        Returns:
+            True if the file was copied
+        """
+        if not self.file_manager.copy_file(source, target):
+            return False
+
         try:
-            return self._install(config)
-        except Exception as e:
-            self.logger.exception(get_string("component.install.unexpected_error", repr(self), e))
+            size = source.stat().st_size
+        except OSError:
+            size = 0
+        self.emit(InstallEvent.FILE_COPIED, component=self.get_metadata()['name'],
+                  source=source, target=target, bytes=size)
+        span = current_span()
+        if span is not None:
+            span.add_bytes(size)
+        return True
+
+    def write_file(self, source: Path, target: Path, content: str) -> bool:
+        """
+        Install generated content in place of a source file
+
+        Reported to event listeners and the open span like copy_file.
+
+        Args:
+            source: Source file the content was generated from
+            target: Target file path
+            content: Content to write
+
+        Returns:
+            True if the file was written
+        """
+        if not self.file_manager.write_text(target, content):
             return False
 
+        size = len(content.encode("utf-8"))
+        self.emit(InstallEvent.FILE_COPIED, component=self.get_metadata()['name'],
+                  source=source, target=target, bytes=size)
+        span = current_span()
+        if span is not None:
+            span.add_bytes(size)
+        return True
+
+    def install(self, config: Dict[str, Any]) -> bool:
+        with self.logger.span("install.component", component=self.get_metadata()['name']) as span:
+            try:
+                success = self._install(config)
+                if success:
+                    self._record_installed_files()
+            except Exception as e:
+                self.logger.exception(get_string("component.install.unexpected_error", repr(self), e))
+                success = False
+            if not success:
+                span.set_outcome("failed")
+            return success
+
+    def _record_installed_files(self) -> None:
+        """Remember the hashes of the installed files for later update plans"""
+        from ..core.update_plan import record_installed_files
+        try:
+            record_installed_files(self)
+        except (OSError, ValueError) as e:
+            # Only update planning loses precision without the manifest
+            self.logger.warning(get_string("component.install.manifest_error", e))
+
     @abstractmethod
     def _install(self, config: Dict[str, Any]) -> bool:
         """
@@ -156,14 +248,16 @@ class Component(ABC):
 
         # Copy framework files
         success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(get_string("component.install.copying", source.name, target))
+        with self.logger.span("install.files", files=len(files_to_install)) as batch:
+            for source, target in files_to_install:
+                self.logger.debug(self.logger.lazy("component.install.copying", source.name, target))
 
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(get_string("component.install.copy_success", source.name))
-            else:
-                self.logger.error(get_string("component.install.copy_failed", source.name))
+                if self.copy_file(source, target):
+                    success_count += 1
+                    self.logger.debug(self.logger.lazy("component.install.copy_success", source.name))
+                else:
+                    self.logger.error(get_string("component.install.copy_failed", source.name))
+            batch.set(copied=success_count)
 
         if success_count != len(files_to_install):
             self.logger.error(get_string("component.install.copy_summary_error", success_count, len(files_to_install)))
@@ -199,26 +293,131 @@ class Component(ABC):
         """
         pass
 
+    def has_user_global_effects(self) -> bool:
+        """
+        Whether installing changes state of the invoking user rather than
+        only files below install_dir
+
+        Such components cannot be installed once per directory for many
+        targets (fleet installs): every run would change the same user's
+        configuration.
+        """
+        return False
+
     @abstractmethod
     def _get_source_dir(self) -> Optional[Path]:
         """Get source directory for component files"""
         pass
     
+    def get_source_hashes(self) -> Dict[Path, Optional[str]]:
+        """
+        Hashes of the content an install would write
+
+        Returns:
+            Target path -> hash of the content for that target, None if the
+            source cannot be read
+        """
+        files = self.get_files_to_install()
+        hashes = self.file_manager.hash_files([source for source, _ in files])
+        return {target: hashes[source] for source, target in files}
+
+    def plan_update(self) -> Optional[Dict[str, Any]]:
+        """
+        Compare the installed files with the source, file by file
+
+        Returns:
+            Update plan (see setup.core.update_plan.plan_component_update),
+            or None for components whose files are not tracked
+        """
+        from ..core.update_plan import plan_component_update
+        return plan_component_update(self)
+
     def update(self, config: Dict[str, Any]) -> bool:
         """
-        Update component (default: uninstall then install)
-        
+        Update component by applying its update plan
+
+        Only files that were added, changed or removed since the installation
+        are written; files edited locally are backed up before they are
+        replaced.
+
         Args:
             config: Installation configuration
-            
+
         Returns:
             True if successful, False otherwise
         """
-        # Default implementation: uninstall and reinstall
-        if self.uninstall():
-            return self.install(config)
-        return False
-    
+        with self.logger.span("update.component", component=self.get_metadata()['name']) as span:
+            try:
+                plan = self.plan_update()
+                success = self._apply_update_plan(plan, config)
+                if success:
+                    self._record_installed_files()
+            except Exception as e:
+                self.logger.exception(get_string("component.update.unexpected_error", repr(self), e))
+                success = False
+            if not success:
+                span.set_outcome("failed")
+            else:
+                span.set(**{action: count for action, count in plan["counts"].items()})
+            return success
+
+    def _apply_update_plan(self, plan: Dict[str, Any], config: Dict[str, Any]) -> bool:
+        """
+        Write and remove the files of an update plan
+
+        Args:
+            plan: Plan returned by plan_update()
+            config: Installation configuration
+
+        Returns:
+            True if successful, False otherwise
+        """
+        from ..core.update_plan import ADD, DELETE, MODIFY, UNCHANGED, changed_files, has_changes
+
+        for source in plan["errors"]:
+            self.logger.error(get_string("component.update.source_unreadable", source))
+        if plan["errors"]:
+            return False
+
+        counts = plan["counts"]
+        if not has_changes(plan) and plan["current"] == plan["available"]:
+            self.logger.info(get_string("component.update.up_to_date", repr(self), plan["available"]))
+            return True
+
+        success, errors = self.validate_prerequisites()
+        if not success:
+            for error in errors:
+                self.logger.error(error)
+            return False
+
+        failed = 0
+        for entry in changed_files(plan):
+            target = entry["target"]
+            if entry["local_edit"]:
+                backup_path = self.file_manager.backup_file(target)
+                self.logger.warning(get_string("component.update.local_edit", entry["path"], backup_path))
+
+            if entry["action"] == DELETE:
+                done = self.file_manager.remove_file(target)
+            else:
+                done = self._write_update_file(entry["source"], target)
+            if done:
+                self.logger.debug(self.logger.lazy("component.update.applied_file", entry["action"], entry["path"]))
+            else:
+                self.logger.error(get_string("component.update.file_failed", entry["action"], entry["path"]))
+                failed += 1
+
+        if failed:
+            return False
+
+        self.logger.success(get_string("component.update.success", repr(self), counts[ADD], counts[MODIFY],
+                                       counts[DELETE], counts[UNCHANGED]))
+        return self._post_install()
+
+    def _write_update_file(self, source: Path, target: Path) -> bool:
+        """Install one added or modified file of an update plan"""
+        return self.copy_file(source, target)
+
     def get_installed_version(self) -> Optional[str]:
         """
         Get currently installed version of component
@@ -252,16 +451,14 @@ class Component(ABC):
     def validate_installation(self) -> Tuple[bool, List[str]]:
         """
         Validate that component is correctly installed
+
+        Files are checked against the install manifest by size and
+        modification time (see setup.core.integrity).
         
         Returns:
             Tuple of (success: bool, error_messages: List[str])
         """
-        errors = []
-        
-        # Check if all files exist
-        for _, target in self.get_files_to_install():
-            if not target.exists():
-                errors.append(get_string("component.validate.missing_file", target))
+        errors = self.integrity_errors()
         
         # Check version in settings
         if not self.get_installed_version():
@@ -269,6 +466,23 @@ class Component(ABC):
         
         return len(errors) == 0, errors
     
+    def integrity_errors(self, deep: bool = False) -> List[str]:
+        """
+        Compare the installed files with the manifest recorded at install time
+
+        Args:
+            deep: Hash the files instead of comparing size and modification time
+
+        Returns:
+            Error messages for missing and modified files
+        """
+        from ..core.integrity import scan_components
+
+        report = scan_components([self], deep)[self.get_metadata()['name']]
+        errors = [get_string("component.validate.missing_file", path) for path in report["missing"]]
+        errors.extend(get_string("component.validate.modified_file", path) for path in report["modified"])
+        return errors
+
     def get_size_estimate(self) -> int:
         """
         Estimate installed size in bytes
@@ -339,9 +553,9 @@ class Component(ABC):
             # Sort for consistent ordering
             files.sort()
 
-            self.logger.debug(get_string("component.discover.discovered_files", len(files), extension, directory))
+            self.logger.debug(self.logger.lazy("component.discover.discovered_files", len(files), extension, directory))
             if files:
-                self.logger.debug(get_string("component.discover.files_found", files))
+                self.logger.debug(self.logger.lazy("component.discover.files_found", files))
 
             return files
 
@@ -0,0 +1,68 @@
+"""
+Installation progress events shared by installers and components
+"""
+
+from enum import Enum
+from typing import Any, Callable, Dict, List
+
+
+class InstallEvent(Enum):
+    """Events emitted while components are installed, updated or removed"""
+    INSTALL_START = "install_start"          # components, sizes, total_bytes
+    COMPONENT_START = "component_start"      # component, total_bytes
+    FILE_COPIED = "file_copied"              # component, source, target, bytes
+    COMPONENT_FINISH = "component_finish"    # component, success
+    INSTALL_FINISH = "install_finish"        # success
+
+
+EventListener = Callable[[InstallEvent, Dict[str, Any]], None]
+
+
+class EventEmitter:
+    """Minimal listener registry mixed into Installer and Component"""
+
+    def _get_listeners(self) -> List[EventListener]:
+        # Created lazily so subclasses don't have to call a mixin __init__
+        listeners = self.__dict__.get('_event_listeners')
+        if listeners is None:
+            listeners = self.__dict__['_event_listeners'] = []
+        return listeners
+
+    def add_listener(self, listener: EventListener) -> None:
+        """
+        Subscribe to events
+
+        Args:
+            listener: Callable receiving (event, data)
+        """
+        listeners = self._get_listeners()
+        if listener not in listeners:
+            listeners.append(listener)
+
+    def remove_listener(self, listener: EventListener) -> None:
+        """
+        Unsubscribe from events
+
+        Args:
+            listener: Previously added callable
+        """
+        listeners = self._get_listeners()
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def emit(self, event: InstallEvent, **data: Any) -> None:
+        """
+        Notify all listeners
+
+        A failing listener must never break an installation, so errors
+        raised by listeners are swallowed.
+
+        Args:
+            event: Event being reported
+            **data: Event payload
+        """
+        for listener in list(self._get_listeners()):
+            try:
+                listener(event, data)
+            except Exception:
+                pass
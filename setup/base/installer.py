@@ -4,30 +4,45 @@ Base installer logic for SuperClaude installation system fixed some issues
 
 from typing import List, Dict, Optional, Set, Tuple, Any
 from pathlib import Path
+import os
 import shutil
 import tempfile
 from datetime import datetime
 from .component import Component
+from .events import EventEmitter, InstallEvent
+from ..core.dependency import DependencyGraph
+from ..managers.settings_manager import SettingsManager
 from ..utils.localization import get_string
+from ..utils.trace import traced
 
 
-class Installer:
+class Installer(EventEmitter):
     """Main installer orchestrator"""
 
     def __init__(self,
                  install_dir: Optional[Path] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 staged: bool = False):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            staged: If True, build the components' files in a sibling staging
+                directory and swap them into place only after every component
+                installed and validated
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
+        self.staged = staged
+        self.staging_dir: Optional[Path] = None
+        # Owned files copied into the staging directory, relative to install_dir
+        self._seeded_paths: List[Path] = []
+        self._size_estimates: Dict[str, int] = {}
         self.components: Dict[str, Component] = {}
+        self._dependency_graph: Optional[DependencyGraph] = None
         self.installed_components: Set[str] = set()
         self.updated_components: Set[str] = set()
 
@@ -44,6 +59,20 @@ class Installer:
         """
         metadata = component.get_metadata()
         self.components[metadata['name']] = component
+        self._dependency_graph = None
+        # Re-publish component events (file copies) to installer listeners
+        component.add_listener(self._forward_event)
+
+    def _forward_event(self, event: InstallEvent, data: Dict[str, Any]) -> None:
+        """Relay an event raised by a registered component"""
+        self.emit(event, **data)
+
+    def _estimate_bytes(self, component_name: str) -> int:
+        """Best-effort size of a component's payload, 0 if unknown"""
+        try:
+            return self.components[component_name].get_size_estimate()
+        except Exception:
+            return 0
 
     def register_components(self, components: List[Component]) -> None:
         """
@@ -55,6 +84,16 @@ class Installer:
         for component in components:
             self.register_component(component)
 
+    def unregister_components(self) -> None:
+        """
+        Stop relaying events of the registered components
+
+        Components are pooled by the registry and outlive the installer;
+        long-running callers detach them once the installation is done.
+        """
+        for component in self.components.values():
+            component.remove_listener(self._forward_event)
+
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
         Resolve component dependencies in correct installation order
@@ -68,33 +107,13 @@ class Installer:
         Raises:
             ValueError: If circular dependencies detected or unknown component
         """
-        resolved = []
-        resolving = set()
-
-        def resolve(name: str):
-            if name in resolved:
-                return
-
-            if name in resolving:
-                raise ValueError(get_string("installer.dep.circular_dependency", name))
-
-            if name not in self.components:
-                raise ValueError(get_string("installer.dep.unknown_component", name))
-
-            resolving.add(name)
-
-            # Resolve dependencies first
-            for dep in self.components[name].get_dependencies():
-                resolve(dep)
-
-            resolving.remove(name)
-            resolved.append(name)
-
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
+        if self._dependency_graph is None:
+            self._dependency_graph = DependencyGraph({
+                name: component.get_dependencies() for name, component in self.components.items()
+            })
 
-        return resolved
+        order, _ = self._dependency_graph.resolve(component_names)
+        return order
 
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
@@ -125,6 +144,7 @@ class Installer:
 
         return len(errors) == 0, errors
 
+    @traced("installer.backup", "backup")
     def create_backup(self) -> Optional[Path]:
         """
         Create backup of existing installation
@@ -199,6 +219,18 @@ class Installer:
         if component_name in self.installed_components:
             return True
 
+        total_bytes = self._size_estimates.get(component_name)
+        if total_bytes is None:
+            total_bytes = self._estimate_bytes(component_name)
+        self.emit(InstallEvent.COMPONENT_START, component=component_name, total_bytes=total_bytes)
+        success = self._install_component(component_name, component, config)
+        self.emit(InstallEvent.COMPONENT_FINISH, component=component_name, success=success)
+        return success
+
+    def _install_component(self, component_name: str, component: Component,
+                           config: Dict[str, Any]) -> bool:
+        """Prerequisite check and install step of install_component"""
+
         # Check prerequisites
         success, errors = component.validate_prerequisites()
         if not success:
@@ -213,6 +245,9 @@ class Installer:
             if self.dry_run:
                 print(get_string("installer.component.dry_run", component_name))
                 success = True
+            elif config.get("update_mode"):
+                # Apply only the files that differ from the source
+                success = component.update(config)
             else:
                 success = component.install(config)
 
@@ -259,11 +294,23 @@ class Installer:
                 print(f"  - {error}")
             return False
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        # Staged installs replace the full backup: the live tree is never touched
+        if self.staged and not self.dry_run:
+            try:
+                self._prepare_staging()
+            except OSError as e:
+                print(get_string("installer.staging.prepare_error", e))
+                self._discard_staging()
+                return False
+        elif self.install_dir.exists() and not self.dry_run:
             print(get_string("installer.backup.creating"))
             self.create_backup()
 
+        self._size_estimates = {name: self._estimate_bytes(name) for name in ordered_names}
+        self.emit(InstallEvent.INSTALL_START, components=ordered_names,
+                  sizes=dict(self._size_estimates),
+                  total_bytes=sum(self._size_estimates.values()))
+
         # Install each component
         all_success = True
         for name in ordered_names:
@@ -272,13 +319,175 @@ class Installer:
                 all_success = False
                 # Continue installing other components even if one fails
 
+        all_valid = True
         if not self.dry_run:
-            self._run_post_install_validation()
+            all_valid = self._run_post_install_validation()
+
+        if self.staging_dir is not None:
+            if all_success and all_valid:
+                all_success = self._commit_staging()
+            else:
+                self._discard_staging()
+                all_success = False
 
+        self.emit(InstallEvent.INSTALL_FINISH, success=all_success)
         return all_success
 
-    def _run_post_install_validation(self) -> None:
-        """Run post-installation validation for all installed components"""
+    @traced("installer.staging.prepare", "install")
+    def _prepare_staging(self) -> Path:
+        """
+        Create the staging directory next to install_dir and retarget components
+
+        Only the paths the components own are staged: the files they install,
+        the files recorded in their manifests and the metadata and settings
+        files. Everything else in install_dir (Claude Code's own data, user
+        files) is never copied or touched. The staging directory lives in the
+        same parent directory so each file is swapped in with a rename on one
+        filesystem rather than a copy.
+
+        Returns:
+            Path to the staging directory
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        staging_dir = self.install_dir.parent / f".{self.install_dir.name}.staging-{timestamp}-{os.getpid()}"
+        print(get_string("installer.staging.preparing", staging_dir))
+
+        # Track it before copying so a failed copy is still cleaned up
+        self.staging_dir = staging_dir
+        self._seeded_paths = []
+        staging_dir.mkdir(parents=True)
+
+        # Seed with the current owned files so updates see what is installed
+        # and registrations of components that are not part of this run survive
+        for relative in self._owned_paths():
+            live = self.install_dir / relative
+            if not live.is_file():
+                continue
+            staged = staging_dir / relative
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(live, staged, follow_symlinks=False)
+            self._seeded_paths.append(relative)
+
+        for component in self.components.values():
+            component.set_install_dir(staging_dir)
+
+        return staging_dir
+
+    def _owned_paths(self) -> List[Path]:
+        """
+        Paths below install_dir that the registered components own
+
+        Returns:
+            Sorted relative paths of installed, recorded and metadata files
+        """
+        from ..core.update_plan import MANIFEST_KEY
+
+        settings_manager = SettingsManager(self.install_dir)
+        targets: Set[Path] = {settings_manager.metadata_file, settings_manager.settings_file}
+        try:
+            installed = settings_manager.get_installed_components()
+        except ValueError:
+            installed = {}
+        for registration in installed.values():
+            targets.update(self.install_dir / path for path in registration.get(MANIFEST_KEY) or {})
+
+        for component in self.components.values():
+            targets.update(target for _, target in component.get_files_to_install())
+
+        owned = set()
+        for target in targets:
+            try:
+                owned.add(target.relative_to(self.install_dir))
+            except ValueError:
+                continue
+        return sorted(owned)
+
+    @traced("installer.staging.commit", "install")
+    def _commit_staging(self) -> bool:
+        """
+        Swap the validated staging files into place
+
+        Every file in the staging directory replaces its live counterpart with
+        os.replace, and owned files the run removed are removed from the live
+        tree, so readers see either the old or the new version of each file.
+        Nothing else in install_dir is touched. The replaced files are kept
+        aside until all swaps succeeded and put back if one fails.
+
+        Returns:
+            True if the swap succeeded, False if the old files were kept
+        """
+        staging_dir = self.staging_dir
+        previous_dir = self.install_dir.parent / f".{self.install_dir.name}.previous-{os.getpid()}"
+        print(get_string("installer.staging.committing", self.install_dir))
+
+        staged_files = sorted(path.relative_to(staging_dir) for path in staging_dir.rglob('*')
+                              if path.is_file() or path.is_symlink())
+        removed = [relative for relative in self._seeded_paths
+                   if not os.path.lexists(staging_dir / relative)]
+        # (live path, where the previous version was moved or None)
+        swapped: List[Tuple[Path, Optional[Path]]] = []
+
+        try:
+            if previous_dir.exists():
+                shutil.rmtree(previous_dir)
+            for relative in staged_files + removed:
+                live = self.install_dir / relative
+                saved = None
+                if os.path.lexists(live):
+                    saved = previous_dir / relative
+                    saved.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(live, saved)
+                swapped.append((live, saved))
+
+                staged = staging_dir / relative
+                if os.path.lexists(staged):
+                    live.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(staged, live)
+        except OSError as e:
+            # Put the previous versions back before reporting the failure
+            for live, saved in reversed(swapped):
+                try:
+                    if saved is not None:
+                        os.replace(saved, live)
+                    elif os.path.lexists(live):
+                        live.unlink()
+                except OSError:
+                    pass
+            print(get_string("installer.staging.commit_error", e))
+            shutil.rmtree(previous_dir, ignore_errors=True)
+            self._discard_staging()
+            return False
+
+        # Only the replaced owned files and the emptied staging directories remain
+        shutil.rmtree(previous_dir, ignore_errors=True)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        self.staging_dir = None
+        self._seeded_paths = []
+        for component in self.components.values():
+            component.set_install_dir(self.install_dir)
+
+        return True
+
+    def _discard_staging(self) -> None:
+        """Delete the staging directory and point components back at install_dir"""
+        if self.staging_dir is None:
+            return
+
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        print(get_string("installer.staging.discarded", self.staging_dir))
+        self.staging_dir = None
+        self._seeded_paths = []
+
+        for component in self.components.values():
+            component.set_install_dir(self.install_dir)
+
+    def _run_post_install_validation(self) -> bool:
+        """
+        Run post-installation validation for all installed components
+
+        Returns:
+            True if every installed component validated
+        """
         print(f"\n{get_string('installer.validate.running')}")
 
         all_valid = True
@@ -298,9 +507,12 @@ class Installer:
             print(f"\n{get_string('installer.validate.all_valid')}")
         else:
             print(f"\n{get_string('installer.validate.some_invalid')}")
+
+        return all_valid
+
     def update_components(self, component_names: List[str], config: Dict[str, Any]) -> bool:
-        """Alias for update operation (uses install logic)"""
-        return self.install_components(component_names, config)
+        """Update installed components with install logic; each component applies its update plan"""
+        return self.install_components(component_names, {**config, "update_mode": True})
 
 
     def get_installation_summary(self) -> Dict[str, Any]:
@@ -316,7 +528,8 @@ class Installer:
             'skipped': list(self.skipped_components),
             'backup_path': str(self.backup_path) if self.backup_path else None,
             'install_dir': str(self.install_dir),
-            'dry_run': self.dry_run
+            'dry_run': self.dry_run,
+            'staged': self.staged
         }
 
     def get_update_summary(self) -> Dict[str, Any]:
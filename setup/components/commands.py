@@ -6,6 +6,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..base.component import Component
+from ..core.command_index import INDEX_FILENAME, build_command_index, write_command_index
 from ..utils.localization import get_string
 
 class CommandsComponent(Component):
@@ -68,6 +69,26 @@ class CommandsComponent(Component):
             self.logger.error(get_string("commands.install.metadata_error", e))
             return False
 
+        # The index only speeds up listing, so failing to write it is not fatal
+        self.write_command_index()
+
+        return True
+
+    def write_command_index(self) -> bool:
+        """
+        Parse the command files once and write the command index
+
+        Returns:
+            True if the index was written
+        """
+        index_path = self.install_dir / INDEX_FILENAME
+        try:
+            index = build_command_index(self._get_source_dir(), self.component_files)
+            write_command_index(index, index_path)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(get_string("commands.install.index_error", e))
+            return False
+        self.logger.debug(self.logger.lazy("commands.install.index_written", len(index["commands"]), index_path))
         return True
     
     def uninstall(self) -> bool:
@@ -83,7 +104,7 @@ class CommandsComponent(Component):
                 file_path = commands_dir / filename
                 if self.file_manager.remove_file(file_path):
                     removed_count += 1
-                    self.logger.debug(get_string("commands.uninstall.removed", filename))
+                    self.logger.debug(self.logger.lazy("commands.uninstall.removed", filename))
                 else:
                     self.logger.warning(get_string("commands.uninstall.remove_error", filename))
             
@@ -96,7 +117,7 @@ class CommandsComponent(Component):
                 if old_file_path.exists() and old_file_path.is_file():
                     if self.file_manager.remove_file(old_file_path):
                         old_removed_count += 1
-                        self.logger.debug(get_string("commands.uninstall.removed_old", filename))
+                        self.logger.debug(self.logger.lazy("commands.uninstall.removed_old", filename))
                     else:
                         self.logger.warning(get_string("commands.uninstall.remove_old_error", filename))
             
@@ -104,6 +125,8 @@ class CommandsComponent(Component):
                 self.logger.info(get_string("commands.uninstall.also_removed_old", old_removed_count))
             
             removed_count += old_removed_count
+
+            self.file_manager.remove_file(self.install_dir / INDEX_FILENAME)
             
             # Remove sc subdirectory if empty
             try:
@@ -111,7 +134,7 @@ class CommandsComponent(Component):
                     remaining_files = list(commands_dir.iterdir())
                     if not remaining_files:
                         commands_dir.rmdir()
-                        self.logger.debug(get_string("commands.uninstall.removed_sc_dir"))
+                        self.logger.debug(self.logger.lazy("commands.uninstall.removed_sc_dir"))
                         
                         # Also remove parent commands directory if empty
                         parent_commands_dir = self.install_dir / "commands"
@@ -119,7 +142,7 @@ class CommandsComponent(Component):
                             remaining_files = list(parent_commands_dir.iterdir())
                             if not remaining_files:
                                 parent_commands_dir.rmdir()
-                                self.logger.debug(get_string("commands.uninstall.removed_parent_dir"))
+                                self.logger.debug(self.logger.lazy("commands.uninstall.removed_parent_dir"))
             except Exception as e:
                 self.logger.warning(get_string("commands.uninstall.remove_dir_error", e))
             
@@ -147,63 +170,6 @@ class CommandsComponent(Component):
         """Get dependencies"""
         return ["core"]
     
-    def update(self, config: Dict[str, Any]) -> bool:
-        """Update commands component"""
-        try:
-            self.logger.info(get_string("commands.update.updating"))
-            
-            # Check current version
-            current_version = self.settings_manager.get_component_version("commands")
-            target_version = self.get_metadata()["version"]
-            
-            if current_version == target_version:
-                self.logger.info(get_string("commands.update.already_latest", target_version))
-                return True
-            
-            self.logger.info(get_string("commands.update.updating_from_to", current_version, target_version))
-            
-            # Create backup of existing command files
-            commands_dir = self.install_dir / "commands" / "sc"
-            backup_files = []
-            
-            if commands_dir.exists():
-                for filename in self.component_files:
-                    file_path = commands_dir / filename
-                    if file_path.exists():
-                        backup_path = self.file_manager.backup_file(file_path)
-                        if backup_path:
-                            backup_files.append(backup_path)
-                            self.logger.debug(get_string("commands.update.backed_up", filename))
-            
-            # Perform installation (overwrites existing files)
-            success = self.install(config)
-            
-            if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
-                self.logger.success(get_string("commands.update.success", target_version))
-            else:
-                # Restore from backup on failure
-                self.logger.warning(get_string("commands.update.restore_failed"))
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        backup_path.rename(original_path)
-                        self.logger.debug(get_string("commands.update.restored", original_path.name))
-                    except Exception as e:
-                        self.logger.error(get_string("commands.update.restore_error", backup_path, e))
-            
-            return success
-            
-        except Exception as e:
-            self.logger.exception(get_string("commands.update.unexpected_error", e))
-            return False
-    
     def validate_installation(self) -> Tuple[bool, List[str]]:
         """Validate commands component installation"""
         errors = []
@@ -214,13 +180,8 @@ class CommandsComponent(Component):
             errors.append(get_string("commands.validate.no_sc_dir"))
             return False, errors
         
-        # Check if all command files exist
-        for filename in self.component_files:
-            file_path = commands_dir / filename
-            if not file_path.exists():
-                errors.append(get_string("commands.validate.missing_file", filename))
-            elif not file_path.is_file():
-                errors.append(get_string("commands.validate.not_a_file", filename))
+        # Check the command files against the install manifest
+        errors.extend(self.integrity_errors())
         
         # Check metadata registration
         if not self.settings_manager.is_component_installed("commands"):
@@ -303,7 +264,7 @@ class CommandsComponent(Component):
                             # Remove old file
                             if self.file_manager.remove_file(old_file_path):
                                 migrated_count += 1
-                                self.logger.debug(get_string("commands.migrate.migrated", filename))
+                                self.logger.debug(self.logger.lazy("commands.migrate.migrated", filename))
                             else:
                                 self.logger.warning(get_string("commands.uninstall.remove_old_error", filename))
                         else:
@@ -322,9 +283,9 @@ class CommandsComponent(Component):
                             if not remaining_files:
                                 # Only remove if no user files remain
                                 old_commands_dir.rmdir()
-                                self.logger.debug(get_string("commands.migrate.remove_old_dir_error", old_commands_dir))
+                                self.logger.debug(self.logger.lazy("commands.migrate.remove_old_dir_error", old_commands_dir))
                     except Exception as e:
-                        self.logger.debug(get_string("commands.migrate.remove_old_dir_error", e))
+                        self.logger.debug(self.logger.lazy("commands.migrate.remove_old_dir_error", e))
                         
         except Exception as e:
             self.logger.warning(get_string("commands.migrate.migration_error", e))
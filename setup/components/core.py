@@ -4,17 +4,24 @@ Core component for SuperClaude framework files installation
 
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
-import shutil
 
 from ..base.component import Component
+from ..core.bundle import CoreBundleCompiler
+from ..core.update_plan import hash_content
 from ..utils.localization import get_string
 
 class CoreComponent(Component):
     """Core SuperClaude framework files component"""
+
+    # Install options that shape the compiled bundle, recorded for updates
+    BUILD_OPTIONS = ("profile", "optimize_core", "strip_unused_docs", "core_selection")
     
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize core component"""
         super().__init__(install_dir)
+        self.bundle_stats: Optional[Dict[str, Any]] = None
+        self.build_options: Optional[Dict[str, Any]] = None
+        self._bundle: Optional[Dict[str, str]] = None
     
     def get_metadata(self) -> Dict[str, str]:
         """Get component metadata"""
@@ -47,7 +54,102 @@ class CoreComponent(Component):
         """Install core component"""
         self.logger.info(get_string("core.install.installing"))
 
-        return super()._install(config);
+        self.bundle_stats = None
+        self.build_options = None
+        if not (config.get("optimize_core") or config.get("strip_unused_docs") or config.get("core_selection")):
+            return super()._install(config)
+
+        return self._install_bundle(config)
+
+    def _install_bundle(self, config: Dict[str, Any]) -> bool:
+        """Install the framework files compiled into an optimized bundle"""
+        success, errors = self.validate_prerequisites()
+        if not success:
+            for error in errors:
+                self.logger.error(error)
+            return False
+
+        try:
+            compiler, bundle = self._compile_bundle(config)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error(get_string("core.install.bundle_error", e))
+            return False
+
+        success_count = 0
+        files_to_install = self.get_files_to_install()
+        for source, target in files_to_install:
+            if self.write_file(source, target, bundle[source.name]):
+                success_count += 1
+            else:
+                self.logger.error(get_string("component.install.copy_failed", source.name))
+
+        if success_count != len(files_to_install):
+            self.logger.error(get_string("component.install.copy_summary_error", success_count, len(files_to_install)))
+            return False
+
+        stats = compiler.stats
+        self.bundle_stats = stats
+        self.build_options = {key: config.get(key) for key in self.BUILD_OPTIONS}
+        saved = 100 * (stats["bytes_before"] - stats["bytes_after"]) // max(stats["bytes_before"], 1)
+        self.logger.info(get_string("core.install.bundle_stats", stats["bytes_before"], stats["bytes_after"],
+                                    stats["tokens_before"], stats["tokens_after"], saved))
+        if stats["duplicates"]:
+            self.logger.info(get_string("core.install.bundle_duplicates", stats["duplicates"]))
+        if stats["stripped"]:
+            self.logger.info(get_string("core.install.bundle_stripped", ", ".join(stats["stripped"])))
+
+        self.logger.success(get_string("component.install.success", repr(self), success_count))
+
+        return self._post_install()
+
+    def _compile_bundle(self, config: Dict[str, Any]) -> Tuple[CoreBundleCompiler, Dict[str, str]]:
+        """
+        Compile the framework files for a set of install options, reusing a cached build
+
+        Returns:
+            Tuple of (compiler with stats, filename -> compiled content)
+
+        Raises:
+            OSError, UnicodeDecodeError: If a framework file cannot be read
+        """
+        installed_components = None
+        if config.get("strip_unused_docs"):
+            installed_components = set(config.get("components", []))
+            installed_components.update(self.settings_manager.get_installed_components())
+
+        compiler = CoreBundleCompiler(self._get_source_dir(), self.component_files, installed_components,
+                                      config.get("core_selection"))
+        build_name = config.get("profile") or "default"
+        with self.logger.span("core.bundle.compile", files=len(self.component_files), build=build_name) as span:
+            bundle = compiler.compile_cached(build_name)
+            span.set(bytes_before=compiler.stats["bytes_before"], bytes_after=compiler.stats["bytes_after"],
+                     cached=compiler.from_cache)
+        if compiler.from_cache:
+            self.logger.debug(self.logger.lazy("core.install.bundle_cached", build_name))
+        return compiler, bundle
+
+    def get_source_hashes(self) -> Dict[Path, Optional[str]]:
+        """Hashes of the compiled bundle if the installation was built as one"""
+        self._bundle = None
+        self.bundle_stats = None
+        self.build_options = self.settings_manager.get_installed_components().get("core", {}).get("build")
+        if not self.build_options:
+            return super().get_source_hashes()
+
+        try:
+            compiler, bundle = self._compile_bundle(self.build_options)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error(get_string("core.install.bundle_error", e))
+            return {}
+        self._bundle = bundle
+        self.bundle_stats = compiler.stats
+        return {target: hash_content(bundle[source.name]) for source, target in self.get_files_to_install()}
+
+    def _write_update_file(self, source: Path, target: Path) -> bool:
+        """Write the compiled content when updating a bundled installation"""
+        if self._bundle is None:
+            return super()._write_update_file(source, target)
+        return self.write_file(source, target, self._bundle[source.name])
 
     def _post_install(self):
         # Create or update metadata
@@ -57,11 +159,19 @@ class CoreComponent(Component):
             self.logger.info(get_string("core.install.metadata_updated"))
             
             # Add component registration to metadata
-            self.settings_manager.add_component_registration("core", {
+            registration = {
                 "version": "3.0.0",
                 "category": "core",
                 "files_count": len(self.component_files)
-            })
+            }
+            if self.bundle_stats:
+                registration["bundle"] = {
+                    key: self.bundle_stats[key]
+                    for key in ("bytes_before", "bytes_after", "tokens_before", "tokens_after")
+                }
+            if self.build_options:
+                registration["build"] = self.build_options
+            self.settings_manager.add_component_registration("core", registration)
 
             self.logger.info(get_string("core.install.registration_updated"))
             
@@ -93,7 +203,7 @@ class CoreComponent(Component):
                 file_path = self.install_dir / filename
                 if self.file_manager.remove_file(file_path):
                     removed_count += 1
-                    self.logger.debug(get_string("core.uninstall.removed", filename))
+                    self.logger.debug(self.logger.lazy("core.uninstall.removed", filename))
                 else:
                     self.logger.warning(get_string("core.uninstall.remove_error", filename))
             
@@ -123,71 +233,12 @@ class CoreComponent(Component):
         """Get component dependencies (core has none)"""
         return []
     
-    def update(self, config: Dict[str, Any]) -> bool:
-        """Update core component"""
-        try:
-            self.logger.info(get_string("core.update.updating"))
-            
-            # Check current version
-            current_version = self.settings_manager.get_component_version("core")
-            target_version = self.get_metadata()["version"]
-            
-            if current_version == target_version:
-                self.logger.info(get_string("core.update.already_latest", target_version))
-                return True
-            
-            self.logger.info(get_string("core.update.updating_from_to", current_version, target_version))
-            
-            # Create backup of existing files
-            backup_files = []
-            for filename in self.component_files:
-                file_path = self.install_dir / filename
-                if file_path.exists():
-                    backup_path = self.file_manager.backup_file(file_path)
-                    if backup_path:
-                        backup_files.append(backup_path)
-                        self.logger.debug(get_string("core.update.backed_up", filename))
-            
-            # Perform installation (overwrites existing files)
-            success = self.install(config)
-            
-            if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
-                self.logger.success(get_string("core.update.success", target_version))
-            else:
-                # Restore from backup on failure
-                self.logger.warning(get_string("core.update.restore_failed"))
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        shutil.move(str(backup_path), str(original_path))
-                        self.logger.debug(get_string("core.update.restored", original_path.name))
-                    except Exception as e:
-                        self.logger.error(get_string("core.update.restore_error", backup_path, e))
-            
-            return success
-            
-        except Exception as e:
-            self.logger.exception(get_string("core.update.unexpected_error", e))
-            return False
-    
     def validate_installation(self) -> Tuple[bool, List[str]]:
         """Validate core component installation"""
         errors = []
         
-        # Check if all framework files exist
-        for filename in self.component_files:
-            file_path = self.install_dir / filename
-            if not file_path.exists():
-                errors.append(get_string("core.validate.missing_file", filename))
-            elif not file_path.is_file():
-                errors.append(get_string("core.validate.not_a_file", filename))
+        # Check the framework files against the install manifest
+        errors.extend(self.integrity_errors())
         
         # Check metadata registration
         if not self.settings_manager.is_component_installed("core"):
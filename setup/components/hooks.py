@@ -104,7 +104,7 @@ pass
             try:
                 with open(placeholder_path, 'w') as f:
                     f.write(placeholder_content)
-                self.logger.debug(get_string("hooks.install.placeholder_created"))
+                self.logger.debug(self.logger.lazy("hooks.install.placeholder_created"))
             except Exception as e:
                 self.logger.warning(get_string("hooks.install.placeholder_error", e))
             
@@ -148,14 +148,16 @@ pass
 
         # Copy hook files
         success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(get_string("hooks.install.copying", source.name, target))
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(get_string("hooks.install.copy_success", source.name))
-            else:
-                self.logger.error(get_string("hooks.install.copy_failed", source.name))
+        with self.logger.span("install.files", files=len(files_to_install)) as batch:
+            for source, target in files_to_install:
+                self.logger.debug(self.logger.lazy("hooks.install.copying", source.name, target))
+                
+                if self.copy_file(source, target):
+                    success_count += 1
+                    self.logger.debug(self.logger.lazy("hooks.install.copy_success", source.name))
+                else:
+                    self.logger.error(get_string("hooks.install.copy_failed", source.name))
+            batch.set(copied=success_count)
 
         if success_count != len(files_to_install):
             self.logger.error(get_string("hooks.install.copy_summary_error", success_count, len(files_to_install)))
@@ -199,13 +201,13 @@ pass
                 file_path = self.install_component_subdir / filename
                 if self.file_manager.remove_file(file_path):
                     removed_count += 1
-                    self.logger.debug(get_string("hooks.uninstall.removed", filename))
+                    self.logger.debug(self.logger.lazy("hooks.uninstall.removed", filename))
             
             # Remove placeholder file
             placeholder_path = self.install_component_subdir / "PLACEHOLDER.py"
             if self.file_manager.remove_file(placeholder_path):
                 removed_count += 1
-                self.logger.debug(get_string("hooks.uninstall.removed_placeholder"))
+                self.logger.debug(self.logger.lazy("hooks.uninstall.removed_placeholder"))
             
             # Remove hooks directory if empty
             try:
@@ -213,7 +215,7 @@ pass
                     remaining_files = list(self.install_component_subdir.iterdir())
                     if not remaining_files:
                         self.install_component_subdir.rmdir()
-                        self.logger.debug(get_string("hooks.uninstall.removed_dir"))
+                        self.logger.debug(self.logger.lazy("hooks.uninstall.removed_dir"))
             except Exception as e:
                 self.logger.warning(get_string("hooks.uninstall.remove_dir_error", e))
             
@@ -243,6 +245,10 @@ pass
         """Get dependencies"""
         return ["core"]
     
+    def plan_update(self) -> Optional[Dict[str, Any]]:
+        """Hook files are not tracked per file; update() reinstalls them"""
+        return None
+
     def update(self, config: Dict[str, Any]) -> bool:
         """Update hooks component"""
         try:
@@ -268,7 +274,7 @@ pass
                         backup_path = self.file_manager.backup_file(file_path)
                         if backup_path:
                             backup_files.append(backup_path)
-                            self.logger.debug(get_string("hooks.update.backed_up", filename))
+                            self.logger.debug(self.logger.lazy("hooks.update.backed_up", filename))
             
             # Perform installation (overwrites existing files)
             success = self.install(config)
@@ -289,7 +295,7 @@ pass
                     try:
                         original_path = backup_path.with_suffix('')
                         backup_path.rename(original_path)
-                        self.logger.debug(get_string("hooks.update.restored", original_path.name))
+                        self.logger.debug(self.logger.lazy("hooks.update.restored", original_path.name))
                     except Exception as e:
                         self.logger.error(get_string("hooks.update.restore_error", backup_path, e))
             
@@ -5,12 +5,14 @@ MCP component for MCP server integration
 import subprocess
 import sys
 import json
+from functools import cached_property
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..base.component import Component
 from ..utils.ui import display_info, display_warning
 from ..utils.localization import get_string
+from ..utils.runner import run_command, VERSION_CHECK_TTL, MCP_LIST_TTL
 
 
 class MCPComponent(Component):
@@ -19,9 +21,11 @@ class MCPComponent(Component):
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
-        
-        # Load MCP servers from registry
-        self.mcp_servers = self._load_mcp_registry()
+
+    @cached_property
+    def mcp_servers(self) -> Dict[str, Any]:
+        """MCP servers from the registry (loaded on first use)"""
+        return self._load_mcp_registry()
 
     def _load_mcp_registry(self) -> Dict[str, Any]:
         """Load MCP server registry from JSON file"""
@@ -54,11 +58,11 @@ class MCPComponent(Component):
         
         # Check if Node.js is available
         try:
-            result = subprocess.run(
-                ["node", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
+            result = run_command(
+                ["node", "--version"],
+                capture_output=True,
+                text=True,
+                cache_ttl=VERSION_CHECK_TTL,
                 shell=(sys.platform == "win32")
             )
             if result.returncode != 0:
@@ -79,11 +83,11 @@ class MCPComponent(Component):
         
         # Check if Claude CLI is available
         try:
-            result = subprocess.run(
-                ["claude", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
+            result = run_command(
+                ["claude", "--version"],
+                capture_output=True,
+                text=True,
+                cache_ttl=VERSION_CHECK_TTL,
                 shell=(sys.platform == "win32")
             )
             if result.returncode != 0:
@@ -96,11 +100,11 @@ class MCPComponent(Component):
         
         # Check if npm is available
         try:
-            result = subprocess.run(
-                ["npm", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
+            result = run_command(
+                ["npm", "--version"],
+                capture_output=True,
+                text=True,
+                cache_ttl=VERSION_CHECK_TTL,
                 shell=(sys.platform == "win32")
             )
             if result.returncode != 0:
@@ -137,11 +141,11 @@ class MCPComponent(Component):
     def _check_mcp_server_installed(self, server_name: str) -> bool:
         """Check if MCP server is already installed"""
         try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"], 
-                capture_output=True, 
-                text=True, 
-                timeout=15,
+            result = run_command(
+                ["claude", "mcp", "list"],
+                capture_output=True,
+                text=True,
+                cache_ttl=MCP_LIST_TTL,
                 shell=(sys.platform == "win32")
             )
             
@@ -195,11 +199,10 @@ class MCPComponent(Component):
             
             self.logger.debug(get_string("mcp.install.running", server_name, command, npm_package))
             
-            result = subprocess.run(
+            result = run_command(
                 ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
                 capture_output=True,
                 text=True,
-                timeout=120,  # 2 minutes timeout for installation
                 shell=(sys.platform == "win32")
             )
             
@@ -230,11 +233,10 @@ class MCPComponent(Component):
             
             self.logger.debug(get_string("mcp.uninstall.running", server_name))
             
-            result = subprocess.run(
+            result = run_command(
                 ["claude", "mcp", "remove", server_name],
                 capture_output=True,
                 text=True,
-                timeout=60,
                 shell=(sys.platform == "win32")
             )
             
@@ -283,11 +285,10 @@ class MCPComponent(Component):
         if not config.get("dry_run", False):
             self.logger.info(get_string("mcp.component.verifying"))
             try:
-                result = subprocess.run(
+                result = run_command(
                     ["claude", "mcp", "list"],
                     capture_output=True,
                     text=True,
-                    timeout=15,
                     shell=(sys.platform == "win32")
                 )
                 
@@ -367,6 +368,14 @@ class MCPComponent(Component):
         """Get dependencies"""
         return ["core"]
     
+    def has_user_global_effects(self) -> bool:
+        """Servers are registered with `claude mcp add -s user`, in the invoking user's configuration"""
+        return True
+
+    def plan_update(self) -> Optional[Dict[str, Any]]:
+        """MCP servers are not files; update() reinstalls them"""
+        return None
+
     def update(self, config: Dict[str, Any]) -> bool:
         """Update MCP component"""
         try:
@@ -443,11 +452,10 @@ class MCPComponent(Component):
         
         # Check if Claude CLI is available
         try:
-            result = subprocess.run(
+            result = run_command(
                 ["claude", "mcp", "list"],
                 capture_output=True,
                 text=True,
-                timeout=15,
                 shell=(sys.platform == "win32")
             )
             
@@ -0,0 +1,371 @@
+"""
+Compiler for the Core framework bundle
+
+Claude reads every installed Core file at the start of each session, so
+their size is paid for again and again. The compiler rewrites them into a
+leaner bundle: whitespace is normalized, sections and tables repeated
+across files are replaced by a reference to their first occurrence, and
+optionally the documentation of components that are not installed is left
+out. Code blocks are never touched.
+
+Profiles can trim the bundle further with a "core" section:
+
+    "core": {
+        "exclude": ["MODES.md"],
+        "sections": {
+            "PERSONAS.md": {"drop": ["--persona-*"], "keep": ["--persona-architect"]}
+        }
+    }
+
+Patterns are shell-style and matched case-insensitively against heading
+text without backticks. A dropped section takes its subsections with it;
+"keep" exempts sections from "drop".
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.cache import get_cache_dir
+from ..utils.tokens import count_tokens
+
+# Bump when the compiler output changes, to invalidate cached builds
+BUNDLE_VERSION = 1
+
+# Files documenting a single optional component
+FILE_OWNERS: Dict[str, str] = {
+    "MCP.md": "mcp",
+    "COMMANDS.md": "commands",
+}
+
+# Sections (with their subsections) documenting an optional component,
+# matched against the heading text
+SECTION_OWNERS: List[Tuple["re.Pattern[str]", str]] = [
+    (re.compile(r"\bMCP\b"), "mcp"),
+]
+
+# Repeated blocks shorter than this are cheaper to keep than to reference
+MIN_DUPLICATE_CHARS = 160
+
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+# (level, heading line, body lines); the preamble has level 0 and no heading
+Section = Tuple[int, str, List[str]]
+
+
+def split_sections(text: str) -> List[Section]:
+    """
+    Split Markdown into sections at ATX headings outside code blocks
+
+    Args:
+        text: Markdown source
+
+    Returns:
+        List of (level, heading line, body lines). The text before the
+        first heading is returned as a level 0 section with an empty heading.
+    """
+    sections: List[Section] = [(0, "", [])]
+    in_fence = False
+    for line in text.splitlines():
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = _HEADING_PATTERN.match(line)
+            if match:
+                sections.append((len(match.group(1)), line, []))
+                continue
+        sections[-1][2].append(line)
+
+    if not sections[0][2] and len(sections) > 1:
+        sections.pop(0)
+    return sections
+
+
+def heading_text(heading: str) -> str:
+    """Heading line without the leading hashes"""
+    match = _HEADING_PATTERN.match(heading)
+    return match.group(2) if match else heading.strip()
+
+
+def join_sections(sections: Iterable[Section]) -> str:
+    """Inverse of split_sections"""
+    lines: List[str] = []
+    for _, heading, body in sections:
+        if heading:
+            lines.append(heading)
+        lines.extend(body)
+    return "\n".join(lines) + "\n"
+
+
+def normalize_whitespace(text: str) -> str:
+    """
+    Normalize Markdown whitespace outside code blocks
+
+    Trailing whitespace is removed, runs of blank lines are collapsed to one
+    and blank lines directly after headings are dropped.
+
+    Args:
+        text: Markdown source
+
+    Returns:
+        Normalized text ending with a single newline
+    """
+    lines: List[str] = []
+    in_fence = False
+    for line in text.splitlines():
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+            lines.append(line.rstrip())
+            continue
+        if in_fence:
+            lines.append(line)
+            continue
+
+        line = line.rstrip()
+        if not line:
+            if not lines or not lines[-1] or _HEADING_PATTERN.match(lines[-1]):
+                continue
+        lines.append(line)
+
+    while lines and not lines[-1]:
+        lines.pop()
+    return "\n".join(lines) + "\n"
+
+
+def _fingerprint(lines: List[str]) -> str:
+    """Hash of a block, insensitive to blank lines and indentation"""
+    normalized = "\n".join(line.strip() for line in lines if line.strip())
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def _split_tables(body: List[str]) -> List[Tuple[bool, List[str]]]:
+    """Split body lines into (is_table, lines) runs, ignoring code blocks"""
+    runs: List[Tuple[bool, List[str]]] = []
+    in_fence = False
+    for line in body:
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        is_table = not in_fence and line.lstrip().startswith("|")
+        if runs and runs[-1][0] == is_table:
+            runs[-1][1].append(line)
+        else:
+            runs.append((is_table, [line]))
+    return runs
+
+
+class CoreBundleCompiler:
+    """Builds the optimized contents of the Core framework files"""
+
+    def __init__(self, source_dir: Path, files: List[str],
+                 installed_components: Optional[Iterable[str]] = None,
+                 selection: Optional[Dict[str, Any]] = None):
+        """
+        Initialize compiler
+
+        Args:
+            source_dir: Directory containing the Core Markdown files
+            files: File names to compile, in bundle order
+            installed_components: Components that will be present after the
+                install. None keeps the documentation of every component.
+            selection: "core" section of the installation profile
+        """
+        self.source_dir = source_dir
+        self.files = list(files)
+        self.installed_components = (
+            None if installed_components is None else set(installed_components)
+        )
+        self.selection = selection or {}
+        self.stats: Dict[str, Any] = {}
+        self.from_cache = False
+
+    def _is_owned_by_missing(self, owner: Optional[str]) -> bool:
+        return (owner is not None and self.installed_components is not None
+                and owner not in self.installed_components)
+
+    def _section_owner(self, heading: str) -> Optional[str]:
+        text = heading_text(heading)
+        for pattern, owner in SECTION_OWNERS:
+            if pattern.search(text):
+                return owner
+        return None
+
+    def _profile_drops(self, filename: str) -> Callable[[str], bool]:
+        """Predicate telling whether the profile drops a section of filename"""
+        rules = self.selection.get("sections", {}).get(filename, {})
+        drop = [pattern.replace("`", "").lower() for pattern in rules.get("drop", [])]
+        keep = [pattern.replace("`", "").lower() for pattern in rules.get("keep", [])]
+
+        def drops(heading: str) -> bool:
+            text = heading_text(heading).replace("`", "").lower()
+            return (any(fnmatch.fnmatchcase(text, pattern) for pattern in drop)
+                    and not any(fnmatch.fnmatchcase(text, pattern) for pattern in keep))
+        return drops
+
+    def _strip_sections(self, sections: List[Section], filename: str) -> Tuple[List[Section], List[str]]:
+        """Drop sections (and their subsections) of missing components or deselected by the profile"""
+        profile_drops = self._profile_drops(filename)
+        kept: List[Section] = []
+        stripped: List[str] = []
+        skip_below: Optional[int] = None
+        for level, heading, body in sections:
+            if skip_below is not None:
+                if level > skip_below:
+                    continue
+                skip_below = None
+            if level and (self._is_owned_by_missing(self._section_owner(heading)) or profile_drops(heading)):
+                skip_below = level
+                stripped.append(heading_text(heading))
+                continue
+            kept.append((level, heading, body))
+        return kept, stripped
+
+    def cache_key(self) -> str:
+        """
+        Hash of everything the compiled bundle depends on
+
+        Covers the compiler version, the source files' names and contents,
+        the installed components and the profile selection.
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps([
+            BUNDLE_VERSION,
+            sorted(self.installed_components) if self.installed_components is not None else None,
+            self.selection
+        ], sort_keys=True).encode("utf-8"))
+        for filename in self.files:
+            digest.update(filename.encode("utf-8") + b"\0")
+            digest.update((self.source_dir / filename).read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def compile_cached(self, name: str) -> Dict[str, str]:
+        """
+        Compile all files, reusing an earlier build with the same inputs
+
+        One build is kept per name (typically the profile), so switching
+        between profiles does not recompile either of them.
+
+        Args:
+            name: Build name
+
+        Returns:
+            Same as compile(); self.from_cache tells whether the build was
+            reused
+        """
+        self.from_cache = False
+        key = self.cache_key()
+        cache_dir = get_cache_dir("core")
+        if cache_dir is None:
+            return self.compile()
+
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        cache_file = cache_dir / f"{safe_name}-{key[:16]}.json"
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("key") == key:
+                self.stats = data["stats"]
+                self.from_cache = True
+                return data["files"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        bundle = self.compile()
+
+        for stale in cache_dir.glob(f"{safe_name}-*.json"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+        # Concurrent installs (fleet mode) may write the same build from several threads
+        tmp_path = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "stats": self.stats, "files": bundle}, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return bundle
+
+    def compile(self) -> Dict[str, str]:
+        """
+        Compile all files
+
+        Returns:
+            Mapping of file name to optimized content, in bundle order.
+            Statistics are available in self.stats afterwards.
+        """
+        bundle: Dict[str, str] = {}
+        seen: Dict[str, str] = {}
+        bytes_before = tokens_before = 0
+        duplicates = 0
+        stripped: List[str] = []
+
+        for filename in self.files:
+            original = (self.source_dir / filename).read_text(encoding="utf-8")
+            bytes_before += len(original.encode("utf-8"))
+            tokens_before += count_tokens(original)
+
+            sections = split_sections(normalize_whitespace(original))
+
+            owner = FILE_OWNERS.get(filename)
+            note = None
+            if filename in self.selection.get("exclude", []):
+                note = "_Omitted by the installation profile._"
+            elif self._is_owned_by_missing(owner):
+                note = f"_Omitted: documents the `{owner}` component, which is not installed._"
+            if note is not None:
+                # Keep the file so validation and uninstall see the full set
+                title = next((s for s in sections if s[0] == 1), (1, f"# {filename}", []))
+                bundle[filename] = join_sections([(1, title[1], [note])])
+                stripped.append(filename)
+                continue
+
+            sections, removed = self._strip_sections(sections, filename)
+            stripped.extend(f"{filename}: {name}" for name in removed)
+
+            compiled: List[Section] = []
+            for level, heading, body in sections:
+                location = f"\"{heading_text(heading)}\" in {filename}" if heading else filename
+                body_text = "\n".join(body)
+                key = _fingerprint(body)
+                if heading and len(body_text) >= MIN_DUPLICATE_CHARS and key in seen:
+                    compiled.append((level, heading, [f"_Same as {seen[key]}._"]))
+                    duplicates += 1
+                    continue
+                if heading and len(body_text) >= MIN_DUPLICATE_CHARS:
+                    seen[key] = location
+
+                new_body: List[str] = []
+                for is_table, lines in _split_tables(body):
+                    if is_table and len("\n".join(lines)) >= MIN_DUPLICATE_CHARS:
+                        table_key = "table:" + _fingerprint(lines)
+                        if table_key in seen:
+                            new_body.append(f"_Table: same as in {seen[table_key]}._")
+                            duplicates += 1
+                            continue
+                        seen[table_key] = location
+                    new_body.extend(lines)
+                compiled.append((level, heading, new_body))
+
+            bundle[filename] = normalize_whitespace(join_sections(compiled))
+
+        self.stats = {
+            "files": len(bundle),
+            "bytes_before": bytes_before,
+            "bytes_after": sum(len(content.encode("utf-8")) for content in bundle.values()),
+            "tokens_before": tokens_before,
+            "tokens_after": sum(count_tokens(content) for content in bundle.values()),
+            "duplicates": duplicates,
+            "stripped": stripped
+        }
+        return bundle
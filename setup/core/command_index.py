@@ -0,0 +1,227 @@
+"""
+Index of the slash commands shipped by the commands component
+
+Every command file starts with a small YAML-like frontmatter block
+(allowed-tools, description, ...) followed by Markdown with a Usage
+section. The index collects that once at install time into a compact JSON
+file, so listing and searching commands does not parse every file again.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when the index layout changes
+INDEX_VERSION = 1
+
+# Location of the index relative to the installation directory
+INDEX_FILENAME = Path("commands") / "sc-index.json"
+
+_FLAG_PATTERN = re.compile(r"(?<![\w-])--[a-zA-Z][\w-]*")
+_SECTION_PATTERN = re.compile(r"^##\s+(.*?)\s*$")
+
+
+def _parse_value(raw: str) -> Any:
+    """Scalar or inline list of the frontmatter subset used by the commands"""
+    value = raw.strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [_parse_value(item) for item in value[1:-1].split(",") if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Split a command file into frontmatter and body
+
+    Args:
+        text: File content
+
+    Returns:
+        Tuple of (frontmatter dict, Markdown body). Files without
+        frontmatter return an empty dict and the whole text.
+    """
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}, text
+
+    meta: Dict[str, Any] = {}
+    for index, line in enumerate(lines[1:], start=1):
+        if line.strip() == "---":
+            return meta, "\n".join(lines[index + 1:])
+        key, separator, value = line.partition(":")
+        if separator and key.strip():
+            meta[key.strip()] = _parse_value(value)
+    # Unterminated block: treat the file as plain Markdown
+    return {}, text
+
+
+def _sections(body: str) -> Dict[str, List[str]]:
+    """Lines of each level-2 section, keyed by heading"""
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in body.splitlines():
+        match = _SECTION_PATTERN.match(line)
+        if match:
+            current = sections.setdefault(match.group(1), [])
+        elif current is not None:
+            current.append(line)
+    return sections
+
+
+def _first_paragraph(lines: List[str]) -> str:
+    paragraph: List[str] = []
+    for line in lines:
+        if line.strip():
+            paragraph.append(line.strip())
+        elif paragraph:
+            break
+    return " ".join(paragraph)
+
+
+def parse_command(path: Path) -> Dict[str, Any]:
+    """
+    Index entry for one command file
+
+    Args:
+        path: Command Markdown file
+
+    Returns:
+        Dict with name, title, description, allowed_tools, usage, flags,
+        bytes and the remaining frontmatter keys under "meta"
+
+    Raises:
+        OSError, UnicodeDecodeError: If the file cannot be read
+    """
+    raw = path.read_bytes()
+    meta, body = parse_frontmatter(raw.decode("utf-8"))
+    sections = _sections(body)
+
+    title = ""
+    for line in body.splitlines():
+        if line.startswith("# "):
+            title = line[2:].strip()
+            break
+
+    description = meta.pop("description", None)
+    if not description:
+        description = _first_paragraph(sections.get("Description") or sections.get("Purpose") or [])
+
+    usage = ""
+    for line in sections.get("Usage", []):
+        line = line.strip().strip("`")
+        if line:
+            usage = line
+            break
+
+    flags: List[str] = []
+    for line in [usage] + sections.get("Arguments", []):
+        for flag in _FLAG_PATTERN.findall(line):
+            if flag not in flags:
+                flags.append(flag)
+
+    allowed_tools = meta.pop("allowed-tools", [])
+    return {
+        "name": path.stem,
+        "title": title,
+        "description": description,
+        "allowed_tools": allowed_tools if isinstance(allowed_tools, list) else [allowed_tools],
+        "usage": usage,
+        "flags": flags,
+        "bytes": len(raw),
+        "meta": meta
+    }
+
+
+def build_command_index(source_dir: Path, files: List[str]) -> Dict[str, Any]:
+    """
+    Parse all command files into an index
+
+    Args:
+        source_dir: Directory containing the command files
+        files: Command file names
+
+    Returns:
+        Index dict with version and commands (sorted by name)
+    """
+    commands = [parse_command(source_dir / filename) for filename in files]
+    commands.sort(key=lambda command: command["name"])
+    return {"version": INDEX_VERSION, "commands": commands}
+
+
+def write_command_index(index: Dict[str, Any], path: Path) -> None:
+    """
+    Write an index (atomically)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load_command_index(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read an index
+
+    Returns:
+        Index dict, or None if the file is missing, unreadable or outdated
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+def search_commands(index: Dict[str, Any], query: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Commands whose name, description, usage or tools contain all query words
+
+    Args:
+        index: Index from build_command_index() or load_command_index()
+        query: Space-separated words (case-insensitive); None lists all
+
+    Returns:
+        Matching command entries, name matches first
+    """
+    commands = index.get("commands", [])
+    words = query.lower().split() if query else []
+    if not words:
+        return list(commands)
+
+    matches = []
+    for command in commands:
+        haystack = " ".join([
+            command["name"], command["title"], command["description"], command["usage"],
+            " ".join(command["allowed_tools"])
+        ]).lower()
+        if all(word in haystack for word in words):
+            matches.append(command)
+    matches.sort(key=lambda command: not any(word in command["name"].lower() for word in words))
+    return matches
@@ -0,0 +1,175 @@
+"""
+Token budget analysis of the framework files loaded into Claude's context
+
+Produces a JSON-serializable report (per file and per Markdown section) and
+compares it with a stored baseline, so growth of the Core docs and command
+definitions shows up before it is shipped.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .bundle import heading_text, split_sections
+from ..utils.tokens import DEFAULT_TOKENIZER, get_tokenizer
+
+# Bump when the report layout changes
+REPORT_VERSION = 1
+
+
+def analyze_files(files: Iterable[Tuple[str, str, Path]], tokenizer: Optional[str] = None,
+                  root: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Measure files and their Markdown sections
+
+    Args:
+        files: (component, label, path) for every file to measure; missing
+            files are skipped
+        tokenizer: Tokenizer name (default: the offline heuristic)
+        root: Directory recorded in the report
+
+    Returns:
+        Report dict with totals, per-component totals, per-file entries
+        (bytes, tokens, lines) and per-section entries (file, heading,
+        level, bytes, tokens), sections sorted by tokens descending
+
+    Raises:
+        ValueError: If the tokenizer is not available
+    """
+    count = get_tokenizer(tokenizer)
+    report_files: Dict[str, Dict[str, Any]] = {}
+    sections: List[Dict[str, Any]] = []
+    components: Dict[str, Dict[str, int]] = {}
+
+    for component, label, path in files:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        tokens = count(text)
+        entry = {
+            "component": component,
+            "bytes": len(text.encode("utf-8")),
+            "tokens": tokens,
+            "lines": text.count("\n") + (0 if text.endswith("\n") or not text else 1)
+        }
+        report_files[label] = entry
+        totals = components.setdefault(component, {"files": 0, "bytes": 0, "tokens": 0})
+        totals["files"] += 1
+        totals["bytes"] += entry["bytes"]
+        totals["tokens"] += tokens
+
+        for level, heading, body in split_sections(text):
+            section_text = "\n".join([heading] + body if heading else body)
+            sections.append({
+                "file": label,
+                "heading": heading_text(heading) if heading else "",
+                "level": level,
+                "bytes": len(section_text.encode("utf-8")),
+                "tokens": count(section_text)
+            })
+
+    sections.sort(key=lambda section: section["tokens"], reverse=True)
+    return {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "root": str(root) if root else None,
+        "tokenizer": tokenizer or DEFAULT_TOKENIZER,
+        "totals": {
+            "files": len(report_files),
+            "bytes": sum(entry["bytes"] for entry in report_files.values()),
+            "tokens": sum(entry["tokens"] for entry in report_files.values())
+        },
+        "components": components,
+        "files": report_files,
+        "sections": sections
+    }
+
+
+def compare_reports(report: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Growth of a report relative to a baseline
+
+    Args:
+        report: Current report from analyze_files()
+        baseline: Earlier report
+
+    Returns:
+        Dict with total token/byte deltas, growth_percent and per-file
+        changes (added, removed and changed files with their token deltas,
+        largest growth first)
+    """
+    old_files = baseline.get("files", {})
+    new_files = report.get("files", {})
+    changes = []
+    for label in sorted(set(old_files) | set(new_files)):
+        old_tokens = old_files.get(label, {}).get("tokens", 0)
+        new_tokens = new_files.get(label, {}).get("tokens", 0)
+        if label not in old_files:
+            status = "added"
+        elif label not in new_files:
+            status = "removed"
+        elif old_tokens != new_tokens:
+            status = "changed"
+        else:
+            continue
+        changes.append({
+            "file": label,
+            "status": status,
+            "tokens_before": old_tokens,
+            "tokens_after": new_tokens,
+            "delta": new_tokens - old_tokens
+        })
+    changes.sort(key=lambda change: change["delta"], reverse=True)
+
+    old_tokens = baseline.get("totals", {}).get("tokens", 0)
+    new_tokens = report["totals"]["tokens"]
+    return {
+        "baseline_created": baseline.get("created"),
+        "tokenizer_mismatch": baseline.get("tokenizer") != report.get("tokenizer"),
+        "tokens_delta": new_tokens - old_tokens,
+        "bytes_delta": report["totals"]["bytes"] - baseline.get("totals", {}).get("bytes", 0),
+        "growth_percent": (100.0 * (new_tokens - old_tokens) / old_tokens) if old_tokens else None,
+        "files": changes
+    }
+
+
+def load_report(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a stored report (e.g. the baseline)
+
+    Returns:
+        Report dict, or None if the file is missing or not a report
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != REPORT_VERSION:
+        return None
+    return data
+
+
+def save_report(report: Dict[str, Any], path: Path) -> None:
+    """
+    Write a report as JSON (atomically, so a baseline is never half-written)
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
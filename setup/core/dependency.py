@@ -0,0 +1,206 @@
+"""
+Dependency graph with linear-time topological ordering
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..utils.localization import get_string
+
+
+class DependencyGraph:
+    """Immutable component dependency graph with memoized resolution"""
+
+    def __init__(self, dependencies: Dict[str, Iterable[str]]):
+        """
+        Initialize dependency graph
+
+        Args:
+            dependencies: Mapping of component name to the names it depends on.
+                Iteration order is kept and used to break ties.
+        """
+        self.dependencies: Dict[str, Tuple[str, ...]] = {
+            name: tuple(deps) for name, deps in dependencies.items()
+        }
+        self._resolved: Dict[Tuple[str, ...], Tuple[List[str], List[List[str]]]] = {}
+        self._cycles: Optional[List[List[str]]] = None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.dependencies
+
+    def closure(self, component_names: Iterable[str]) -> List[str]:
+        """
+        Requested components plus everything they depend on
+
+        Args:
+            component_names: Requested component names
+
+        Returns:
+            Names in depth-first post-order: each component follows its
+            dependencies (unless they are circular), requested ones in order
+
+        Raises:
+            ValueError: If a component or dependency is unknown
+        """
+        seen: Set[str] = set()
+        found: List[str] = []
+
+        for root in component_names:
+            if root in seen:
+                continue
+            if root not in self.dependencies:
+                raise ValueError(get_string("registry.error.unknown_component", root))
+
+            seen.add(root)
+            work = [(root, iter(self.dependencies[root]))]
+            while work:
+                name, deps = work[-1]
+                for dep in deps:
+                    if dep not in seen:
+                        if dep not in self.dependencies:
+                            raise ValueError(get_string("registry.error.unknown_component", dep))
+                        seen.add(dep)
+                        work.append((dep, iter(self.dependencies[dep])))
+                        break
+                else:
+                    work.pop()
+                    found.append(name)
+
+        return found
+
+    def resolve(self, component_names: Iterable[str]) -> Tuple[List[str], List[List[str]]]:
+        """
+        Installation order and dependency levels for the requested components
+
+        Kahn's algorithm over the dependency closure. Among components whose
+        dependencies are satisfied, the one earliest in closure() order is
+        emitted first, which reproduces the depth-first order (dependencies
+        first, then requested components in request order). Results are
+        memoized per request.
+
+        Args:
+            component_names: Requested component names
+
+        Returns:
+            Tuple of (ordered names, levels). Each level only depends on
+            earlier levels, so its components can be installed in parallel.
+
+        Raises:
+            ValueError: If a component is unknown or dependencies are circular
+                (the message lists every cycle)
+        """
+        key = tuple(component_names)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return list(cached[0]), [list(level) for level in cached[1]]
+
+        nodes = self.closure(key)
+        rank = {name: i for i, name in enumerate(nodes)}
+
+        pending = {name: len(set(self.dependencies[name])) for name in nodes}
+        dependents: Dict[str, List[str]] = {name: [] for name in nodes}
+        for name in nodes:
+            for dep in set(self.dependencies[name]):
+                dependents[dep].append(name)
+
+        ready = [rank[name] for name in nodes if pending[name] == 0]
+        heapq.heapify(ready)
+        order: List[str] = []
+        level_of: Dict[str, int] = {}
+
+        while ready:
+            name = nodes[heapq.heappop(ready)]
+            order.append(name)
+            level_of[name] = max((level_of[dep] + 1 for dep in self.dependencies[name]), default=0)
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    heapq.heappush(ready, rank[dependent])
+
+        if len(order) != len(nodes):
+            # Walk the leftovers in declaration order for stable messages
+            stuck = set(nodes) - set(level_of)
+            cycles = self._find_cycles([name for name in self.dependencies if name in stuck])
+            raise ValueError(get_string("registry.error.circular_dependency", self.format_cycles(cycles)))
+
+        levels: List[List[str]] = [[] for _ in range(max(level_of.values(), default=-1) + 1)]
+        for name in order:
+            levels[level_of[name]].append(name)
+
+        self._resolved[key] = (order, levels)
+        return list(order), [list(level) for level in levels]
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        All dependency cycles in the graph
+
+        Returns:
+            One list of component names per cycle (strongly connected
+            component), empty if the graph is acyclic
+        """
+        if self._cycles is None:
+            self._cycles = self._find_cycles(list(self.dependencies))
+        return [list(cycle) for cycle in self._cycles]
+
+    def _find_cycles(self, nodes: List[str]) -> List[List[str]]:
+        """Tarjan's strongly connected components restricted to nodes"""
+        allowed = set(nodes)
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+        counter = 0
+
+        for root in nodes:
+            if root in index_of:
+                continue
+
+            # Iterative DFS: (node, iterator over its dependencies)
+            work = [(root, iter(self.dependencies.get(root, ())))]
+            index_of[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, deps = work[-1]
+                advanced = False
+                for dep in deps:
+                    if dep not in allowed:
+                        continue
+                    if dep not in index_of:
+                        index_of[dep] = lowlink[dep] = counter
+                        counter += 1
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(self.dependencies.get(dep, ()))))
+                        advanced = True
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[dep])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.dependencies.get(node, ()):
+                        cycles.append(list(reversed(component)))
+
+        return cycles
+
+    @staticmethod
+    def format_cycles(cycles: List[List[str]]) -> str:
+        """Human-readable list of cycles, e.g. "a -> b -> a; c -> c" """
+        return "; ".join(" -> ".join(cycle + cycle[:1]) for cycle in cycles)
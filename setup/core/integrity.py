@@ -0,0 +1,121 @@
+"""
+Integrity scan of installed components
+
+Compares the installed files of each component with the manifest recorded
+at install time (see setup.core.update_plan). The quick mode only compares
+size and modification time, one stat() per file; a file that was merely
+touched is reported as modified there. The deep mode hashes every file on a
+thread pool and reports only real content changes.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.hashing import get_hash_service
+from .update_plan import MANIFEST_KEY, record_algorithm, relative_path
+
+
+def _expected_files(component) -> Tuple[Dict[str, Optional[Dict[str, Any]]], bool]:
+    """
+    Files the component should have installed
+
+    Returns:
+        Tuple of (relative path -> manifest record, whether a manifest was
+        recorded). Installations from before manifests were recorded map the
+        files the component would install to None, which are only checked
+        for existence.
+    """
+    name = component.get_metadata()["name"]
+    registration = component.settings_manager.get_installed_components().get(name, {})
+    manifest = registration.get(MANIFEST_KEY)
+    if manifest is not None:
+        return dict(manifest), True
+    return {relative_path(target, component.install_dir): None
+            for _, target in component.get_files_to_install()}, False
+
+
+def _extra_files(component, expected: Dict[str, Any]) -> List[str]:
+    """
+    Files in the component's own directory that it did not install
+
+    The installation root is shared with the user and other components, so
+    only components with a subdirectory of their own are checked, and only
+    if they track any files there (the hooks placeholder does not).
+    """
+    if component.component_subdir == Path("") or not expected:
+        return []
+    directory = component.install_component_subdir
+    if not directory.is_dir():
+        return []
+    extra = []
+    for path in directory.iterdir():
+        key = relative_path(path, component.install_dir)
+        if path.is_file() and key not in expected:
+            extra.append(key)
+    return sorted(extra)
+
+
+def scan_components(components: List[Any], deep: bool = False,
+                    max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Check the installed files of components against their manifests
+
+    Args:
+        components: Component instances bound to the installation directory
+        deep: Hash every file instead of comparing size and modification time
+        max_workers: Hashing threads in deep mode (default: the hashing
+            service default)
+
+    Returns:
+        Component name -> report dict with modified, missing and extra
+        (relative paths, sorted), checked (files found on disk) and
+        manifest (False if the files could only be checked for existence)
+    """
+    reports: Dict[str, Dict[str, Any]] = {}
+    # algorithm -> [(report, path, target, recorded hash)], hashed in one batch each
+    to_hash: Dict[str, List[Tuple[Dict[str, Any], str, Path, Any]]] = {}
+
+    for component in components:
+        expected, has_manifest = _expected_files(component)
+        report: Dict[str, Any] = {
+            "modified": [],
+            "missing": [],
+            "extra": _extra_files(component, expected),
+            "checked": 0,
+            "manifest": has_manifest
+        }
+        reports[component.get_metadata()["name"]] = report
+
+        for path, record in sorted(expected.items()):
+            target = component.install_dir / path
+            try:
+                stat = target.stat()
+            except OSError:
+                report["missing"].append(path)
+                continue
+            report["checked"] += 1
+            if record is None:
+                continue
+            if "size" in record and stat.st_size != record["size"]:
+                report["modified"].append(path)
+            elif deep:
+                to_hash.setdefault(record_algorithm(record), []).append((report, path, target, record.get("hash")))
+            elif "mtime" in record and stat.st_mtime_ns != record["mtime"]:
+                report["modified"].append(path)
+
+    # Deep mode must not trust file metadata, so cached digests are not used
+    for algorithm, entries in to_hash.items():
+        hashes = get_hash_service(algorithm).hash_files([entry[2] for entry in entries], use_cache=False,
+                                                        max_workers=max_workers)
+        for report, path, target, expected_hash in entries:
+            if hashes[target] != expected_hash:
+                report["modified"].append(path)
+    for report in reports.values():
+        report["modified"].sort()
+
+    return reports
+
+
+def is_intact(report: Dict[str, Any]) -> bool:
+    """True if no installed file is modified or missing; extra files are only reported"""
+    return not report["modified"] and not report["missing"]
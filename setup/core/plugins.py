@@ -0,0 +1,158 @@
+"""
+Discovery of component packs installed as separate distributions
+
+A pack exposes its Component subclasses as entry points:
+
+    [project.entry-points."superclaude.components"]
+    org_docs = "acme_superclaude.components:OrgDocsComponent"
+
+Enumerating entry points walks the metadata of every installed
+distribution, so the result is cached and reused until a sys.path entry
+changes (installing or removing a distribution touches its directory).
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+from importlib import metadata as importlib_metadata
+from typing import Any, Dict, List, Optional, Type
+
+from ..base.component import Component
+from ..utils.cache import get_cache_dir
+
+PLUGIN_GROUP = "superclaude.components"
+
+# Bump when the index layout changes
+INDEX_VERSION = 1
+
+
+def plugins_enabled() -> bool:
+    """Plugins can be switched off with SUPERCLAUDE_NO_PLUGINS=1"""
+    return os.environ.get("SUPERCLAUDE_NO_PLUGINS", "") not in ("1", "true", "yes")
+
+
+def _path_fingerprint() -> List[List[Any]]:
+    """(entry, mtime_ns) for every sys.path entry; None for missing ones"""
+    fingerprint = []
+    for entry in sys.path:
+        try:
+            mtime = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            mtime = None
+        fingerprint.append([entry, mtime])
+    return fingerprint
+
+
+def _index_path(fingerprint: List[List[Any]]) -> Optional[str]:
+    """Cache file for the current interpreter and sys.path"""
+    cache_dir = get_cache_dir("registry")
+    if cache_dir is None:
+        return None
+    key = json.dumps([sys.executable, [entry for entry, _ in fingerprint]])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return str(cache_dir / f"plugins-{digest}.json")
+
+
+def scan_entry_points() -> List[Dict[str, str]]:
+    """
+    Enumerate component entry points of all installed distributions
+
+    Returns:
+        List of dicts with name, value ("module:Class"), dist and version
+    """
+    found = []
+    seen = set()
+    for dist in importlib_metadata.distributions():
+        try:
+            entry_points = dist.entry_points
+        except Exception:
+            continue
+        for entry_point in entry_points:
+            if entry_point.group != PLUGIN_GROUP:
+                continue
+            # The same distribution can be visible through two path entries
+            key = (entry_point.name, entry_point.value)
+            if key in seen:
+                continue
+            seen.add(key)
+            found.append({
+                "name": entry_point.name,
+                "value": entry_point.value,
+                "dist": dist.metadata["Name"] or "",
+                "version": dist.version or ""
+            })
+
+    found.sort(key=lambda entry: entry["name"])
+    return found
+
+
+def discover_plugins(use_cache: bool = True) -> List[Dict[str, str]]:
+    """
+    Component entry points, from the cached index when it is current
+
+    Args:
+        use_cache: Read the cached index if valid (it is always rewritten)
+
+    Returns:
+        List of dicts with name, value, dist and version
+    """
+    if not plugins_enabled():
+        return []
+
+    fingerprint = _path_fingerprint()
+    index_path = _index_path(fingerprint)
+
+    if use_cache and index_path is not None:
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and data.get("paths") == fingerprint:
+                return data["entry_points"]
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+    entry_points = scan_entry_points()
+
+    if index_path is not None:
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": INDEX_VERSION,
+                    "paths": fingerprint,
+                    "entry_points": entry_points
+                }, f)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    return entry_points
+
+
+def load_plugin(entry: Dict[str, str]) -> Type[Component]:
+    """
+    Import the component class an entry point refers to
+
+    Args:
+        entry: Entry from discover_plugins()
+
+    Returns:
+        Component subclass
+
+    Raises:
+        ImportError, AttributeError: If the target cannot be imported
+        TypeError: If the target is not a Component subclass
+    """
+    module_name, _, attribute = entry["value"].partition(":")
+    obj = importlib.import_module(module_name.strip())
+    for part in attribute.strip().split(".") if attribute.strip() else []:
+        obj = getattr(obj, part)
+
+    if not (isinstance(obj, type) and issubclass(obj, Component) and obj is not Component):
+        raise TypeError(f"{entry['value']} is not a Component subclass")
+    return obj
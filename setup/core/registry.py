@@ -2,14 +2,26 @@
 Component registry for auto-discovery and dependency resolution
 """
 
+import copy
+import hashlib
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+from typing import Any, Dict, List, Set, Optional, Tuple, Type
 from pathlib import Path
 from ..base.component import Component
-from ..utils.localization import get_string
+from .dependency import DependencyGraph
+from .plugins import discover_plugins, load_plugin
+from ..utils.cache import get_cache_dir
+from ..utils.localization import get_string, get_language, get_locale_file
+from ..utils.trace import traced
 from ..utils.logger import get_logger
-from ..utils.ui import display_error
+from ..utils.ui import display_error, display_warning
+
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
 
 
 class ComponentRegistry:
@@ -25,14 +37,29 @@ class ComponentRegistry:
         self.components_dir = components_dir
         self.component_classes: Dict[str, Type[Component]] = {}
         self.component_instances: Dict[str, Component] = {}
+        # Instances shared by all callers asking for the same directory
+        self._instance_pool: Dict[Tuple[Type[Component], Path], Component] = {}
         self.dependency_graph: Dict[str, Set[str]] = {}
+        self._graph = DependencyGraph({})
+        # name -> {"module", "class", "metadata", "dependencies"}
+        self.manifest: Dict[str, Dict[str, Any]] = {}
+        self.manifest_loaded = False
         self._discovered = False
+        self._scan_errors = 0
         self.logger = get_logger("superclaude.registry")
     
+    @traced("registry.discover", "registry")
     def discover_components(self, force_reload: bool = False) -> None:
         """
         Auto-discover all component classes in components directory
         
+        Entry points in the "superclaude.components" group (component
+        packs installed as separate distributions) are discovered too.
+        Discovery is answered from the cached manifest when the component
+        sources, installed plugins and the locale file are unchanged;
+        component modules are then only imported when a class or instance
+        is requested.
+        
         Args:
             force_reload: Force rediscovery even if already done
         """
@@ -41,23 +68,136 @@ class ComponentRegistry:
         
         self.component_classes.clear()
         self.component_instances.clear()
+        self._instance_pool.clear()
         self.dependency_graph.clear()
+        self.manifest.clear()
+        self.manifest_loaded = False
         
-        if not self.components_dir.exists():
-            return
+        plugins = discover_plugins()
+        fingerprint = self._source_fingerprint(plugins)
+        manifest_path = self._manifest_path()
+        
+        if not force_reload and fingerprint is not None and manifest_path is not None:
+            entries = self._read_manifest(manifest_path, fingerprint)
+            if entries is not None:
+                self.manifest.update(entries)
+                self.manifest_loaded = True
         
-        # Discover all Python files in components directory
-        for py_file in self.components_dir.glob("*.py"):
-            if py_file.name.startswith("__"):
-                continue
+        if not self.manifest_loaded:
+            self._scan_errors = 0
             
-            module_name = py_file.stem
-            self._load_component_module(module_name)
+            # Discover all Python files in components directory
+            if self.components_dir.exists():
+                for py_file in self.components_dir.glob("*.py"):
+                    if py_file.name.startswith("__"):
+                        continue
+                    
+                    module_name = py_file.stem
+                    self._load_component_module(module_name)
+            
+            # Component packs installed as separate distributions
+            for entry in plugins:
+                self._load_plugin_component(entry)
+            
+            # A scan with errors is not cached so the errors are reported again
+            if fingerprint is not None and manifest_path is not None and not self._scan_errors:
+                self._write_manifest(manifest_path, fingerprint)
         
         # Build dependency graph
         self._build_dependency_graph()
         self._discovered = True
     
+    def _source_fingerprint(self, plugins: List[Dict[str, str]]) -> Optional[Dict[str, List[Any]]]:
+        """
+        Identity of everything the manifest is derived from
+        
+        Args:
+            plugins: Plugin entry points from discover_plugins()
+            
+        Returns:
+            Mapping of file name to [mtime_ns, size] (and plugin entry point
+            to [target, distribution, version]), or None if a file cannot be
+            inspected (the manifest is then not used)
+        """
+        fingerprint: Dict[str, List[Any]] = {}
+        try:
+            for py_file in self.components_dir.glob("*.py"):
+                stat = py_file.stat()
+                fingerprint[py_file.name] = [stat.st_mtime_ns, stat.st_size]
+            
+            for entry in plugins:
+                fingerprint[f"plugin:{entry['name']}"] = [entry["value"], entry["dist"], entry["version"]]
+            
+            # Descriptions in the metadata are translated
+            locale_file = get_locale_file()
+            if locale_file:
+                stat = os.stat(locale_file)
+                fingerprint[f"locale:{get_language()}"] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            return None
+        return fingerprint
+    
+    def _manifest_path(self) -> Optional[Path]:
+        """Location of the manifest for this components directory"""
+        cache_dir = get_cache_dir("registry")
+        if cache_dir is None:
+            return None
+        digest = hashlib.sha1(str(self.components_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+        return cache_dir / f"components-{get_language()}-{digest}.json"
+    
+    def _read_manifest(self, manifest_path: Path, fingerprint: Dict[str, List[Any]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load manifest entries if the manifest matches the current sources
+        
+        Args:
+            manifest_path: Manifest file
+            fingerprint: Current source fingerprint
+            
+        Returns:
+            Component entries or None if missing, stale or unreadable
+        """
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if (not isinstance(data, dict) or
+                data.get("version") != MANIFEST_VERSION or
+                data.get("sources") != fingerprint or
+                not isinstance(data.get("components"), dict)):
+            return None
+        
+        return data["components"]
+    
+    def _write_manifest(self, manifest_path: Path, fingerprint: Dict[str, List[Any]]) -> None:
+        """
+        Save the discovered components for later runs
+        
+        Args:
+            manifest_path: Manifest file
+            fingerprint: Source fingerprint the entries were built from
+        """
+        data = {
+            "version": MANIFEST_VERSION,
+            "sources": fingerprint,
+            "components": self.manifest
+        }
+        
+        # Write to a temporary name first so concurrent runs never read a
+        # partially written manifest
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, manifest_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write component manifest: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
     def _load_component_module(self, module_name: str) -> None:
         """
         Load component classes from a module
@@ -82,32 +222,85 @@ class ComponentRegistry:
                         metadata = instance.get_metadata()
                         component_name = metadata["name"]
                         
+                        try:
+                            dependencies = list(instance.get_dependencies())
+                        except Exception as e:
+                            self.logger.exception(f"Failed to get dependencies for {component_name}: {e}")
+                            display_error(get_string("registry.error.get_deps", component_name, e))
+                            self._scan_errors += 1
+                            dependencies = []
+                        
                         self.component_classes[component_name] = obj
                         self.component_instances[component_name] = instance
+                        self._instance_pool[(obj, instance.install_dir)] = instance
+                        self.manifest[component_name] = {
+                            "module": obj.__module__,
+                            "class": obj.__qualname__,
+                            "metadata": metadata,
+                            "dependencies": dependencies
+                        }
                         
                     except Exception as e:
                         self.logger.exception(f"Failed to instantiate component {name}: {e}")
                         display_error(get_string("registry.error.instantiate", name, e))
+                        self._scan_errors += 1
         
         except Exception as e:
             self.logger.exception(f"Failed to load module {module_name}: {e}")
             display_error(get_string("registry.error.load_module", module_name, e))
+            self._scan_errors += 1
+    
+    def _load_plugin_component(self, entry: Dict[str, str]) -> None:
+        """
+        Load a component class published through an entry point
+        
+        Built-in components win over plugins with the same name.
+        
+        Args:
+            entry: Entry point from discover_plugins()
+        """
+        try:
+            component_class = load_plugin(entry)
+            instance = component_class()
+            metadata = instance.get_metadata()
+            component_name = metadata["name"]
+            dependencies = list(instance.get_dependencies())
+        except Exception as e:
+            self.logger.exception(f"Failed to load component plugin {entry['value']}: {e}")
+            display_error(get_string("registry.error.load_plugin", entry["value"], e))
+            self._scan_errors += 1
+            return
+        
+        if component_name in self.manifest:
+            display_warning(get_string("registry.warning.plugin_conflict",
+                                       entry["value"], entry["dist"], component_name))
+            return
+        
+        self.component_classes[component_name] = component_class
+        self.component_instances[component_name] = instance
+        self._instance_pool[(component_class, instance.install_dir)] = instance
+        self.manifest[component_name] = {
+            "module": component_class.__module__,
+            "class": component_class.__qualname__,
+            "metadata": metadata,
+            "dependencies": dependencies,
+            "plugin": entry["dist"]
+        }
     
     def _build_dependency_graph(self) -> None:
         """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
-            try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                self.logger.exception(f"Failed to get dependencies for {name}: {e}")
-                display_error(get_string("registry.error.get_deps", name, e))
-                self.dependency_graph[name] = set()
+        for name, entry in self.manifest.items():
+            self.dependency_graph[name] = set(entry.get("dependencies", []))
+        self._graph = DependencyGraph({
+            name: entry.get("dependencies", []) for name, entry in self.manifest.items()
+        })
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
         Get component class by name
         
+        Classes known only from the manifest are imported on first use.
+        
         Args:
             component_name: Name of component
             
@@ -115,33 +308,76 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        
+        component_class = self.component_classes.get(component_name)
+        if component_class is not None:
+            return component_class
+        
+        entry = self.manifest.get(component_name)
+        if entry is None:
+            return None
+        
+        try:
+            component_class = importlib.import_module(entry["module"])
+            for attribute in entry["class"].split("."):
+                component_class = getattr(component_class, attribute)
+        except Exception as e:
+            self.logger.exception(f"Failed to load module {entry.get('module')}: {e}")
+            display_error(get_string("registry.error.load_module", entry.get("module"), e))
+            return None
+        
+        self.component_classes[component_name] = component_class
+        return component_class
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
         Get component instance by name
         
+        Instances are created on first request and pooled per installation
+        directory, so repeated calls return the same object.
+        
         Args:
             component_name: Name of component
-            install_dir: Installation directory (creates new instance with this dir)
+            install_dir: Installation directory (defaults to the component default)
             
         Returns:
             Component instance or None if not found
         """
         self.discover_components()
         
+        if install_dir is None:
+            instance = self.component_instances.get(component_name)
+            if instance is not None:
+                return instance
+        
+        component_class = self.get_component_class(component_name)
+        if component_class is None:
+            return None
+        
         if install_dir is not None:
-            # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
-            if component_class:
-                try:
-                    return component_class(install_dir)
-                except Exception as e:
-                    self.logger.exception(f"Failed to create instance of {component_name}: {e}")
-                    display_error(get_string("registry.error.create_instance", component_name, e))
-                    return None
-        
-        return self.component_instances.get(component_name)
+            key = (component_class, Path(install_dir))
+        else:
+            from .. import DEFAULT_INSTALL_DIR
+            key = (component_class, DEFAULT_INSTALL_DIR)
+        
+        instance = self._instance_pool.get(key)
+        if instance is None:
+            try:
+                instance = component_class(install_dir) if install_dir is not None else component_class()
+            except Exception as e:
+                self.logger.exception(f"Failed to create instance of {component_name}: {e}")
+                display_error(get_string("registry.error.create_instance", component_name, e))
+                return None
+            self._instance_pool[key] = instance
+        
+        if install_dir is None:
+            self.component_instances[component_name] = instance
+        return instance
+    
+    def clear_instance_pool(self) -> None:
+        """Drop all pooled instances; the next request creates fresh ones"""
+        self._instance_pool.clear()
+        self.component_instances.clear()
     
     def list_components(self) -> List[str]:
         """
@@ -151,7 +387,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.manifest.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -164,13 +400,10 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
-        return None
+        entry = self.manifest.get(component_name)
+        if entry is None:
+            return None
+        return copy.deepcopy(entry["metadata"])
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
@@ -186,34 +419,8 @@ class ComponentRegistry:
             ValueError: If circular dependencies detected or unknown component
         """
         self.discover_components()
-        
-        resolved = []
-        resolving = set()
-        
-        def resolve(name: str):
-            if name in resolved:
-                return
-                
-            if name in resolving:
-                raise ValueError(get_string("registry.error.circular_dependency", name))
-                
-            if name not in self.dependency_graph:
-                raise ValueError(get_string("registry.error.unknown_component", name))
-                
-            resolving.add(name)
-            
-            # Resolve dependencies first
-            for dep in self.dependency_graph[name]:
-                resolve(dep)
-                
-            resolving.remove(name)
-            resolved.append(name)
-        
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
-            
-        return resolved
+        order, _ = self._graph.resolve(component_names)
+        return order
     
     def get_dependencies(self, component_name: str) -> Set[str]:
         """
@@ -265,11 +472,9 @@ class ComponentRegistry:
                 errors.append(get_string("registry.error.missing_deps", name, missing_deps))
         
         # Check for circular dependencies
-        for name in all_components:
-            try:
-                self.resolve_dependencies([name])
-            except ValueError as e:
-                errors.append(str(e))
+        for cycle in self._graph.find_cycles():
+            errors.append(get_string("registry.error.circular_dependency",
+                                     DependencyGraph.format_cycles([cycle])))
         
         return errors
     
@@ -286,13 +491,9 @@ class ComponentRegistry:
         self.discover_components()
         components = []
         
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
+        for name, entry in self.manifest.items():
+            if entry["metadata"].get("category") == category:
+                components.append(name)
         
         return components
     
@@ -309,30 +510,7 @@ class ComponentRegistry:
         """
         self.discover_components()
         
-        # Get all components including dependencies
-        all_components = set(self.resolve_dependencies(component_names))
-        
-        # Group by dependency level
-        levels = []
-        remaining = all_components.copy()
-        
-        while remaining:
-            # Find components with no unresolved dependencies
-            current_level = []
-            for name in list(remaining):
-                deps = self.dependency_graph.get(name, set())
-                unresolved_deps = deps & remaining
-                
-                if not unresolved_deps:
-                    current_level.append(name)
-            
-            if not current_level:
-                # This shouldn't happen if dependency graph is valid
-                raise ValueError(get_string("registry.error.circular_dependency_order"))
-            
-            levels.append(current_level)
-            remaining -= set(current_level)
-        
+        _, levels = self._graph.resolve(component_names)
         return levels
     
     def create_component_instances(self, component_names: List[str], install_dir: Optional[Path] = None) -> Dict[str, Component]:
@@ -369,20 +547,15 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, entry in self.manifest.items():
+            category = entry["metadata"].get("category", "unknown")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.manifest),
+            "from_manifest": self.manifest_loaded,
             "categories": categories,
             "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
             "validation_errors": self.validate_dependency_graph()
@@ -0,0 +1,201 @@
+"""
+Per-file update planning
+
+Installs record the hash, size and modification time of every file they
+write in the component's metadata registration ("files", keyed by the path
+relative to the installation directory). An update plan compares three
+states of each file: what the source would install now, what is on disk,
+and what was recorded at install time. That tells apart files the new
+source changes from files the user edited locally, and finds files the
+source no longer ships, so an update only has to touch the files that
+actually differ.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils.hashing import DEFAULT_ALGORITHM, hash_bytes
+
+ADD = "add"
+MODIFY = "modify"
+DELETE = "delete"
+UNCHANGED = "unchanged"
+
+ACTIONS = (ADD, MODIFY, DELETE, UNCHANGED)
+
+# Key of the file hashes in a component registration
+MANIFEST_KEY = "files"
+
+# Algorithm of manifest records that do not name one
+LEGACY_ALGORITHM = "sha256"
+
+
+def hash_content(content: str) -> str:
+    """Hash of generated file content, comparable to get_file_hash(path, DEFAULT_ALGORITHM)"""
+    return hash_bytes(content.encode("utf-8"))
+
+
+def record_algorithm(record: Dict[str, Any]) -> str:
+    """Hash algorithm of a manifest record"""
+    return record.get("algorithm", LEGACY_ALGORITHM)
+
+
+def _matches_record(component, target: Path, record: Dict[str, Any], current_hash: str) -> bool:
+    """Whether a file still has the content recorded at install time"""
+    algorithm = record_algorithm(record)
+    if algorithm != DEFAULT_ALGORITHM:
+        current_hash = component.file_manager.get_file_hash(target, algorithm)
+    return current_hash == record.get("hash")
+
+
+def relative_path(path: Path, install_dir: Path) -> str:
+    """Manifest key of an installed file"""
+    try:
+        return path.relative_to(install_dir).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def build_manifest(component) -> Dict[str, Dict[str, Any]]:
+    """
+    Hash the files a component has installed
+
+    Args:
+        component: Installed component
+
+    Returns:
+        Relative path -> {"hash", "algorithm", "size", "mtime" (ns)} for
+        every installed file that exists
+    """
+    manifest: Dict[str, Dict[str, Any]] = {}
+    targets = [target for _, target in component.get_files_to_install()]
+    hashes = component.file_manager.hash_files(targets)
+    for target in targets:
+        file_hash = hashes[target]
+        if file_hash is None:
+            continue
+        stat = target.stat()
+        manifest[relative_path(target, component.install_dir)] = {
+            "hash": file_hash,
+            "algorithm": DEFAULT_ALGORITHM,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns
+        }
+    return manifest
+
+
+def record_installed_files(component) -> None:
+    """
+    Store the manifest of a component in its metadata registration
+
+    Called after the component registered itself; components that do not
+    register (or install nothing) are left alone.
+
+    Args:
+        component: Installed component
+    """
+    name = component.get_metadata()["name"]
+    settings_manager = component.settings_manager
+    metadata = settings_manager.load_metadata()
+    registration = metadata.get("components", {}).get(name)
+    if registration is None:
+        return
+    registration[MANIFEST_KEY] = build_manifest(component)
+    settings_manager.save_metadata(metadata)
+
+
+def plan_component_update(component) -> Dict[str, Any]:
+    """
+    Compare the installed files of a component with its source
+
+    Per file:
+        add        shipped by the source, missing on disk
+        modify     on disk, but differs from what the source installs
+        delete     recorded at install time, no longer shipped
+        unchanged  on disk as the source would install it
+
+    A file whose content differs from the recorded hash was edited locally
+    (local_edit). Installations without a manifest have no record, so local
+    edits cannot be told apart from source changes there.
+
+    Args:
+        component: Component bound to the installation directory
+
+    Returns:
+        Dict with component, current (installed version), available
+        (source version), files ([{"path", "action", "source", "target",
+        "local_edit"}] sorted by path), counts per action, local_edits and
+        errors (unreadable source files)
+    """
+    metadata = component.get_metadata()
+    name = metadata["name"]
+    install_dir = component.install_dir
+    registration = component.settings_manager.get_installed_components().get(name, {})
+    recorded = registration.get(MANIFEST_KEY) or {}
+
+    files: List[Dict[str, Any]] = []
+    errors: List[str] = []
+    expected = component.get_source_hashes()
+    files_to_install = component.get_files_to_install()
+    removed = {path: install_dir / path for path in recorded}
+    installed = component.file_manager.hash_files(
+        [target for _, target in files_to_install] + list(removed.values()))
+    shipped = set()
+    for source, target in files_to_install:
+        path = relative_path(target, install_dir)
+        shipped.add(path)
+        source_hash = expected.get(target)
+        if source_hash is None:
+            errors.append(str(source))
+            continue
+
+        installed_hash = installed[target]
+        record = recorded.get(path)
+        local_edit = (record is not None and installed_hash is not None
+                      and not _matches_record(component, target, record, installed_hash))
+        if installed_hash is None:
+            action = ADD
+        elif installed_hash == source_hash:
+            action = UNCHANGED
+        else:
+            action = MODIFY
+        files.append({"path": path, "action": action, "source": source, "target": target,
+                      "local_edit": local_edit})
+
+    for path, record in recorded.items():
+        if path in shipped:
+            continue
+        target = removed[path]
+        installed_hash = installed[target]
+        if installed_hash is None:
+            continue
+        files.append({"path": path, "action": DELETE, "source": None, "target": target,
+                      "local_edit": not _matches_record(component, target, record, installed_hash)})
+
+    files.sort(key=lambda entry: entry["path"])
+    counts = {action: 0 for action in ACTIONS}
+    for entry in files:
+        counts[entry["action"]] += 1
+
+    return {
+        "component": name,
+        "current": registration.get("version"),
+        "available": metadata.get("version"),
+        "files": files,
+        "counts": counts,
+        "local_edits": sum(1 for entry in files if entry["local_edit"] and entry["action"] != UNCHANGED),
+        "errors": errors
+    }
+
+
+def has_changes(plan: Optional[Dict[str, Any]]) -> bool:
+    """True if applying the plan would add, modify or delete a file"""
+    if not plan:
+        return False
+    counts = plan["counts"]
+    return bool(counts[ADD] or counts[MODIFY] or counts[DELETE])
+
+
+def changed_files(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Entries of the plan that have to be written or removed"""
+    return [entry for entry in plan["files"] if entry["action"] != UNCHANGED]
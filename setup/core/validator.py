@@ -51,6 +51,8 @@ except ImportError:
 
 
 from ..utils.localization import get_string
+from ..utils.runner import run_command, VERSION_CHECK_TTL
+from ..utils.trace import traced
 
 class Validator:
     """System requirements validator"""
@@ -100,6 +102,7 @@ class Validator:
             self.validation_cache[cache_key] = result
             return result
     
+    @traced("validator.check_node", "validator")
     def check_node(self, min_version: str = "16.0", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
         Check Node.js version requirements
@@ -117,11 +120,11 @@ class Validator:
         
         try:
             # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
+            result = run_command(
                 ['node', '--version'],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                cache_ttl=VERSION_CHECK_TTL,
                 shell=(sys.platform == "win32")
             )
             
@@ -169,6 +172,7 @@ class Validator:
             self.validation_cache[cache_key] = result_tuple
             return result_tuple
     
+    @traced("validator.check_claude_cli", "validator")
     def check_claude_cli(self, min_version: Optional[str] = None) -> Tuple[bool, str]:
         """
         Check Claude CLI installation and version
@@ -185,11 +189,11 @@ class Validator:
         
         try:
             # Check if claude is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
+            result = run_command(
                 ['claude', '--version'],
                 capture_output=True,
                 text=True,
-                timeout=10,
+                cache_ttl=VERSION_CHECK_TTL,
                 shell=(sys.platform == "win32")
             )
             
@@ -234,6 +238,7 @@ class Validator:
             self.validation_cache[cache_key] = result_tuple
             return result_tuple
     
+    @traced("validator.check_external_tool", "validator")
     def check_external_tool(self, tool_name: str, command: str, min_version: Optional[str] = None) -> Tuple[bool, str]:
         """
         Check external tool availability and version
@@ -254,11 +259,11 @@ class Validator:
             # Split command into parts
             cmd_parts = command.split()
             
-            result = subprocess.run(
+            result = run_command(
                 cmd_parts,
                 capture_output=True,
                 text=True,
-                timeout=10,
+                cache_ttl=VERSION_CHECK_TTL,
                 shell=(sys.platform == "win32")
             )
             
@@ -374,6 +379,7 @@ class Validator:
             self.validation_cache[cache_key] = result
             return result
     
+    @traced("validator.validate_requirements", "validator")
     def validate_requirements(self, requirements: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate all system requirements
@@ -577,6 +583,7 @@ class Validator:
         
         return get_string("validator.help.no_instructions_platform", tool_name, platform)
     
+    @traced("validator.diagnose_system", "validator")
     def diagnose_system(self) -> Dict[str, Any]:
         """
         Perform comprehensive system diagnostics
@@ -652,11 +659,10 @@ class Validator:
             tool_found = False
             for tool in tool_alternatives:
                 try:
-                    result = subprocess.run(
+                    result = run_command(
                         ["which" if sys.platform != "win32" else "where", tool],
                         capture_output=True,
                         text=True,
-                        timeout=5,
                         shell=(sys.platform == "win32")
                     )
                     if result.returncode == 0:
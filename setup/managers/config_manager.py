@@ -2,15 +2,19 @@
 Configuration management for SuperClaude installation system
 """
 
+import copy
 import json
-from typing import Dict, Any, List, Optional
+import os
+import re
+import threading
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from pathlib import Path
 from ..utils.localization import get_string
 
-# Handle jsonschema import - if not available, use basic validation
+# Handle jsonschema import - if not available, use the built-in validator
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema import ValidationError
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
@@ -21,141 +25,318 @@ except ImportError:
             self.message = message
             super().__init__(message)
 
-    def validate(instance, schema):
-        """Dummy validation function"""
-        # Basic type checking only
-        if "type" in schema:
-            expected_type = schema["type"]
-            if expected_type == "object" and not isinstance(instance, dict):
-                raise ValidationError(get_string("config.error.expected_object", type(instance).__name__))
-            elif expected_type == "array" and not isinstance(instance, list):
-                raise ValidationError(get_string("config.error.expected_array", type(instance).__name__))
-            elif expected_type == "string" and not isinstance(instance, str):
-                raise ValidationError(get_string("config.error.expected_string", type(instance).__name__))
-            elif expected_type == "integer" and not isinstance(instance, int):
-                raise ValidationError(get_string("config.error.expected_integer", type(instance).__name__))
-        # Skip detailed validation if jsonschema not available
 
-
-class ConfigManager:
-    """Manages configuration files and validation"""
-    
-    def __init__(self, config_dir: Path):
-        """
-        Initialize config manager
-        
-        Args:
-            config_dir: Directory containing configuration files
-        """
-        self.config_dir = config_dir
-        self.features_file = config_dir / "features.json"
-        self.requirements_file = config_dir / "requirements.json"
-        self._features_cache = None
-        self._requirements_cache = None
-        
-        # Schema for features.json
-        self.features_schema = {
+# Schema for features.json
+FEATURES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "components": {
             "type": "object",
-            "properties": {
-                "components": {
+            "patternProperties": {
+                "^[a-zA-Z_][a-zA-Z0-9_]*$": {
                     "type": "object",
-                    "patternProperties": {
-                        "^[a-zA-Z_][a-zA-Z0-9_]*$": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "version": {"type": "string"},
-                                "description": {"type": "string"},
-                                "category": {"type": "string"},
-                                "dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "enabled": {"type": "boolean"},
-                                "required_tools": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                }
-                            },
-                            "required": ["name", "version", "description", "category"],
-                            "additionalProperties": False
+                    "properties": {
+                        "name": {"type": "string"},
+                        "version": {"type": "string"},
+                        "description": {"type": "string"},
+                        "category": {"type": "string"},
+                        "dependencies": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        },
+                        "enabled": {"type": "boolean"},
+                        "required_tools": {
+                            "type": "array",
+                            "items": {"type": "string"}
                         }
-                    }
+                    },
+                    "required": ["name", "version", "description", "category"],
+                    "additionalProperties": False
                 }
-            },
-            "required": ["components"],
-            "additionalProperties": False
+            }
         }
-        
-        # Schema for requirements.json
-        self.requirements_schema = {
+    },
+    "required": ["components"],
+    "additionalProperties": False
+}
+
+# Schema for requirements.json
+REQUIREMENTS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "python": {
             "type": "object",
             "properties": {
-                "python": {
-                    "type": "object",
-                    "properties": {
-                        "min_version": {"type": "string"},
-                        "max_version": {"type": "string"}
-                    },
-                    "required": ["min_version"]
-                },
-                "node": {
+                "min_version": {"type": "string"},
+                "max_version": {"type": "string"}
+            },
+            "required": ["min_version"]
+        },
+        "node": {
+            "type": "object",
+            "properties": {
+                "min_version": {"type": "string"},
+                "max_version": {"type": "string"},
+                "required_for": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                }
+            },
+            "required": ["min_version"]
+        },
+        "disk_space_mb": {"type": "integer"},
+        "external_tools": {
+            "type": "object",
+            "patternProperties": {
+                "^[a-zA-Z_][a-zA-Z0-9_-]*$": {
                     "type": "object",
                     "properties": {
+                        "command": {"type": "string"},
                         "min_version": {"type": "string"},
-                        "max_version": {"type": "string"},
                         "required_for": {
                             "type": "array",
                             "items": {"type": "string"}
-                        }
+                        },
+                        "optional": {"type": "boolean"}
                     },
-                    "required": ["min_version"]
-                },
-                "disk_space_mb": {"type": "integer"},
-                "external_tools": {
+                    "required": ["command"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "installation_commands": {
+            "type": "object",
+            "patternProperties": {
+                "^[a-zA-Z_][a-zA-Z0-9_-]*$": {
                     "type": "object",
-                    "patternProperties": {
-                        "^[a-zA-Z_][a-zA-Z0-9_-]*$": {
-                            "type": "object",
-                            "properties": {
-                                "command": {"type": "string"},
-                                "min_version": {"type": "string"},
-                                "required_for": {
-                                    "type": "array",
-                                    "items": {"type": "string"}
-                                },
-                                "optional": {"type": "boolean"}
-                            },
-                            "required": ["command"],
-                            "additionalProperties": False
-                        }
-                    }
-                },
-                "installation_commands": {
+                    "properties": {
+                        "linux": {"type": "string"},
+                        "darwin": {"type": "string"},
+                        "win32": {"type": "string"},
+                        "all": {"type": "string"},
+                        "description": {"type": "string"}
+                    },
+                    "additionalProperties": False
+                }
+            }
+        }
+    },
+    "required": ["python", "disk_space_mb"],
+    "additionalProperties": False
+}
+
+# Schema for the optional "core" section of profiles: Core files to leave
+# out and, per file, heading patterns of sections to drop or keep
+PROFILE_CORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "exclude": {
+            "type": "array",
+            "items": {"type": "string"}
+        },
+        "sections": {
+            "type": "object",
+            "patternProperties": {
+                "^[A-Za-z0-9_.-]+\\.md$": {
                     "type": "object",
-                    "patternProperties": {
-                        "^[a-zA-Z_][a-zA-Z0-9_-]*$": {
-                            "type": "object",
-                            "properties": {
-                                "linux": {"type": "string"},
-                                "darwin": {"type": "string"},
-                                "win32": {"type": "string"},
-                                "all": {"type": "string"},
-                                "description": {"type": "string"}
-                            },
-                            "additionalProperties": False
+                    "properties": {
+                        "drop": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        },
+                        "keep": {
+                            "type": "array",
+                            "items": {"type": "string"}
                         }
-                    }
+                    },
+                    "additionalProperties": False
                 }
             },
-            "required": ["python", "disk_space_mb"],
             "additionalProperties": False
         }
+    },
+    "additionalProperties": False
+}
+
+
+# Validators compiled from schemas, keyed by id(schema). The schema is kept
+# in the value so the id cannot be reused while the entry exists.
+_compiled_schemas: Dict[int, Tuple[Dict[str, Any], Callable[[Any], None]]] = {}
+
+# Parsed configuration shared by all ConfigManager instances:
+# (kind, path) -> ((mtime_ns, size), data)
+_config_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+_config_lock = threading.RLock()
+
+_TYPE_CHECKS = {
+    "object": (lambda v: isinstance(v, dict), "config.error.expected_object"),
+    "array": (lambda v: isinstance(v, list), "config.error.expected_array"),
+    "string": (lambda v: isinstance(v, str), "config.error.expected_string"),
+    "integer": (lambda v: isinstance(v, int) and not isinstance(v, bool), "config.error.expected_integer"),
+    "boolean": (lambda v: isinstance(v, bool), "config.error.expected_boolean"),
+}
+
+
+def _compile_node(schema: Dict[str, Any], where: str) -> Callable[[Any], None]:
+    """
+    Build a validator closure for the schema subset used by the config files
+
+    Supports type, properties, patternProperties, additionalProperties
+    (false), required and items. Everything is resolved once, so validating
+    a document is a walk over plain closures.
+    """
+    checks: List[Callable[[Any], None]] = []
+
+    type_check = _TYPE_CHECKS.get(schema.get("type"))
+    if type_check is not None:
+        is_type, message_key = type_check
+
+        def check_type(value):
+            if not is_type(value):
+                raise ValidationError(f"{where}: " + get_string(message_key, type(value).__name__))
+        checks.append(check_type)
+
+    properties = {
+        name: _compile_node(sub, f"{where}.{name}")
+        for name, sub in schema.get("properties", {}).items()
+    }
+    patterns = [
+        (re.compile(pattern), _compile_node(sub, f"{where}.*"))
+        for pattern, sub in schema.get("patternProperties", {}).items()
+    ]
+    required = tuple(schema.get("required", ()))
+    closed = schema.get("additionalProperties", True) is False
+
+    if properties or patterns or required or closed:
+        def check_object(value):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    raise ValidationError(get_string("config.error.missing_property", name, where))
+            for name, item in value.items():
+                validator = properties.get(name)
+                if validator is not None:
+                    validator(item)
+                    continue
+                matched = False
+                for regex, pattern_validator in patterns:
+                    if regex.search(name):
+                        matched = True
+                        pattern_validator(item)
+                if not matched and closed:
+                    raise ValidationError(get_string("config.error.unexpected_property", name, where))
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_validator = _compile_node(schema["items"], f"{where}[]")
+
+        def check_items(value):
+            if isinstance(value, list):
+                for item in value:
+                    item_validator(item)
+        checks.append(check_items)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value):
+        for check in checks:
+            check(value)
+    return check_all
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """
+    Get a reusable validator for a schema
+
+    Uses a prepared jsonschema validator when jsonschema is installed and
+    the built-in closure compiler otherwise. Compiled validators are cached.
+
+    Args:
+        schema: JSON schema
+
+    Returns:
+        Callable raising ValidationError for invalid documents
+    """
+    compiled = _compiled_schemas.get(id(schema))
+    if compiled is not None and compiled[0] is schema:
+        return compiled[1]
+
+    if JSONSCHEMA_AVAILABLE:
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator = validator_class(schema).validate
+    else:
+        validator = _compile_node(schema, "$")
+
+    _compiled_schemas[id(schema)] = (schema, validator)
+    return validator
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached(kind: str, path: Path, loader: Callable[[], Any]) -> Optional[Any]:
+    """
+    Load a configuration file through the process-wide cache
+
+    Args:
+        kind: Cache namespace (features, requirements, profile)
+        path: Configuration file
+        loader: Parses and validates the file
+
+    Returns:
+        A copy of the cached or freshly loaded data, None if the file does not
+        exist. Callers may modify it without affecting later loads.
+    """
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+
+    key = (kind, str(path))
+    with _config_lock:
+        cached = _config_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+        data = loader()
+        _config_cache[key] = (stamp, data)
+        return copy.deepcopy(data)
+
+
+def clear_config_cache() -> None:
+    """Forget all cached configuration files"""
+    with _config_lock:
+        _config_cache.clear()
+
+
+class ConfigManager:
+    """Manages configuration files and validation"""
+    
+    def __init__(self, config_dir: Path):
+        """
+        Initialize config manager
+        
+        Args:
+            config_dir: Directory containing configuration files
+        """
+        self.config_dir = config_dir
+        self.features_file = config_dir / "features.json"
+        self.requirements_file = config_dir / "requirements.json"
+        self.features_schema = FEATURES_SCHEMA
+        self.requirements_schema = REQUIREMENTS_SCHEMA
     
     def load_features(self) -> Dict[str, Any]:
         """
         Load and validate features configuration
         
+        Parsed once per process and reused until the file changes.
+        
         Returns:
             Features configuration dict
             
@@ -163,20 +344,19 @@ class ConfigManager:
             FileNotFoundError: If features.json not found
             ValidationError: If features.json is invalid
         """
-        if self._features_cache is not None:
-            return self._features_cache
-            
-        if not self.features_file.exists():
+        features = _load_cached("features", self.features_file, self._read_features)
+        if features is None:
             raise FileNotFoundError(get_string("config.error.features_not_found", self.features_file))
-        
+        return features
+    
+    def _read_features(self) -> Dict[str, Any]:
+        """Parse and validate features.json"""
         try:
             with open(self.features_file, 'r') as f:
                 features = json.load(f)
                 
             # Validate schema
-            validate(instance=features, schema=self.features_schema)
-            
-            self._features_cache = features
+            compile_schema(self.features_schema)(features)
             return features
             
         except json.JSONDecodeError as e:
@@ -188,6 +368,8 @@ class ConfigManager:
         """
         Load and validate requirements configuration
         
+        Parsed once per process and reused until the file changes.
+        
         Returns:
             Requirements configuration dict
             
@@ -195,20 +377,19 @@ class ConfigManager:
             FileNotFoundError: If requirements.json not found
             ValidationError: If requirements.json is invalid
         """
-        if self._requirements_cache is not None:
-            return self._requirements_cache
-            
-        if not self.requirements_file.exists():
+        requirements = _load_cached("requirements", self.requirements_file, self._read_requirements)
+        if requirements is None:
             raise FileNotFoundError(get_string("config.error.reqs_not_found", self.requirements_file))
-        
+        return requirements
+    
+    def _read_requirements(self) -> Dict[str, Any]:
+        """Parse and validate requirements.json"""
         try:
             with open(self.requirements_file, 'r') as f:
                 requirements = json.load(f)
                 
             # Validate schema
-            validate(instance=requirements, schema=self.requirements_schema)
-            
-            self._requirements_cache = requirements
+            compile_schema(self.requirements_schema)(requirements)
             return requirements
             
         except json.JSONDecodeError as e:
@@ -283,6 +464,9 @@ class ConfigManager:
         """
         Load installation profile
         
+        The file is parsed once per process; the component check runs on
+        every call because it depends on features.json.
+        
         Args:
             profile_path: Path to profile JSON file
             
@@ -293,32 +477,42 @@ class ConfigManager:
             FileNotFoundError: If profile not found
             ValidationError: If profile is invalid
         """
-        if not profile_path.exists():
+        profile = _load_cached("profile", profile_path, lambda: self._read_profile(profile_path))
+        if profile is None:
             raise FileNotFoundError(get_string("config.error.profile_not_found", profile_path))
         
+        # Validate that all components exist
+        features = self.load_features()
+        available_components = set(features.get("components", {}).keys())
+        
+        for component in profile["components"]:
+            if component not in available_components:
+                raise ValidationError(get_string("config.error.unknown_component_in_profile", component))
+        
+        return profile
+    
+    def _read_profile(self, profile_path: Path) -> Dict[str, Any]:
+        """Parse a profile and check its structure"""
         try:
             with open(profile_path, 'r') as f:
                 profile = json.load(f)
-                
-            # Basic validation
-            if "components" not in profile:
-                raise ValidationError(get_string("config.error.profile_missing_components"))
-                
-            if not isinstance(profile["components"], list):
-                raise ValidationError(get_string("config.error.profile_components_not_list"))
-            
-            # Validate that all components exist
-            features = self.load_features()
-            available_components = set(features.get("components", {}).keys())
-            
-            for component in profile["components"]:
-                if component not in available_components:
-                    raise ValidationError(get_string("config.error.unknown_component_in_profile", component))
-            
-            return profile
-            
         except json.JSONDecodeError as e:
             raise ValidationError(get_string("config.error.invalid_json", profile_path, e))
+        
+        # Basic validation
+        if "components" not in profile:
+            raise ValidationError(get_string("config.error.profile_missing_components"))
+            
+        if not isinstance(profile["components"], list):
+            raise ValidationError(get_string("config.error.profile_components_not_list"))
+
+        if "core" in profile:
+            try:
+                compile_schema(PROFILE_CORE_SCHEMA)(profile["core"])
+            except ValidationError as e:
+                raise ValidationError(get_string("config.error.invalid_profile_core", e.message))
+        
+        return profile
     
     def get_system_requirements(self) -> Dict[str, Any]:
         """
@@ -395,6 +589,7 @@ class ConfigManager:
         return errors
     
     def clear_cache(self) -> None:
-        """Clear cached configuration data"""
-        self._features_cache = None
-        self._requirements_cache = None
\ No newline at end of file
+        """Clear cached configuration data for this config directory"""
+        with _config_lock:
+            _config_cache.pop(("features", str(self.features_file)), None)
+            _config_cache.pop(("requirements", str(self.requirements_file)), None)
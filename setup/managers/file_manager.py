@@ -7,8 +7,9 @@ import stat
 from typing import List, Optional, Callable, Dict, Any
 from pathlib import Path
 import fnmatch
-import hashlib
+from ..utils.hashing import DEFAULT_ALGORITHM, get_hash_service
 from ..utils.localization import get_string
+from ..utils.trace import traced
 from ..utils.logger import get_logger
 from ..utils.ui import display_info, display_error, display_warning
 
@@ -28,6 +29,7 @@ class FileManager:
         self.created_dirs: List[Path] = []
         self.logger = get_logger("superclaude.filemanager")
         
+    @traced("file.copy", "file")
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
         Copy single file with permission preservation
@@ -67,7 +69,35 @@ class FileManager:
             self.logger.exception(f"Failed to copy file {source} -> {target}: {e}")
             display_error(get_string("file.error.copy_file_error", source, target, e))
             return False
-    
+
+    @traced("file.write", "file")
+    def write_text(self, target: Path, content: str) -> bool:
+        """
+        Write generated text to a file
+
+        Args:
+            target: Target file path
+            content: File content (written as UTF-8)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.dry_run:
+            display_info(get_string("file.dry_run.write_file", target))
+            return True
+
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding="utf-8")
+            self.copied_files.append(target)
+            return True
+
+        except Exception as e:
+            self.logger.exception(f"Failed to write file {target}: {e}")
+            display_error(get_string("file.error.write_file_error", target, e))
+            return False
+
+    @traced("file.copy_directory", "file")
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -274,33 +304,46 @@ class FileManager:
         """
         Calculate file hash
         
+        Digests are cached per file identity (see setup.utils.hashing).
+        
         Args:
             file_path: Path to file
-            algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+            algorithm: Hash algorithm (sha256, blake2b, md5, etc.)
             
         Returns:
             Hex hash string or None if error
         """
-        if not file_path.exists() or not file_path.is_file():
+        try:
+            return get_hash_service(algorithm).hash_file(file_path)
+        except ValueError:
             return None
+    
+    def hash_files(self, file_paths: List[Path], algorithm: str = DEFAULT_ALGORITHM, use_cache: bool = True,
+                   max_workers: Optional[int] = None) -> Dict[Path, Optional[str]]:
+        """
+        Calculate the hashes of many files on a thread pool
         
-        try:
-            hasher = hashlib.new(algorithm)
-            
-            with open(file_path, 'rb') as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
-            
-            return hasher.hexdigest()
+        Args:
+            file_paths: Files to hash
+            algorithm: Hash algorithm
+            use_cache: Reuse cached digests of files whose inode, mtime and
+                size did not change
+            max_workers: Hashing threads (default: up to 8)
             
-        except Exception:
-            return None
+        Returns:
+            Dict of path -> hex hash, None for missing or unreadable files
+        
+        Raises:
+            ValueError: If the algorithm is not supported
+        """
+        return get_hash_service(algorithm).hash_files(file_paths, use_cache, max_workers)
     
     def verify_file_integrity(self, file_path: Path, expected_hash: str, algorithm: str = 'sha256') -> bool:
         """
         Verify file integrity using hash
         
+        Always reads the file; cached digests are not trusted here.
+        
         Args:
             file_path: Path to file to verify
             expected_hash: Expected hash value
@@ -309,7 +352,10 @@ class FileManager:
         Returns:
             True if file matches expected hash, False otherwise
         """
-        actual_hash = self.get_file_hash(file_path, algorithm)
+        try:
+            actual_hash = get_hash_service(algorithm).hash_file(file_path, use_cache=False)
+        except ValueError:
+            return False
         return actual_hash is not None and actual_hash.lower() == expected_hash.lower()
     
     def get_directory_size(self, directory: Path) -> int:
@@ -11,6 +11,7 @@ from pathlib import Path
 from datetime import datetime
 import copy
 from ..utils.localization import get_string
+from ..utils.trace import traced
 
 
 class SettingsManager:
@@ -44,6 +45,7 @@ class SettingsManager:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(get_string("settings.error.load_settings", self.settings_file, e))
     
+    @traced("settings.save", "metadata")
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
         Save settings to settings.json with optional backup
@@ -82,6 +84,7 @@ class SettingsManager:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(get_string("settings.error.load_metadata", self.metadata_file, e))
     
+    @traced("metadata.save", "metadata")
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
         Save SuperClaude metadata to .superclaude-metadata.json
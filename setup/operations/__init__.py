@@ -13,10 +13,13 @@ Available operations:
 - update: Update existing SuperClaude installation
 - uninstall: Remove SuperClaude framework installation  
 - backup: Backup and restore SuperClaude installations
+- analyze_context: Report the token cost of installed framework files
+- commands: List and search installed slash commands
+- verify: Check installed files against the install manifest
 """
 
 __version__ = "3.0.0"
-__all__ = ["install", "update", "uninstall", "backup"]
+__all__ = ["install", "update", "uninstall", "backup", "analyze_context", "commands", "verify"]
 
 
 def get_operation_info():
@@ -41,6 +44,21 @@ def get_operation_info():
             "name": "backup",
             "description": "Backup and restore SuperClaude installations",
             "module": "setup.operations.backup"
+        },
+        "analyze-context": {
+            "name": "analyze-context",
+            "description": "Report the token cost of installed framework files",
+            "module": "setup.operations.analyze_context"
+        },
+        "commands": {
+            "name": "commands",
+            "description": "List and search installed slash commands",
+            "module": "setup.operations.commands"
+        },
+        "verify": {
+            "name": "verify",
+            "description": "Check installed files against the install manifest",
+            "module": "setup.operations.verify"
         }
     }
 
@@ -0,0 +1,214 @@
+"""
+SuperClaude Context Analysis Operation Module
+
+Reports how many tokens the installed framework files (Core docs and slash
+command definitions) add to every Claude session, which files and sections
+contribute most, and how that changed since a stored baseline.
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import PROJECT_ROOT
+from . import OperationBase
+from ..core.context import analyze_files, compare_reports, load_report, save_report
+from ..core.registry import ComponentRegistry
+from ..utils.tokens import DEFAULT_TOKENIZER, available_tokenizers
+from ..utils.ui import display_header, display_info, display_success, display_warning, display_table, format_size
+from ..utils.logger import get_logger
+from ..utils.localization import get_string
+
+# Components whose files are read into the session context
+CONTEXT_COMPONENTS = ["core", "commands"]
+
+
+class AnalyzeContextOperation(OperationBase):
+    """Context analysis operation implementation"""
+
+    def __init__(self):
+        super().__init__("analyze-context")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register context analysis CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "analyze-context",
+        help=get_string("analyze_context.parser.help"),
+        description=get_string("analyze_context.parser.description"),
+        epilog="""
+Examples:
+  SuperClaude analyze-context                        # Token report of the installation
+  SuperClaude analyze-context --top 20               # Show the 20 largest sections
+  SuperClaude analyze-context --source --save-baseline  # Record a baseline of the source tree
+  SuperClaude analyze-context --source --max-growth 5   # Fail if tokens grew more than 5%
+  SuperClaude analyze-context --json report.json     # Also write a machine-readable report
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument("--source", action="store_true", help=get_string("analyze_context.parser.source_help"))
+    parser.add_argument("--tokenizer", choices=available_tokenizers(), default=DEFAULT_TOKENIZER,
+                        help=get_string("analyze_context.parser.tokenizer_help"))
+    parser.add_argument("--top", type=int, default=10, help=get_string("analyze_context.parser.top_help"))
+    parser.add_argument("--baseline", type=Path, help=get_string("analyze_context.parser.baseline_help"))
+    parser.add_argument("--save-baseline", action="store_true", help=get_string("analyze_context.parser.save_baseline_help"))
+    parser.add_argument("--max-growth", type=float, metavar="PERCENT",
+                        help=get_string("analyze_context.parser.max_growth_help"))
+    parser.add_argument("--json", type=Path, metavar="FILE", help=get_string("analyze_context.parser.json_help"))
+
+    return parser
+
+
+def collect_context_files(registry: ComponentRegistry, install_dir: Path,
+                          source: bool = False) -> Tuple[Path, List[Tuple[str, str, Path]]]:
+    """
+    Files the context components installed (or would install)
+
+    Args:
+        registry: Discovered component registry
+        install_dir: Installation directory
+        source: Use the source files instead of the installed ones
+
+    Returns:
+        Tuple of (root directory, list of (component, label, path)) with
+        labels relative to the root
+    """
+    root = PROJECT_ROOT if source else install_dir
+    files = []
+    for name in CONTEXT_COMPONENTS:
+        component = registry.get_component_instance(name, install_dir)
+        if component is None:
+            continue
+        for source_path, target_path in component.get_files_to_install():
+            path = source_path if source else target_path
+            if not path.is_file():
+                continue
+            try:
+                label = path.relative_to(root).as_posix()
+            except ValueError:
+                label = str(path)
+            files.append((name, label, path))
+    return root, files
+
+
+def get_baseline_path(args: argparse.Namespace) -> Path:
+    """Baseline file given with --baseline, or the default one for the mode"""
+    if getattr(args, 'baseline', None):
+        return args.baseline
+    kind = "source" if getattr(args, 'source', False) else "installed"
+    return args.install_dir / "logs" / f"context-baseline-{kind}.json"
+
+
+def display_report(report: Dict[str, Any], comparison: Optional[Dict[str, Any]], top: int) -> None:
+    """Print the report as tables"""
+    totals = report["totals"]
+    display_info(get_string("analyze_context.report.totals", totals["files"],
+                            format_size(totals["bytes"]), totals["tokens"], report["tokenizer"]))
+
+    rows = []
+    for name, component in report["components"].items():
+        rows.append([name, component["files"], format_size(component["bytes"]), component["tokens"]])
+    display_table([get_string("analyze_context.report.component"), get_string("analyze_context.report.files"),
+                   get_string("analyze_context.report.size"), get_string("analyze_context.report.tokens")],
+                  rows, get_string("analyze_context.report.components_title"))
+
+    files = sorted(report["files"].items(), key=lambda item: item[1]["tokens"], reverse=True)
+    rows = []
+    for label, entry in files[:top]:
+        share = 100.0 * entry["tokens"] / totals["tokens"] if totals["tokens"] else 0.0
+        rows.append([label, format_size(entry["bytes"]), entry["tokens"], f"{share:.1f}%"])
+    display_table([get_string("analyze_context.report.file"), get_string("analyze_context.report.size"),
+                   get_string("analyze_context.report.tokens"), get_string("analyze_context.report.share")],
+                  rows, get_string("analyze_context.report.files_title", min(top, len(files))))
+
+    rows = []
+    for section in report["sections"][:top]:
+        heading = section["heading"] or get_string("analyze_context.report.preamble")
+        rows.append([section["file"], heading[:60], section["tokens"]])
+    display_table([get_string("analyze_context.report.file"), get_string("analyze_context.report.section"),
+                   get_string("analyze_context.report.tokens")],
+                  rows, get_string("analyze_context.report.sections_title", min(top, len(report["sections"]))))
+
+    if comparison is None:
+        return
+
+    growth = comparison["growth_percent"]
+    growth_text = f"{growth:+.1f}%" if growth is not None else "-"
+    display_info(get_string("analyze_context.report.growth", comparison["tokens_delta"], growth_text,
+                            comparison["baseline_created"]))
+    if comparison["tokenizer_mismatch"]:
+        display_warning(get_string("analyze_context.report.tokenizer_mismatch"))
+    rows = [[change["file"], change["status"], change["tokens_before"], change["tokens_after"], f"{change['delta']:+d}"]
+            for change in comparison["files"][:top]]
+    display_table([get_string("analyze_context.report.file"), get_string("analyze_context.report.status"),
+                   get_string("analyze_context.report.before"), get_string("analyze_context.report.after"),
+                   get_string("analyze_context.report.delta")],
+                  rows, get_string("analyze_context.report.changes_title"))
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute context analysis operation with parsed arguments"""
+    operation = AnalyzeContextOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        registry.discover_components()
+
+        root, files = collect_context_files(registry, args.install_dir, args.source)
+        if not files:
+            logger.error(get_string("analyze_context.run.no_files", root))
+            return 1
+
+        report = analyze_files(files, args.tokenizer, root)
+
+        baseline_path = get_baseline_path(args)
+        baseline = load_report(baseline_path)
+        comparison = compare_reports(report, baseline) if baseline else None
+
+        if not args.quiet:
+            display_header(get_string("analyze_context.run.header"), str(root))
+        display_report(report, comparison, args.top)
+        if baseline is None and not args.save_baseline:
+            display_info(get_string("analyze_context.run.no_baseline", baseline_path))
+
+        if args.json:
+            try:
+                save_report(dict(report, comparison=comparison), args.json)
+            except OSError as e:
+                logger.error(get_string("analyze_context.run.save_error", args.json, e))
+                return 1
+            display_success(get_string("analyze_context.run.report_saved", args.json))
+
+        if args.save_baseline:
+            try:
+                save_report(report, baseline_path)
+            except OSError as e:
+                logger.error(get_string("analyze_context.run.save_error", baseline_path, e))
+                return 1
+            display_success(get_string("analyze_context.run.baseline_saved", baseline_path))
+
+        if args.max_growth is not None and comparison and comparison["growth_percent"] is not None:
+            if comparison["growth_percent"] > args.max_growth:
+                logger.error(get_string("analyze_context.run.growth_exceeded",
+                                        f"{comparison['growth_percent']:.1f}", args.max_growth))
+                return 1
+
+        return 0
+
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    except Exception as e:
+        return operation.handle_operation_error("analyze-context", e)
@@ -3,7 +3,6 @@ SuperClaude Backup Operation Module
 Refactored from backup.py for unified CLI hub
 """
 
-import sys
 import time
 import tarfile
 import json
@@ -19,6 +18,7 @@ from ..utils.ui import (
 )
 from ..utils.logger import get_logger
 from ..utils.localization import get_string
+from ..utils.trace import traced
 from .. import DEFAULT_INSTALL_DIR
 from . import OperationBase
 
@@ -261,6 +261,7 @@ def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
     return metadata
 
 
+@traced("backup.create", "backup")
 def create_backup(args: argparse.Namespace) -> bool:
     """Create a new backup"""
     logger = get_logger()
@@ -321,7 +322,7 @@ def create_backup(args: argparse.Namespace) -> bool:
                         files_added += 1
                         
                         if files_added % 10 == 0:
-                            logger.debug(get_string("backup.create.added_files", files_added))
+                            logger.debug(logger.lazy("backup.create.added_files", files_added))
                             
                     except Exception as e:
                         logger.warning(get_string("backup.create.add_error", item, e))
@@ -341,6 +342,7 @@ def create_backup(args: argparse.Namespace) -> bool:
         return False
 
 
+@traced("backup.restore", "backup")
 def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
     """Restore from a backup file"""
     logger = get_logger()
@@ -394,7 +396,7 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
                     files_restored += 1
                     
                     if files_restored % 10 == 0:
-                        logger.debug(get_string("backup.restore.restored_files", files_restored))
+                        logger.debug(logger.lazy("backup.restore.restored_files", files_restored))
                         
                 except Exception as e:
                     logger.warning(get_string("backup.restore.error", member.name, e))
@@ -498,7 +500,7 @@ def run(args: argparse.Namespace) -> int:
         print(f"\n[✗] {get_string('install.run.invalid_path_header')}")
         print(f"    {get_string('install.run.invalid_path_expected', expected_home)}")
         print(f"    {get_string('install.run.invalid_path_provided', actual_dir)}")
-        sys.exit(1)
+        return 1
     
     try:
         # Validate global arguments
@@ -0,0 +1,109 @@
+"""
+SuperClaude Commands Operation Module
+
+Lists and searches the installed slash commands using the command index
+written by the commands component, so no command file is parsed.
+"""
+
+import argparse
+from typing import Any, Dict, List
+
+from .. import PROJECT_ROOT
+from . import OperationBase
+from ..core.command_index import INDEX_FILENAME, build_command_index, load_command_index, search_commands
+from ..utils.ui import display_header, display_info, display_warning, display_table, truncate_text, Colors
+from ..utils.localization import get_string
+
+
+class CommandsOperation(OperationBase):
+    """Commands listing operation implementation"""
+
+    def __init__(self):
+        super().__init__("commands")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register commands listing CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "commands",
+        help=get_string("commands_op.parser.help"),
+        description=get_string("commands_op.parser.description"),
+        epilog="""
+Examples:
+  SuperClaude commands                 # List installed slash commands
+  SuperClaude commands test            # Commands matching "test"
+  SuperClaude commands git --details   # Usage, flags and tools of matches
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument("query", nargs="*", help=get_string("commands_op.parser.query_help"))
+    parser.add_argument("--details", action="store_true", help=get_string("commands_op.parser.details_help"))
+
+    return parser
+
+
+def get_command_index(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Installed command index, or one built from the source files
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Command index dict
+    """
+    index = load_command_index(args.install_dir / INDEX_FILENAME)
+    if index is not None:
+        return index
+
+    # Not installed (or installed by an older version): parse the sources
+    from ..components.commands import CommandsComponent
+    display_warning(get_string("commands_op.run.no_index", args.install_dir / INDEX_FILENAME))
+    component = CommandsComponent(args.install_dir)
+    return build_command_index(PROJECT_ROOT / "SuperClaude" / "Commands", component.component_files)
+
+
+def display_commands(commands: List[Dict[str, Any]], details: bool) -> None:
+    """Print command entries as a table or, with details, one block each"""
+    if not details:
+        rows = [[f"/sc:{command['name']}", truncate_text(command["description"], 70)] for command in commands]
+        display_table([get_string("commands_op.report.command"), get_string("commands_op.report.description")], rows)
+        return
+
+    for command in commands:
+        print(f"\n{Colors.CYAN}{Colors.BRIGHT}/sc:{command['name']}{Colors.RESET}  {command['description']}")
+        if command["usage"]:
+            print(f"  {get_string('commands_op.report.usage')}: {command['usage']}")
+        if command["flags"]:
+            print(f"  {get_string('commands_op.report.flags')}: {', '.join(command['flags'])}")
+        if command["allowed_tools"]:
+            print(f"  {get_string('commands_op.report.tools')}: {', '.join(command['allowed_tools'])}")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute commands listing operation with parsed arguments"""
+    operation = CommandsOperation()
+    operation.setup_operation_logging(args)
+
+    try:
+        index = get_command_index(args)
+        query = " ".join(args.query) if args.query else None
+        commands = search_commands(index, query)
+
+        if not args.quiet:
+            display_header(get_string("commands_op.run.header"), str(args.install_dir))
+
+        if not commands:
+            display_info(get_string("commands_op.run.no_match", query))
+            return 1
+
+        display_commands(commands, args.details)
+        display_info(get_string("commands_op.run.count", len(commands), len(index.get("commands", []))))
+        return 0
+
+    except Exception as e:
+        return operation.handle_operation_error("commands", e)
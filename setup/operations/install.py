@@ -5,9 +5,9 @@ It orchestrates the installation process by calling helpers from the
 'install_logic' subpackage.
 """
 
-import sys
 import argparse
 from pathlib import Path
+from typing import List
 
 # --- Local Imports ---
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
@@ -22,11 +22,14 @@ from ..utils.localization import get_string
 # --- Refactored Logic Imports ---
 from .install_logic.ui import (
     display_installation_plan,
+    display_fleet_summary,
     run_system_diagnostics,
 )
-from .install_logic.selector import get_components_to_install
+from .install_logic.selector import get_components_to_install, get_core_selection
 from .install_logic.validator import validate_system_requirements
 from .install_logic.installer import perform_installation
+from .install_logic.fleet import install_fleet, load_targets
+from .install_logic.progress import FleetProgress
 
 
 class InstallOperation(OperationBase):
@@ -50,6 +53,9 @@ Examples:
   SuperClaude install --quick --dry-run        # Quick installation (dry-run)
   SuperClaude install --profile developer      # Developer profile  
   SuperClaude install --components core mcp    # Specific components
+  SuperClaude install --optimize-core --strip-unused-docs  # Slim Core bundle
+  SuperClaude install --quick --targets dirs.txt --yes     # Many directories at once
+  SuperClaude install --quick --targets users.txt --allow-foreign-root /home --yes  # Other users' homes
   SuperClaude install --verbose --force        # Verbose with force mode
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -64,6 +70,13 @@ Examples:
     
     # Installation options
     parser.add_argument("--no-backup", action="store_true", help=get_string("install.parser.no_backup_help"))
+    parser.add_argument("--staged", action="store_true", help=get_string("install.parser.staged_help"))
+    parser.add_argument("--optimize-core", action="store_true", help=get_string("install.parser.optimize_core_help"))
+    parser.add_argument("--strip-unused-docs", action="store_true", help=get_string("install.parser.strip_unused_docs_help"))
+    parser.add_argument("--targets", type=Path, metavar="FILE", help=get_string("install.parser.targets_help"))
+    parser.add_argument("--max-workers", type=int, metavar="N", help=get_string("install.parser.max_workers_help"))
+    parser.add_argument("--allow-foreign-root", type=Path, metavar="DIR", action="append", dest="foreign_roots",
+                        help=get_string("install.parser.allow_foreign_root_help"))
     parser.add_argument("--list-components", action="store_true", help=get_string("install.parser.list_components_help"))
     parser.add_argument("--diagnose", action="store_true", help=get_string("install.parser.diagnose_help"))
     
@@ -83,7 +96,7 @@ def run(args: argparse.Namespace) -> int:
         display_error(f"\n[✗] {get_string('install.run.invalid_path_header')}")
         display_error(f"    {get_string('install.run.invalid_path_expected', expected_home)}")
         display_error(f"    {get_string('install.run.invalid_path_provided', actual_dir)}")
-        sys.exit(1)
+        return 1
     
     try:
         # Validate global arguments
@@ -92,6 +105,10 @@ def run(args: argparse.Namespace) -> int:
             for error in errors:
                 logger.error(error)
             return 1
+
+        if getattr(args, 'foreign_roots', None) and not getattr(args, 'targets', None):
+            logger.error(get_string("install.fleet.foreign_root_requires_targets"))
+            return 1
         
         # Display header
         if not args.quiet:
@@ -148,6 +165,9 @@ def run(args: argparse.Namespace) -> int:
             else:
                 logger.warning(get_string("install.run.reqs_not_met_force"))
         
+        if getattr(args, 'targets', None):
+            return run_fleet_installation(args, components, registry, config_manager)
+
         if args.install_dir.exists() and not args.force and not args.dry_run:
             logger.warning(get_string("install.run.dir_exists", args.install_dir))
             if not args.yes and not confirm(get_string("install.run.confirm_update"), default=False):
@@ -161,7 +181,8 @@ def run(args: argparse.Namespace) -> int:
                     logger.info(get_string("install.run.cancelled"))
                     return 0
         
-        success = perform_installation(components, args)
+        core_selection = get_core_selection(args, config_manager)
+        success = perform_installation(components, args, registry, core_selection)
         
         if success:
             if not args.quiet:
@@ -181,3 +202,41 @@ def run(args: argparse.Namespace) -> int:
         return 130
     except Exception as e:
         return operation.handle_operation_error("install", e)
+
+
+def run_fleet_installation(args: argparse.Namespace, components: List[str], registry: ComponentRegistry,
+                           config_manager: ConfigManager) -> int:
+    """Install the selected components into every directory of the --targets file"""
+    logger = get_logger()
+
+    try:
+        targets = load_targets(args.targets)
+    except OSError as e:
+        logger.error(get_string("install.fleet.targets_read_error", args.targets, e))
+        return 1
+    if not targets:
+        logger.error(get_string("install.fleet.no_targets", args.targets))
+        return 1
+
+    max_workers = getattr(args, 'max_workers', None)
+    if max_workers is not None and max_workers < 1:
+        logger.error(get_string("install.fleet.invalid_max_workers", max_workers))
+        return 1
+
+    if not args.quiet:
+        display_installation_plan(components, registry, args.install_dir, targets)
+        if not args.dry_run:
+            if not args.yes and not confirm(get_string("install.fleet.confirm", len(targets)), default=True):
+                logger.info(get_string("install.run.cancelled"))
+                return 0
+
+    core_selection = get_core_selection(args, config_manager)
+    progress = FleetProgress(targets) if not args.quiet else None
+    summary = install_fleet(targets, components, args, registry, core_selection, max_workers, progress)
+
+    if not args.quiet:
+        display_fleet_summary(summary)
+    if summary["failed"]:
+        display_error(get_string("install.fleet.failed", summary["failed"], summary["targets"]))
+        return 1
+    return 0
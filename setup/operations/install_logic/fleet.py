@@ -0,0 +1,291 @@
+"""
+Fleet installation: one source tree, many installation directories.
+
+Registry discovery, config parsing, requirement probes and source hashing
+are done once by the caller; only the per-directory work (backup, file
+copies, settings merge) runs for every target. Targets are installed on a
+thread pool since the work is dominated by file I/O, and the warmed
+registry and caches are shared between the workers. Each worker's output
+is captured into its result rather than printed, so concurrent targets do
+not interleave; the CLI shows a progress bar per target instead.
+
+Targets must be inside the invoking user's home directory unless the
+caller opts in to foreign targets (other users' homes, container roots)
+by naming the directories that may contain them (--allow-foreign-root,
+args.foreign_roots). The system directory denylist applies either way.
+Components whose side effects belong to the invoking user rather than the
+target directory (the MCP component registers servers in the user's Claude
+configuration) cannot be installed per target and are rejected.
+"""
+
+import argparse
+import contextvars
+import copy
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from setup.base.installer import Installer
+from setup.core.registry import ComponentRegistry
+from setup.utils.logger import get_logger
+from setup.utils.localization import get_string
+from setup.utils.output import capture_output
+from setup.utils.security import SecurityValidator
+from .installer import build_install_config
+from .progress import FleetProgress
+
+# Upper bound for the default number of concurrent installs
+DEFAULT_MAX_WORKERS = 4
+
+
+def load_targets(path: Path) -> List[Path]:
+    """
+    Read installation directories from a targets file
+
+    One directory per line; blank lines and lines starting with "#" are
+    ignored, "~" is expanded and duplicates are dropped.
+
+    Args:
+        path: Targets file
+
+    Returns:
+        Resolved directories in file order
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    targets: List[Path] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            target = Path(line).expanduser().resolve()
+            if target not in targets:
+                targets.append(target)
+    return targets
+
+
+def hash_sources(registry: ComponentRegistry, components: List[str]) -> Dict[str, Any]:
+    """
+    Hash and check the source files of the components once for all targets
+
+    Args:
+        registry: Discovered component registry
+        components: Component names
+
+    Returns:
+        Dict with "digest" (hash over all source files), "files" (number of
+        files hashed) and "errors" (missing or unreadable sources)
+    """
+    digest = hashlib.sha256()
+    errors: List[str] = []
+    count = 0
+    for name in sorted(components):
+        component = registry.get_component_instance(name)
+        if component is None:
+            errors.append(get_string("install.fleet.unknown_component", name))
+            continue
+        source_dir = component._get_source_dir()
+        sources = sorted(source for source, _ in component.get_files_to_install())
+        hashes = component.file_manager.hash_files(sources)
+        for source in sources:
+            file_hash = hashes[source]
+            if file_hash is None:
+                errors.append(get_string("install.fleet.source_unreadable", source))
+                continue
+            try:
+                label = source.relative_to(source_dir).as_posix()
+            except (TypeError, ValueError):
+                label = source.name
+            digest.update(f"{name}:{label}:{file_hash}\n".encode("utf-8"))
+            count += 1
+    return {"digest": digest.hexdigest(), "files": count, "errors": errors}
+
+
+def check_target(target: Path, foreign_roots: Sequence[Path] = ()) -> Optional[str]:
+    """
+    Same path restriction as a single install: the target must be inside
+    the current user's home directory, or inside one of foreign_roots if
+    the caller opted in to installing for other users or containers
+
+    Args:
+        target: Installation directory
+        foreign_roots: Directories outside the home directory that may
+            contain targets
+
+    Returns:
+        Error message, or None if the target is acceptable
+    """
+    home = Path.home().resolve()
+    resolved = target.resolve()
+    try:
+        resolved.relative_to(home)
+        return None
+    except ValueError:
+        pass
+
+    with SecurityValidator.foreign_roots(foreign_roots):
+        root = SecurityValidator.foreign_root_of(resolved)
+    if root is None:
+        if foreign_roots:
+            return get_string("install.fleet.outside_roots", target, home,
+                              ", ".join(str(root) for root in foreign_roots))
+        return get_string("install.fleet.outside_home", target, home)
+    system_dir = SecurityValidator.system_directory_of(resolved)
+    if system_dir is not None:
+        return get_string("security.validate_target.cannot_install_to_system_dir", system_dir)
+    return None
+
+
+def check_components(registry: ComponentRegistry, components: List[str]) -> List[str]:
+    """
+    Reject components that cannot be installed once per target
+
+    Returns:
+        Error messages, empty if every component only writes to its target
+    """
+    user_global = []
+    for name in components:
+        component = registry.get_component_instance(name)
+        if component is not None and component.has_user_global_effects():
+            user_global.append(name)
+    if user_global:
+        return [get_string("install.fleet.user_global_components", ", ".join(user_global))]
+    return []
+
+
+def _install_target(target: Path, ordered_components: List[str], args: argparse.Namespace,
+                    registry: ComponentRegistry, core_selection: Optional[Dict[str, Any]],
+                    progress: Optional[FleetProgress]) -> Dict[str, Any]:
+    """Install into a single directory; never raises"""
+    logger = get_logger()
+    result: Dict[str, Any] = {
+        "target": str(target),
+        "success": False,
+        "installed": [],
+        "failed": [],
+        "skipped": [],
+        "backup_path": None,
+        "error": None,
+        "duration": 0.0,
+        "messages": []
+    }
+    foreign_roots = getattr(args, 'foreign_roots', None) or []
+    with capture_output() as messages, SecurityValidator.foreign_roots(foreign_roots), \
+            logger.span("install.fleet.target", install_dir=str(target), dry_run=args.dry_run) as span:
+        try:
+            error = check_target(target, foreign_roots)
+            if error is not None:
+                result["error"] = error
+            else:
+                # The requirement checks measure free space on the parent
+                target.parent.mkdir(parents=True, exist_ok=True)
+
+                # Instances were created up front by the caller; this is a pool lookup
+                instances = registry.create_component_instances(ordered_components, target)
+                installer = Installer(target, dry_run=args.dry_run, staged=getattr(args, 'staged', False))
+                installer.register_components(list(instances.values()))
+                if progress is not None:
+                    installer.add_listener(progress.listener(target))
+
+                target_args = copy.copy(args)
+                target_args.install_dir = target
+                config = build_install_config(target_args, ordered_components, core_selection)
+                result["success"] = installer.install_components(ordered_components, config)
+
+                summary = installer.get_installation_summary()
+                result["installed"] = sorted(summary["installed"])
+                result["failed"] = sorted(summary["failed"])
+                result["skipped"] = sorted(summary["skipped"])
+                result["backup_path"] = summary["backup_path"]
+        except Exception as e:
+            logger.exception(get_string("install.fleet.target_error", target, e))
+            result["error"] = str(e)
+
+        result["duration"] = span.elapsed()
+        if not result["success"]:
+            span.set_outcome("failed")
+    result["messages"] = messages
+    if progress is not None:
+        progress.target_finished(target, result["success"])
+    return result
+
+
+def install_fleet(targets: List[Path], components: List[str], args: argparse.Namespace,
+                  registry: ComponentRegistry, core_selection: Optional[Dict[str, Any]] = None,
+                  max_workers: Optional[int] = None, progress: Optional[FleetProgress] = None) -> Dict[str, Any]:
+    """
+    Install the same components into many directories concurrently
+
+    Args:
+        targets: Installation directories
+        components: Component names to install
+        args: Parsed install arguments (install_dir is replaced per target,
+            foreign_roots lists the directories outside the home directory
+            that may contain targets)
+        registry: Registry used for planning; it is discovered once and its
+            instances are created for every target before the workers start
+        core_selection: "core" section of the profile
+        max_workers: Concurrent installs (default: up to DEFAULT_MAX_WORKERS)
+        progress: Progress bars to drive, one per target
+
+    Returns:
+        Summary dict with targets, succeeded, failed, duration, source
+        ("digest", "files", "errors"), errors and per-target results in
+        target order, each with the messages its install would have
+        printed. If the components or sources fail validation nothing is
+        installed.
+    """
+    logger = get_logger()
+    started = time.perf_counter()
+
+    registry.discover_components()
+    ordered_components = registry.resolve_dependencies(components)
+    source = hash_sources(registry, ordered_components)
+    errors = check_components(registry, ordered_components) + source["errors"]
+
+    summary: Dict[str, Any] = {
+        "targets": len(targets),
+        "succeeded": 0,
+        "failed": 0,
+        "duration": 0.0,
+        "source": source,
+        "errors": errors,
+        "results": []
+    }
+    if errors:
+        for error in errors:
+            logger.error(error)
+        summary["failed"] = len(targets)
+        summary["duration"] = time.perf_counter() - started
+        return summary
+
+    # Component modules are imported and instances pooled here, on one
+    # thread, so the workers only read from the registry
+    for target in targets:
+        registry.create_component_instances(ordered_components, target)
+
+    if max_workers is None:
+        max_workers = min(DEFAULT_MAX_WORKERS, len(targets))
+    max_workers = max(1, max_workers)
+    logger.info(get_string("install.fleet.starting", len(targets), max_workers, source["digest"][:12]))
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fleet") as executor:
+        # Each worker runs in a copy of this context so its spans nest under the caller's
+        futures = [
+            executor.submit(contextvars.copy_context().run, _install_target,
+                            target, ordered_components, args, registry, core_selection, progress)
+            for target in targets
+        ]
+        results = [future.result() for future in futures]
+    if progress is not None:
+        progress.close()
+
+    summary["results"] = results
+    summary["succeeded"] = sum(1 for result in results if result["success"])
+    summary["failed"] = len(results) - summary["succeeded"]
+    summary["duration"] = time.perf_counter() - started
+    return summary
@@ -2,29 +2,78 @@
 Core installation logic for the installation operation.
 """
 
-import time
 import argparse
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from setup.base.installer import Installer
 from setup.core.registry import ComponentRegistry
-from setup.utils.ui import ProgressBar
-from setup.utils.logger import get_logger
+from .progress import InstallProgress
+from .selector import get_profile_name
+from setup.utils.logger import get_logger, Logger, Span
 from setup.utils.localization import get_string
 from setup import PROJECT_ROOT
 
 
-def perform_installation(components: List[str], args: argparse.Namespace) -> bool:
-    """Perform the actual installation"""
+def build_install_config(args: argparse.Namespace, ordered_components: List[str],
+                         core_selection: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Installer configuration for the parsed command line arguments
+
+    Args:
+        args: Parsed command line arguments
+        ordered_components: Components to install, in dependency order
+        core_selection: "core" section of the profile
+
+    Returns:
+        Config dict passed to Installer.install_components()
+    """
+    return {
+        "force": args.force,
+        "backup": not args.no_backup,
+        "dry_run": args.dry_run,
+        "components": ordered_components,
+        "optimize_core": getattr(args, 'optimize_core', False),
+        "strip_unused_docs": getattr(args, 'strip_unused_docs', False),
+        "core_selection": core_selection,
+        "profile": get_profile_name(args)
+    }
+
+
+def perform_installation(components: List[str], args: argparse.Namespace,
+                         registry: Optional[ComponentRegistry] = None,
+                         core_selection: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Perform the actual installation
+
+    Args:
+        components: Component names to install
+        args: Parsed command line arguments
+        registry: Registry to take component instances from; passing the one
+            used for planning reuses its pooled instances
+        core_selection: "core" section of the profile, trims the Core files
+
+    Returns:
+        True if all components were installed
+    """
     logger = get_logger()
-    start_time = time.time()
+    with logger.span("install.operation", components=list(components), dry_run=args.dry_run) as span:
+        success = _perform_installation(components, args, logger, span, registry, core_selection)
+        if not success:
+            span.set_outcome("failed")
+        return success
+
 
+def _perform_installation(components: List[str], args: argparse.Namespace, logger: Logger, span: Span,
+                          registry: Optional[ComponentRegistry] = None,
+                          core_selection: Optional[Dict[str, Any]] = None) -> bool:
+    """Body of perform_installation, timed by the operation span"""
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        installer = Installer(args.install_dir, dry_run=args.dry_run, staged=getattr(args, 'staged', False))
 
         # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        if registry is None:
+            registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
         registry.discover_components()
 
         # Create component instances
@@ -40,36 +89,26 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         # Resolve dependencies
         ordered_components = registry.resolve_dependencies(components)
 
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(ordered_components),
-            prefix=get_string("install.perform.prefix"),
-            suffix=""
+        # Setup progress tracking, driven live by installer events
+        progress = InstallProgress(
+            get_string("install.perform.prefix"),
+            "install.perform.component_installing",
+            "install.perform.installed",
+            "install.perform.failed"
         )
+        progress.attach(installer)
 
         # Install components
         logger.info(get_string("install.perform.installing", len(ordered_components)))
 
-        config = {
-            "force": args.force,
-            "backup": not args.no_backup,
-            "dry_run": args.dry_run
-        }
+        config = build_install_config(args, ordered_components, core_selection)
 
         success = installer.install_components(ordered_components, config)
 
-        # Update progress
-        for i, component_name in enumerate(ordered_components):
-            if component_name in installer.installed_components:
-                progress.update(i + 1, get_string("install.perform.installed", component_name))
-            else:
-                progress.update(i + 1, get_string("install.perform.failed", component_name))
-            time.sleep(0.1)  # Brief pause for visual effect
-
         progress.finish(get_string("install.perform.complete"))
 
         # Show results
-        duration = time.time() - start_time
+        duration = span.elapsed()
 
         if success:
             logger.success(get_string("install.perform.success", f"{duration:.1f}"))
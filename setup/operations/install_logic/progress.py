@@ -0,0 +1,167 @@
+"""
+Live progress reporting for install and update operations.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from setup.base.events import InstallEvent
+from setup.utils.ui import MultiProgressBar, ProgressBar
+from setup.utils.localization import get_string
+
+
+class _MultiBarRow:
+    """ProgressBar-like handle on one bar of a MultiProgressBar"""
+
+    def __init__(self, bars: MultiProgressBar, key: str):
+        self.bars = bars
+        self.key = key
+
+    def update(self, current: int, message: str = '', force: bool = False) -> None:
+        self.bars.update(self.key, current, message, force=force)
+
+    def finish(self, message: str) -> None:
+        self.bars.finish(self.key, message)
+
+
+class InstallProgress:
+    """
+    Drives a ProgressBar from installer events
+
+    Progress is measured in bytes so the ETA reflects the actual amount of
+    data left to copy. Components without a known size (e.g. MCP servers,
+    which only run external commands) are weighted like an average component
+    so the bar still moves when they finish.
+    """
+
+    def __init__(self, prefix: str, active_key: str, done_key: str, failed_key: str,
+                 bars: Optional[MultiProgressBar] = None, key: Optional[str] = None):
+        """
+        Initialize progress reporter
+
+        Args:
+            prefix: Text displayed before the progress bar
+            active_key: Locale key for a component in progress, takes the name
+            done_key: Locale key for a finished component, takes the name
+            failed_key: Locale key for a failed component, takes the name
+            bars: Multi-bar block to draw into instead of an own ProgressBar
+            key: Bar of the block, already added by the caller
+        """
+        self.prefix = prefix
+        self.active_key = active_key
+        self.done_key = done_key
+        self.failed_key = failed_key
+        self.bars = bars
+        self.key = key
+        self.progress: Optional[Union[ProgressBar, _MultiBarRow]] = None
+        self.weights: Dict[str, int] = {}
+        self.completed = 0
+        self.component_bytes = 0
+        self.current_component: Optional[str] = None
+
+    def attach(self, installer) -> None:
+        """
+        Subscribe to an installer's events
+
+        Args:
+            installer: Installer instance to follow
+        """
+        installer.add_listener(self.handle_event)
+
+    def handle_event(self, event: InstallEvent, data: Dict[str, Any]) -> None:
+        """Update the progress bar for a single installer event"""
+        if event == InstallEvent.INSTALL_START:
+            self._start(data)
+        elif self.progress is None:
+            return
+        elif event == InstallEvent.COMPONENT_START:
+            self.current_component = data['component']
+            self.component_bytes = 0
+            self.progress.update(self.completed, get_string(self.active_key, self.current_component))
+        elif event == InstallEvent.FILE_COPIED:
+            weight = self.weights.get(data['component'], 0)
+            self.component_bytes = min(self.component_bytes + data.get('bytes', 0), weight)
+            self.progress.update(self.completed + self.component_bytes,
+                                 get_string(self.active_key, data['component']))
+        elif event == InstallEvent.COMPONENT_FINISH:
+            name = data['component']
+            self.completed += self.weights.get(name, 0)
+            self.component_bytes = 0
+            self.current_component = None
+            key = self.done_key if data.get('success') else self.failed_key
+            self.progress.update(self.completed, get_string(key, name))
+
+    def _start(self, data: Dict[str, Any]) -> None:
+        """Size the progress bar from the installer's estimates"""
+        components = data.get('components', [])
+        sizes = data.get('sizes') or {}
+        total_bytes = data.get('total_bytes', 0)
+
+        known = [size for size in sizes.values() if size > 0]
+        fallback = (sum(known) // len(known)) if known else 1
+
+        self.weights = {name: sizes.get(name) or fallback for name in components}
+        self.completed = 0
+        total = sum(self.weights.values()) or total_bytes or len(components)
+        if self.bars is not None:
+            self.bars.set_total(self.key, total)
+            self.progress = _MultiBarRow(self.bars, self.key)
+        else:
+            self.progress = ProgressBar(total=total, prefix=self.prefix, suffix="")
+
+    def finish(self, message: str) -> None:
+        """
+        Complete the progress bar
+
+        Args:
+            message: Completion message
+        """
+        if self.progress is not None:
+            self.progress.finish(message)
+
+
+class FleetProgress:
+    """
+    One progress bar per target of a fleet install, drawn as a block
+
+    Each target's installer events drive its own bar; the workers' output is
+    captured, so the block is not interleaved with their messages.
+    """
+
+    def __init__(self, targets: List[Path]):
+        """
+        Initialize the block with a bar per target, in target order
+
+        Args:
+            targets: Installation directories
+        """
+        self.bars = MultiProgressBar()
+        width = max((len(str(target)) for target in targets), default=0)
+        for target in targets:
+            # Sized on the target's install start event
+            self.bars.add_bar(str(target), 1, prefix=f"{str(target):<{width}} ")
+
+    def listener(self, target: Path) -> Callable[[InstallEvent, Dict[str, Any]], None]:
+        """Installer event listener that moves the bar of a target"""
+        progress = InstallProgress(
+            "",
+            "install.perform.component_installing",
+            "install.perform.installed",
+            "install.perform.failed",
+            bars=self.bars,
+            key=str(target)
+        )
+        return progress.handle_event
+
+    def target_finished(self, target: Path, success: bool) -> None:
+        """Complete the bar of a target, or leave it where it stopped"""
+        key = str(target)
+        if success:
+            self.bars.finish(key, get_string("install.fleet.progress_done"))
+        else:
+            self.bars.update(key, self.bars.bars[key].current, get_string("install.fleet.progress_failed"),
+                             force=True)
+
+    def close(self) -> None:
+        """End the block"""
+        self.bars.close()
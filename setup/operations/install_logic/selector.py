@@ -3,7 +3,7 @@ Component selection logic for the installation operation.
 """
 
 import argparse
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from setup.core.registry import ComponentRegistry
 from setup.managers.config_manager import ConfigManager
@@ -51,3 +51,37 @@ def get_components_to_install(args: argparse.Namespace, registry: ComponentRegis
 
     # Interactive selection
     return interactive_component_selection(registry, config_manager)
+
+
+def get_profile_name(args: argparse.Namespace) -> Optional[str]:
+    """Name of the profile the components come from, None for explicit or interactive selection"""
+    if args.components:
+        return None
+    if args.profile:
+        return args.profile
+    if args.quick:
+        return "quick"
+    return None
+
+
+def get_core_selection(args: argparse.Namespace, config_manager: ConfigManager) -> Optional[Dict[str, Any]]:
+    """
+    Section-level Core selection ("core" key) of the chosen profile
+
+    Args:
+        args: Parsed command line arguments
+        config_manager: Config manager (profiles are cached, so this does
+            not parse the file again)
+
+    Returns:
+        The profile's "core" dict, or None if there is none
+    """
+    name = get_profile_name(args)
+    if name is None:
+        return None
+    try:
+        profile = config_manager.load_profile(PROJECT_ROOT / "profiles" / f"{name}.json")
+    except Exception:
+        # Already reported while selecting components
+        return None
+    return profile.get("core")
@@ -3,7 +3,7 @@ UI-related functions for the installation operation.
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from setup.core.registry import ComponentRegistry
 from setup.managers.config_manager import ConfigManager
@@ -81,8 +81,9 @@ def interactive_component_selection(registry: ComponentRegistry, config_manager:
         return None
 
 
-def display_installation_plan(components: List[str], registry: ComponentRegistry, install_dir: Path) -> None:
-    """Display installation plan"""
+def display_installation_plan(components: List[str], registry: ComponentRegistry, install_dir: Path,
+                              targets: Optional[List[Path]] = None) -> None:
+    """Display installation plan; targets lists the directories of a fleet install"""
     logger = get_logger()
 
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}{get_string('install.plan.header')}{Colors.RESET}")
@@ -92,7 +93,13 @@ def display_installation_plan(components: List[str], registry: ComponentRegistry
     try:
         ordered_components = registry.resolve_dependencies(components)
 
-        print(f"{Colors.BLUE}{get_string('install.plan.directory')}{Colors.RESET} {install_dir}")
+        if targets:
+            print(f"{Colors.BLUE}{get_string('install.plan.targets', len(targets))}{Colors.RESET}")
+            for target in targets:
+                print(f"  {target}")
+            install_dir = targets[0]
+        else:
+            print(f"{Colors.BLUE}{get_string('install.plan.directory')}{Colors.RESET} {install_dir}")
         print(f"{Colors.BLUE}{get_string('install.plan.components')}{Colors.RESET}")
 
         total_size = 0
@@ -123,6 +130,39 @@ def display_installation_plan(components: List[str], registry: ComponentRegistry
         raise
 
 
+def display_fleet_summary(summary: Dict[str, Any]) -> None:
+    """Display the aggregated result of a fleet installation"""
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}{get_string('install.fleet.summary_header')}{Colors.RESET}")
+    print("=" * 50)
+    source = summary["source"]
+    print(f"{Colors.BLUE}{get_string('install.fleet.summary_source')}{Colors.RESET} "
+          f"{source['digest'][:12]} ({get_string('install.fleet.summary_files', source['files'])})")
+
+    for result in summary["results"]:
+        if result["success"]:
+            status = f"{Colors.GREEN}✅{Colors.RESET}"
+            detail = ", ".join(result["installed"])
+        else:
+            status = f"{Colors.RED}❌{Colors.RESET}"
+            if result["error"]:
+                detail = result["error"]
+            elif result["failed"]:
+                detail = get_string("install.fleet.summary_failed_components", ", ".join(result["failed"]))
+            else:
+                detail = get_string("install.fleet.summary_not_installed")
+        print(f"  {status} {result['target']} ({result['duration']:.1f}s) {detail}")
+        if not result["success"]:
+            # The worker's output was captured; repeat what explains the failure
+            for message in result.get("messages", []):
+                if message["level"] in ("ERROR", "WARNING"):
+                    print(f"      {message['message']}")
+
+    color = Colors.GREEN if not summary["failed"] else Colors.YELLOW
+    totals = get_string("install.fleet.summary_totals", summary["succeeded"], summary["targets"],
+                        summary["failed"], f"{summary['duration']:.1f}")
+    print(f"\n{color}{totals}{Colors.RESET}")
+
+
 def run_system_diagnostics(validator: Validator) -> None:
     """Run comprehensive system diagnostics"""
     logger = get_logger()
@@ -3,8 +3,6 @@ SuperClaude Uninstall Operation Module
 Refactored from uninstall.py for unified CLI hub
 """
 
-import sys
-import time
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
@@ -16,7 +14,7 @@ from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors
 )
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, Logger, Span
 from ..utils.localization import get_string
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
@@ -283,8 +281,15 @@ def create_uninstall_backup(install_dir: Path, components: List[str]) -> Optiona
 def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dict[str, Any]) -> bool:
     """Perform the actual uninstall"""
     logger = get_logger()
-    start_time = time.time()
-    
+    with logger.span("uninstall.operation", components=list(components), dry_run=args.dry_run) as span:
+        success = _perform_uninstall(components, args, info, logger, span)
+        if not success:
+            span.set_outcome("failed")
+        return success
+
+
+def _perform_uninstall(components: List[str], args: argparse.Namespace, info: Dict[str, Any], logger: Logger, span: Span) -> bool:
+    """Body of perform_uninstall, timed by the operation span"""
     try:
         # Create component registry
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
@@ -326,7 +331,6 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
                 failed_components.append(component_name)
             
             progress.update(i + 1, get_string("uninstall.perform.processed", component_name))
-            time.sleep(0.1)  # Brief pause for visual effect
         
         progress.finish(get_string("uninstall.perform.complete"))
         
@@ -335,7 +339,7 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
             cleanup_installation_directory(args.install_dir, args)
         
         # Show results
-        duration = time.time() - start_time
+        duration = span.elapsed()
         
         if failed_components:
             logger.warning(get_string("uninstall.perform.failures", f"{duration:.1f}"))
@@ -409,7 +413,7 @@ def run(args: argparse.Namespace) -> int:
         print(f"\n[✗] {get_string('install.run.invalid_path_header')}")
         print(f"    {get_string('install.run.invalid_path_expected', expected_home)}")
         print(f"    {get_string('install.run.invalid_path_provided', actual_dir)}")
-        sys.exit(1)
+        return 1
     
     try:
         # Validate global arguments
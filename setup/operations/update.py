@@ -3,24 +3,24 @@ SuperClaude Update Operation Module
 Refactored from update.py for unified CLI hub
 """
 
-import sys
-import time
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
 
 from ..base.installer import Installer
 from ..core.registry import ComponentRegistry
+from ..core.update_plan import ADD, DELETE, MODIFY, UNCHANGED, changed_files, has_changes
 from ..managers.settings_manager import SettingsManager
 from ..core.validator import Validator
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size
+    display_warning, Menu, confirm, Colors, format_size
 )
-from ..utils.logger import get_logger
+from ..utils.logger import get_logger, Logger, Span
 from ..utils.localization import get_string
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
+from .install_logic.progress import InstallProgress
 
 
 class UpdateOperation(OperationBase):
@@ -83,6 +83,12 @@ Examples:
         help=get_string("update.parser.reinstall_help")
     )
     
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help=get_string("update.parser.staged_help")
+    )
+    
     return parser
 
 def check_installation_exists(install_dir: Path) -> bool:
@@ -100,20 +106,45 @@ def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
         return {}
 
 
-def get_available_updates(installed_components: Dict[str, str], registry: ComponentRegistry) -> Dict[str, Dict[str, str]]:
-    """Check for available updates"""
+def _installed_version(info: Any) -> str:
+    """Version of a registration entry (older callers pass the version string)"""
+    if isinstance(info, dict):
+        return info.get("version", "unknown")
+    return info
+
+
+def get_available_updates(installed_components: Dict[str, Dict[str, Any]], registry: ComponentRegistry,
+                          install_dir: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Check for available updates
+
+    With install_dir, every installed component is also compared file by
+    file with its source, so changed files are reported even when the
+    version did not change, including local edits.
+
+    Returns:
+        Component name -> {"current", "available", "description", "plan"}
+        for components with a new version or differing files
+    """
     updates = {}
     
-    for component_name, current_version in installed_components.items():
+    for component_name, info in installed_components.items():
         try:
             metadata = registry.get_component_metadata(component_name)
             if metadata:
+                current_version = _installed_version(info)
                 available_version = metadata.get("version", "unknown")
-                if available_version != current_version:
+                plan = None
+                if install_dir is not None:
+                    component = registry.get_component_instance(component_name, install_dir)
+                    if component is not None:
+                        plan = component.plan_update()
+                if available_version != current_version or has_changes(plan):
                     updates[component_name] = {
                         "current": current_version,
                         "available": available_version,
-                        "description": metadata.get("description", "No description")
+                        "description": metadata.get("description", "No description"),
+                        "plan": plan
                     }
         except Exception:
             continue
@@ -121,7 +152,30 @@ def get_available_updates(installed_components: Dict[str, str], registry: Compon
     return updates
 
 
-def display_update_check(installed_components: Dict[str, str], available_updates: Dict[str, Dict[str, str]]) -> None:
+def _describe_update(info: Dict[str, Any]) -> str:
+    """One-line version change, or the number of changed files if the version is the same"""
+    if info["current"] != info["available"]:
+        return f"v{info['current']} → v{info['available']}"
+    plan = info.get("plan")
+    return f"v{info['current']} " + get_string("update.check.files_changed", len(changed_files(plan)) if plan else 0)
+
+
+def display_update_plan_files(plan: Dict[str, Any]) -> None:
+    """List the file changes of a component update plan"""
+    counts = plan["counts"]
+    print(f"    {get_string('update.check.changes', counts[ADD], counts[MODIFY], counts[DELETE], counts[UNCHANGED])}")
+    if plan["local_edits"]:
+        print(f"    {Colors.YELLOW}{get_string('update.check.local_edits', plan['local_edits'])}{Colors.RESET}")
+    markers = {ADD: "+", MODIFY: "~", DELETE: "-"}
+    for entry in changed_files(plan):
+        note = f" {get_string('update.check.local_edit')}" if entry["local_edit"] else ""
+        print(f"      {markers[entry['action']]} {entry['path']}{note}")
+    for source in plan["errors"]:
+        print(f"    {Colors.RED}{get_string('component.update.source_unreadable', source)}{Colors.RESET}")
+
+
+def display_update_check(installed_components: Dict[str, Dict[str, Any]],
+                         available_updates: Dict[str, Dict[str, Any]]) -> None:
     """Display update check results"""
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}{get_string('update.check.results_header')}{Colors.RESET}")
     print("=" * 50)
@@ -131,14 +185,16 @@ def display_update_check(installed_components: Dict[str, str], available_updates
         return
     
     print(f"{Colors.BLUE}{get_string('update.check.installed_components')}{Colors.RESET}")
-    for component, version in installed_components.items():
-        print(f"  {component}: v{version}")
+    for component, info in installed_components.items():
+        print(f"  {component}: v{_installed_version(info)}")
     
     if available_updates:
         print(f"\n{Colors.GREEN}{get_string('update.check.available_updates')}{Colors.RESET}")
         for component, info in available_updates.items():
-            print(f"  {component}: v{info['current']} → v{info['available']}")
+            print(f"  {component}: {_describe_update(info)}")
             print(f"    {info['description']}")
+            if info.get("plan"):
+                display_update_plan_files(info["plan"])
     else:
         print(f"\n{Colors.GREEN}{get_string('update.check.all_up_to_date')}{Colors.RESET}")
     
@@ -187,7 +243,7 @@ def interactive_update_selection(available_updates: Dict[str, Dict[str, str]],
     component_names = []
     
     for component, info in available_updates.items():
-        update_options.append(f"{component}: v{info['current']} → v{info['available']}")
+        update_options.append(f"{component}: {_describe_update(info)}")
         component_names.append(component)
     
     # Add bulk options
@@ -228,9 +284,9 @@ def display_update_plan(components: List[str], available_updates: Dict[str, Dict
     for i, component_name in enumerate(components, 1):
         if component_name in available_updates:
             info = available_updates[component_name]
-            print(f"  {i}. {component_name}: v{info['current']} → v{info['available']}")
+            print(f"  {i}. {component_name}: {_describe_update(info)}")
         else:
-            current_version = installed_components.get(component_name, "unknown")
+            current_version = _installed_version(installed_components.get(component_name, "unknown"))
             print(f"  {i}. {component_name}: v{current_version} {get_string('update.plan.reinstall')}")
     
     print()
@@ -239,11 +295,18 @@ def display_update_plan(components: List[str], available_updates: Dict[str, Dict
 def perform_update(components: List[str], args: argparse.Namespace) -> bool:
     """Perform the actual update"""
     logger = get_logger()
-    start_time = time.time()
-    
+    with logger.span("update.operation", components=list(components), dry_run=args.dry_run) as span:
+        success = _perform_update(components, args, logger, span)
+        if not success:
+            span.set_outcome("failed")
+        return success
+
+
+def _perform_update(components: List[str], args: argparse.Namespace, logger: Logger, span: Span) -> bool:
+    """Body of perform_update, timed by the operation span"""
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        installer = Installer(args.install_dir, dry_run=args.dry_run, staged=getattr(args, 'staged', False))
         
         # Create component registry
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
@@ -259,12 +322,14 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         # Register components with installer
         installer.register_components(list(component_instances.values()))
         
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(components),
-            prefix=get_string("update.perform.prefix"),
-            suffix=""
+        # Setup progress tracking, driven live by installer events
+        progress = InstallProgress(
+            get_string("update.perform.prefix"),
+            "update.perform.component_updating",
+            "update.perform.updated",
+            "update.perform.failed"
         )
+        progress.attach(installer)
         
         # Update components
         logger.info(get_string("update.perform.updating", len(components)))
@@ -281,18 +346,10 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         
         success = installer.update_components(components, config)
         
-        # Update progress
-        for i, component_name in enumerate(components):
-            if component_name in installer.updated_components:
-                progress.update(i + 1, get_string("update.perform.updated", component_name))
-            else:
-                progress.update(i + 1, get_string("update.perform.failed", component_name))
-            time.sleep(0.1)  # Brief pause for visual effect
-        
         progress.finish(get_string("update.perform.complete"))
         
         # Show results
-        duration = time.time() - start_time
+        duration = span.elapsed()
         
         if success:
             logger.success(get_string("update.perform.success", f"{duration:.1f}"))
@@ -332,7 +389,7 @@ def run(args: argparse.Namespace) -> int:
         print(f"\n[✗] {get_string('install.run.invalid_path_header')}")
         print(f"    {get_string('install.run.invalid_path_expected', expected_home)}")
         print(f"    {get_string('install.run.invalid_path_provided', actual_dir)}")
-        sys.exit(1)
+        return 1
     
     try:
         # Validate global arguments
@@ -368,7 +425,7 @@ def run(args: argparse.Namespace) -> int:
             return 1
         
         # Check for available updates
-        available_updates = get_available_updates(installed_components, registry)
+        available_updates = get_available_updates(installed_components, registry, args.install_dir)
         
         # Display update check results
         if not args.quiet:
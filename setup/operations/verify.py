@@ -0,0 +1,132 @@
+"""
+SuperClaude Verify Operation Module
+
+Checks installed components against the file manifest recorded at install
+time and reports modified, missing and extra files per component.
+"""
+
+import argparse
+from typing import Any, Dict, List
+
+from .. import PROJECT_ROOT
+from . import OperationBase
+from ..core.integrity import is_intact, scan_components
+from ..core.registry import ComponentRegistry
+from ..managers.settings_manager import SettingsManager
+from ..utils.ui import display_header, display_success, display_error, display_warning, display_table, Colors
+from ..utils.logger import get_logger
+from ..utils.localization import get_string
+
+
+class VerifyOperation(OperationBase):
+    """Integrity verification operation implementation"""
+
+    def __init__(self):
+        super().__init__("verify")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register verify CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "verify",
+        help=get_string("verify.parser.help"),
+        description=get_string("verify.parser.description"),
+        epilog="""
+Examples:
+  SuperClaude verify                       # Quick check (size and modification time)
+  SuperClaude verify --deep                # Hash every installed file
+  SuperClaude verify --components core     # Check specific components
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument("--deep", action="store_true", help=get_string("verify.parser.deep_help"))
+    parser.add_argument("--components", type=str, nargs="+", help=get_string("verify.parser.components_help"))
+    parser.add_argument("--max-workers", type=int, metavar="N", help=get_string("verify.parser.max_workers_help"))
+
+    return parser
+
+
+def display_reports(reports: Dict[str, Dict[str, Any]]) -> None:
+    """Print a summary table and the affected files of each component"""
+    rows: List[List[str]] = []
+    for name, report in reports.items():
+        status = get_string("verify.report.ok") if is_intact(report) else get_string("verify.report.failed")
+        rows.append([name, str(report["checked"]), str(len(report["modified"])),
+                     str(len(report["missing"])), str(len(report["extra"])), status])
+    display_table([
+        get_string("verify.report.component"),
+        get_string("verify.report.checked"),
+        get_string("verify.report.modified"),
+        get_string("verify.report.missing"),
+        get_string("verify.report.extra"),
+        get_string("verify.report.status")
+    ], rows)
+
+    markers = (("modified", "~", Colors.YELLOW), ("missing", "-", Colors.RED), ("extra", "+", Colors.BLUE))
+    for name, report in reports.items():
+        if not report["manifest"]:
+            display_warning(get_string("verify.report.no_manifest", name))
+        if not any(report[key] for key, _, _ in markers):
+            continue
+        print(f"\n{Colors.CYAN}{name}{Colors.RESET}")
+        for key, marker, color in markers:
+            for path in report[key]:
+                print(f"  {color}{marker} {path}{Colors.RESET} ({get_string('verify.report.' + key)})")
+    print()
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute verify operation with parsed arguments"""
+    operation = VerifyOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    try:
+        success, errors = operation.validate_global_args(args)
+        if not success:
+            for error in errors:
+                logger.error(error)
+            return 1
+
+        settings_manager = SettingsManager(args.install_dir)
+        if not settings_manager.check_installation_exists():
+            logger.error(get_string("update.run.not_found", args.install_dir))
+            return 1
+
+        installed = list(settings_manager.get_installed_components())
+        components = getattr(args, "components", None) or installed
+        not_installed = [name for name in components if name not in installed]
+        if not_installed:
+            logger.error(get_string("update.components.not_installed", not_installed))
+            return 1
+
+        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+        registry.discover_components()
+        instances = registry.create_component_instances(components, args.install_dir)
+
+        deep = getattr(args, "deep", False)
+        if not args.quiet:
+            mode = get_string("verify.run.deep") if deep else get_string("verify.run.quick")
+            display_header(get_string("verify.run.header"), f"{args.install_dir} ({mode})")
+
+        with logger.span("verify.scan", components=list(instances), deep=deep) as span:
+            reports = scan_components(list(instances.values()), deep, getattr(args, "max_workers", None))
+            span.set(files=sum(report["checked"] for report in reports.values()))
+        display_reports(reports)
+
+        broken = [name for name, report in reports.items() if not is_intact(report)]
+        if broken:
+            display_error(get_string("verify.run.failed", ", ".join(broken)))
+            if not deep:
+                logger.info(get_string("verify.run.try_deep"))
+            return 1
+
+        display_success(get_string("verify.run.success", len(reports)))
+        return 0
+
+    except Exception as e:
+        return operation.handle_operation_error("verify", e)
@@ -1,11 +1,12 @@
 """Utility modules for SuperClaude installation system"""
 
-from .ui import ProgressBar, Menu, confirm, Colors
+from .ui import ProgressBar, MultiProgressBar, Menu, confirm, Colors
 from .logger import Logger
 from .security import SecurityValidator
 
 __all__ = [
     'ProgressBar',
+    'MultiProgressBar',
     'Menu', 
     'confirm',
     'Colors',
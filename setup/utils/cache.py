@@ -0,0 +1,53 @@
+"""
+User cache directory for SuperClaude installer artifacts
+
+Derived data (compiled locale catalogs, discovery manifests, ...) is stored
+here so it can be reused across runs. Everything in it can be deleted at
+any time and is rebuilt on demand.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+
+def get_cache_root() -> Path:
+    """
+    Resolve the cache root directory
+
+    SUPERCLAUDE_CACHE_DIR takes precedence, followed by the platform cache
+    location (XDG_CACHE_HOME, LOCALAPPDATA on Windows, ~/.cache).
+
+    Returns:
+        Path to the cache root (not created)
+    """
+    override = os.environ.get("SUPERCLAUDE_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "SuperClaude" / "cache"
+
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "superclaude"
+
+
+def get_cache_dir(*parts: str) -> Optional[Path]:
+    """
+    Get (and create) a subdirectory of the cache root
+
+    Args:
+        *parts: Path components below the cache root
+
+    Returns:
+        Path to the directory, or None if it cannot be created (read-only
+        home, sandbox, ...). Callers must treat the cache as optional.
+    """
+    cache_dir = get_cache_root().joinpath(*parts)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir
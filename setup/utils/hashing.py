@@ -0,0 +1,267 @@
+"""
+File hashing service
+
+Manifests, update plans, integrity scans and fleet source checks all hash
+the same trees over and over. The service here makes that cheap:
+
+- small files are read in one call, large ones memory-mapped, so hashlib
+  sees big buffers (and releases the GIL while it digests them)
+- batches are hashed on a thread pool
+- BLAKE2b is the default algorithm; it is faster than SHA-256 in pure
+  software and just as suitable for change detection (CPUs with SHA
+  extensions run SHA-256 in hardware, see benchmarks/bench_hashing.py)
+- digests are cached by (device, inode, mtime, size) in the SuperClaude
+  cache directory and reused across runs for files that did not change
+
+A file modified twice within the same second may keep its mtime and size,
+so entries for files changed in the last RACY_WINDOW seconds are not
+cached. Callers that must not trust file metadata at all (deep integrity
+checks) pass use_cache=False.
+"""
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import stat as stat_module
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .cache import get_cache_dir, get_cache_root
+
+DEFAULT_ALGORITHM = "blake2b"
+
+# Files up to this size are read in one call, larger ones are memory-mapped
+MMAP_THRESHOLD = 1024 * 1024
+
+# Upper bound for the default number of hashing threads
+DEFAULT_MAX_WORKERS = 8
+
+# Entries kept in a persisted cache; the least recently stored are dropped
+MAX_CACHE_ENTRIES = 50000
+
+# Seconds after a modification during which a file's digest is not cached
+RACY_WINDOW = 2.0
+
+# Bump when the cache layout changes
+CACHE_VERSION = 1
+
+
+def _new_hasher(algorithm: str):
+    return hashlib.new(algorithm)
+
+
+def hash_bytes(data: bytes, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Digest of in-memory content, comparable to hash_file()"""
+    hasher = _new_hasher(algorithm)
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def hash_file(path: Path, algorithm: str = DEFAULT_ALGORITHM, size: Optional[int] = None) -> str:
+    """
+    Digest of a file's content, without any caching
+
+    Args:
+        path: File to hash
+        algorithm: hashlib algorithm name
+        size: File size if already known (saves a stat)
+
+    Returns:
+        Hex digest
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    hasher = _new_hasher(algorithm)
+    with open(path, "rb") as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size <= MMAP_THRESHOLD:
+            hasher.update(f.read())
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+    return hasher.hexdigest()
+
+
+class HashCache:
+    """Digests by file identity, persisted as JSON in the cache directory"""
+
+    def __init__(self, path: Optional[Path]):
+        """
+        Initialize cache
+
+        Args:
+            path: Cache file, or None to keep entries in memory only
+        """
+        self.path = path
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    @staticmethod
+    def key(stat: os.stat_result) -> str:
+        return f"{stat.st_dev}:{stat.st_ino}"
+
+    def _load(self) -> None:
+        self._loaded = True
+        if self.path is None:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._entries = {key: tuple(value) for key, value in data.get("entries", {}).items()}
+
+    def get(self, stat: os.stat_result) -> Optional[str]:
+        """Cached digest for a file, None if it is unknown or changed since"""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(self.key(stat))
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        return None
+
+    def put(self, stat: os.stat_result, digest: str) -> None:
+        """Remember a digest unless the file was modified too recently to trust its mtime"""
+        if time.time() - stat.st_mtime_ns / 1e9 < RACY_WINDOW:
+            return
+        key = self.key(stat)
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            # Re-inserted entries move to the end, so trimming drops the oldest
+            self._entries.pop(key, None)
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed; failures only cost the reuse"""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            if len(self._entries) > MAX_CACHE_ENTRIES:
+                for key in list(self._entries)[:len(self._entries) - MAX_CACHE_ENTRIES]:
+                    del self._entries[key]
+            data = {"version": CACHE_VERSION, "entries": self._entries}
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+class HashService:
+    """Cached, parallel file hashing for one algorithm"""
+
+    def __init__(self, algorithm: str = DEFAULT_ALGORITHM, cache: Optional[HashCache] = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize service
+
+        Args:
+            algorithm: hashlib algorithm name
+            cache: Digest cache (default: in memory only)
+            max_workers: Default number of hashing threads for batches
+        """
+        _new_hasher(algorithm)  # ValueError for unknown algorithms
+        self.algorithm = algorithm
+        self.cache = cache if cache is not None else HashCache(None)
+        self.max_workers = max_workers or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+
+    def hash_file(self, path: Path, use_cache: bool = True) -> Optional[str]:
+        """
+        Digest of a file
+
+        Args:
+            path: File to hash
+            use_cache: Reuse a cached digest if the file is unchanged
+
+        Returns:
+            Hex digest, or None if path is not a readable file
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not stat_module.S_ISREG(stat.st_mode):
+            return None
+        if use_cache:
+            digest = self.cache.get(stat)
+            if digest is not None:
+                return digest
+        try:
+            digest = hash_file(path, self.algorithm, stat.st_size)
+        except OSError:
+            return None
+        self.cache.put(stat, digest)
+        return digest
+
+    def hash_files(self, paths: Iterable[Path], use_cache: bool = True,
+                   max_workers: Optional[int] = None) -> Dict[Path, Optional[str]]:
+        """
+        Digests of many files, hashed concurrently
+
+        Args:
+            paths: Files to hash
+            use_cache: Reuse cached digests of unchanged files
+            max_workers: Hashing threads (default: the service default)
+
+        Returns:
+            Path -> hex digest, None for files that are missing or unreadable
+        """
+        paths: List[Path] = list(dict.fromkeys(paths))
+        workers = max(1, min(max_workers or self.max_workers, len(paths)))
+        if workers == 1:
+            digests = [self.hash_file(path, use_cache) for path in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash") as executor:
+                digests = list(executor.map(lambda path: self.hash_file(path, use_cache), paths))
+        self.cache.save()
+        return dict(zip(paths, digests))
+
+
+_services: Dict[Tuple[str, Path], HashService] = {}
+_services_lock = threading.Lock()
+
+
+def get_hash_service(algorithm: str = DEFAULT_ALGORITHM) -> HashService:
+    """
+    Process-wide service for an algorithm, with its cache persisted in the
+    current cache directory
+
+    Raises:
+        ValueError: If hashlib does not support the algorithm
+    """
+    root = get_cache_root()
+    with _services_lock:
+        service = _services.get((algorithm, root))
+        if service is None:
+            cache_dir = get_cache_dir("hashes")
+            cache = HashCache(cache_dir / f"{algorithm}.json" if cache_dir else None)
+            service = _services[(algorithm, root)] = HashService(algorithm, cache)
+        return service
+
+
+@atexit.register
+def _save_caches() -> None:
+    """Persist digests of single-file lookups made outside of batches"""
+    with _services_lock:
+        services = list(_services.values())
+    for service in services:
+        service.cache.save()
@@ -1,35 +1,271 @@
 import json
+import marshal
+import mmap
 import os
-from typing import Dict, Optional
+import string
+import struct
+from typing import Any, Dict, List, Optional, Tuple
 
-_translations: Dict[str, str] = {}
+from .cache import get_cache_dir
+
+_translations: Optional[Dict[str, str]] = None
+_templates: Dict[str, Optional["_Template"]] = {}
 _language: str = "en"
 
+# Catalogs already loaded in this process, keyed by language
+_catalogs: Dict[str, Dict[str, str]] = {}
+
+_LOCALES_DIR = os.path.join(os.path.dirname(__file__), "locales")
+
+# Compiled catalog layout: header followed by a marshalled dict.
+# The header pins the file format, the marshal format of the running
+# interpreter and the source file it was built from (mtime + size).
+CATALOG_MAGIC = b"SCLC"
+CATALOG_VERSION = 1
+_HEADER = struct.Struct("<4sHHqq")
+
+
 def set_language(language: str = "en"):
     """
     Sets the language for the application.
 
+    The catalog itself is loaded on the first lookup, so switching language
+    at startup costs nothing.
+
     Args:
         language: The language code (e.g., "en", "ja").
     """
     global _language, _translations
     _language = language
+    _translations = None
+    _templates.clear()
+
+
+def get_language() -> str:
+    """Currently selected language code"""
+    return _language
+
+
+def get_locale_file(language: Optional[str] = None) -> Optional[str]:
+    """
+    Path of the locale JSON used for a language
+
+    Args:
+        language: The language code; defaults to the current language
+
+    Returns:
+        Path to the file, falling back to English, or None if missing
+    """
+    return _locale_file(language or _language)
+
+
+def _locale_file(language: str) -> Optional[str]:
+    """Path of the locale JSON for a language, falling back to English"""
+    for candidate in (language, "en"):
+        locale_file = os.path.join(_LOCALES_DIR, f"{candidate}.json")
+        if os.path.exists(locale_file):
+            return locale_file
+    return None
+
+
+def _catalog_header(locale_file: str) -> bytes:
+    """Expected header for the compiled form of a locale file"""
+    stat = os.stat(locale_file)
+    return _HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, marshal.version,
+                        stat.st_mtime_ns, stat.st_size)
+
+
+def _catalog_path(locale_file: str) -> Optional[str]:
+    """Path of the compiled catalog in the user cache"""
+    cache_dir = get_cache_dir("locales")
+    if cache_dir is None:
+        return None
+    name = os.path.splitext(os.path.basename(locale_file))[0]
+    return str(cache_dir / f"{name}.catalog")
+
+
+def compile_catalog(language: str) -> Tuple[Dict[str, str], Optional[str]]:
+    """
+    Parse a locale JSON file and write its compiled catalog to the cache
+
+    Args:
+        language: The language code (e.g., "en", "ja").
+
+    Returns:
+        Tuple of (translations, compiled catalog path or None if not written)
+    """
+    locale_file = _locale_file(language)
+    if locale_file is None:
+        return {}, None
+
+    with open(locale_file, "r", encoding="utf-8") as f:
+        translations = json.loads(f.read())
+
+    catalog_path = _catalog_path(locale_file)
+    if catalog_path is None:
+        return translations, None
+
+    # Write to a temporary name first so concurrent readers never see a
+    # partially written catalog
+    tmp_path = f"{catalog_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_catalog_header(locale_file))
+            f.write(marshal.dumps(translations))
+        os.replace(tmp_path, catalog_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return translations, None
+
+    return translations, catalog_path
+
+
+def _read_catalog(locale_file: str) -> Optional[Dict[str, str]]:
+    """Load a compiled catalog if it is current, else None"""
+    catalog_path = _catalog_path(locale_file)
+    if catalog_path is None:
+        return None
+
+    try:
+        expected = _catalog_header(locale_file)
+        with open(catalog_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if mapped[:_HEADER.size] != expected:
+                    return None
+                translations = marshal.loads(mapped[_HEADER.size:])
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
 
-    # Construct the path to the locale file
-    current_dir = os.path.dirname(__file__)
-    locale_file = os.path.join(current_dir, "locales", f"{language}.json")
+    return translations if isinstance(translations, dict) else None
 
-    if os.path.exists(locale_file):
-        with open(locale_file, "r", encoding="utf-8") as f:
-            _translations = json.load(f)
+
+def load_catalog(language: str) -> Dict[str, str]:
+    """
+    Get the translations for a language, compiling the catalog if needed
+
+    Args:
+        language: The language code (e.g., "en", "ja").
+
+    Returns:
+        Mapping of message keys to templates
+    """
+    translations = _catalogs.get(language)
+    if translations is not None:
+        return translations
+
+    locale_file = _locale_file(language)
+    if locale_file is None:
+        translations = {}
     else:
-        # Fallback to English if the language file is not found
-        en_locale_file = os.path.join(current_dir, "locales", "en.json")
-        if os.path.exists(en_locale_file):
-            with open(en_locale_file, "r", encoding="utf-8") as f:
-                _translations = json.load(f)
+        translations = _read_catalog(locale_file)
+        if translations is None:
+            translations, _ = compile_catalog(language)
+
+    _catalogs[language] = translations
+    return translations
+
+
+# A positional field: argument index, conversion ("r", "s", "a" or None), format spec
+_Field = Tuple[int, Optional[str], str]
+
+_CONVERSIONS = {"r": repr, "s": str, "a": ascii}
+
+
+class _Template:
+    """
+    A message template parsed once into a %-format string and its fields
+
+    Fields are rendered with format() only where they have a conversion or
+    format spec; templates using each argument once, in order, are a single
+    % operation.
+    """
+
+    __slots__ = ("text", "fields", "arg_count", "direct")
+
+    def __init__(self, text: Optional[str], fields: Tuple[_Field, ...] = ()):
+        """
+        Args:
+            text: Literal text with a %s per field, None for a malformed template
+            fields: Fields in order of appearance
+        """
+        self.text = text
+        self.fields = fields
+        self.arg_count = max((index + 1 for index, _, _ in fields), default=0)
+        self.direct = text is not None and all(
+            field == (position, None, "") for position, field in enumerate(fields)
+        )
+
+    def render(self, args: Tuple[Any, ...]) -> Optional[str]:
+        """The formatted message, None if the template is malformed or args do not fit"""
+        if self.text is None or len(args) < self.arg_count:
+            return None
+        if self.direct:
+            return self.text % args[:self.arg_count]
+        values = []
+        for index, conversion, spec in self.fields:
+            value = args[index]
+            if conversion is not None:
+                value = _CONVERSIONS[conversion](value)
+            if spec:
+                try:
+                    value = format(value, spec)
+                except (TypeError, ValueError):
+                    # e.g. "{0:.1f}" given a string
+                    return None
+            values.append(value)
+        return self.text % tuple(values)
+
+
+def _compile_template(message: str) -> Optional[_Template]:
+    """
+    Parse a message template, like str.format would
+
+    Returns:
+        The template, None for plain text without braces
+    """
+    if "{" not in message and "}" not in message:
+        return None
+    try:
+        parsed = list(string.Formatter().parse(message))
+    except ValueError:
+        return _Template(None)
+
+    pieces: List[str] = []
+    fields: List[_Field] = []
+    auto_index = 0
+    numbered = False
+    for literal, field, spec, conversion in parsed:
+        pieces.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if field == "":
+            index = auto_index
+            auto_index += 1
+        elif field.isdigit():
+            index = int(field)
+            numbered = True
         else:
-            _translations = {}
+            # Named fields and attribute access are not used by the catalogs
+            return _Template(None)
+        if (auto_index and numbered) or conversion not in (None, "r", "s", "a") or "{" in spec:
+            return _Template(None)
+        pieces.append("%s")
+        fields.append((index, conversion, spec))
+    return _Template("".join(pieces), tuple(fields))
+
+
+def _get_template(key: str, message: str) -> Optional[_Template]:
+    """Compiled template of a message, None for plain text"""
+    try:
+        return _templates[key]
+    except KeyError:
+        template = _compile_template(message)
+        _templates[key] = template
+        return template
+
 
 def get_string(key: str, *args) -> str:
     """
@@ -42,6 +278,10 @@ def get_string(key: str, *args) -> str:
     Returns:
         The translated and formatted string, or the key itself if not found.
     """
+    global _translations
+    if _translations is None:
+        _translations = load_catalog(_language)
+
     message = _translations.get(key)
     if message is None:
         # Return a user-friendly fallback: try to join args into a readable form
@@ -49,15 +289,21 @@ def get_string(key: str, *args) -> str:
             return f"{key}: " + ", ".join(str(a) for a in args)
         return key
 
-    try:
-        if args:
-            return message.format(*args)
+    if not args:
         return message
-    except Exception:
-        # If formatting fails, return message with args appended
-        if args:
-            return message + " " + ", ".join(str(a) for a in args)
+
+    template = _get_template(key, message)
+    if template is None:
         return message
 
+    if template.direct and len(args) == template.arg_count:
+        return template.text % args
+
+    text = template.render(args)
+    if text is None:
+        # Malformed template or missing arguments: return message with args appended
+        return message + " " + ", ".join(str(a) for a in args)
+    return text
+
 # Initialize with default language
 set_language()
@@ -2,14 +2,33 @@
 Logging system for SuperClaude installation suite
 """
 
+import atexit
+import contextvars
+import copy
+import itertools
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 from enum import Enum
 
 from .ui import Colors
+from .localization import get_string
+from .output import captured_messages, record as record_message
+from .runner import get_command_stats
+from .trace import get_tracer
+
+
+# Success messages get their own level so the console formatter can style
+# them without touching shared formatter state
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
 
 
 class LogLevel(Enum):
@@ -21,6 +40,227 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class LazyMessage:
+    """
+    Localized log message resolved only when a handler emits it
+
+    logging calls str() on the message while formatting a record, which only
+    happens for records that pass the logger and handler level checks. The
+    translation lookup and formatting are therefore skipped entirely for
+    filtered records, and done at most once for records sent to several
+    handlers. With the default file level (DEBUG) debug records do reach the
+    log file; they are resolved there, on the log writer thread.
+    """
+
+    __slots__ = ('key', 'args', '_text')
+
+    def __init__(self, key: str, *args: Any):
+        """
+        Initialize lazy message
+
+        Args:
+            key: Localization key
+            *args: Arguments for the localized template
+        """
+        self.key = key
+        self.args = args
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = get_string(self.key, *self.args)
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"LazyMessage({self.key!r}, {len(self.args)} args)"
+
+
+# Innermost open span of the current thread/context
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("superclaude_span", default=None)
+_span_ids = itertools.count(1)
+
+
+def current_span() -> Optional["Span"]:
+    """Return the innermost open span, if any"""
+    return _current_span.get()
+
+
+class Span:
+    """
+    Timed section of work recorded as one structured log record
+
+    Created through Logger.span() and used as a context manager. Spans opened
+    inside another span record it as their parent, and byte counts roll up
+    into the parent when a span ends.
+    """
+
+    def __init__(self, logger: "Logger", name: str, fields: Dict[str, Any]):
+        """
+        Initialize span
+
+        Args:
+            logger: Logger that receives the finished span
+            name: Dotted span name, e.g. "install.component"
+            fields: Extra fields stored with the span
+        """
+        self.logger = logger
+        self.name = name
+        self.fields = fields
+        self.span_id = next(_span_ids)
+        self.parent: Optional[Span] = None
+        self.bytes = 0
+        self.outcome: Optional[str] = None
+        self.start_time = 0.0
+        self._start_counter = 0.0
+        self._token = None
+
+    def __enter__(self) -> "Span":
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self)
+        self.start_time = time.time()
+        self._start_counter = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        duration = self.elapsed()
+        _current_span.reset(self._token)
+
+        if exc_type is not None:
+            self.outcome = "error"
+            self.fields.setdefault("error", f"{exc_type.__name__}: {exc_value}")
+        elif self.outcome is None:
+            self.outcome = "ok"
+
+        if self.parent is not None:
+            self.parent.bytes += self.bytes
+
+        self.logger._emit_span(self, duration)
+
+        tracer = get_tracer()
+        if tracer is not None:
+            args = dict(self.fields, bytes=self.bytes, outcome=self.outcome)
+            tracer.add_complete(self.name, "span", tracer.timestamp_us(self._start_counter),
+                                duration * 1e6, args)
+        return False
+
+    def elapsed(self) -> float:
+        """Seconds since the span was entered"""
+        return time.perf_counter() - self._start_counter
+
+    def add_bytes(self, count: int) -> None:
+        """Add to the number of bytes processed within this span"""
+        self.bytes += count
+
+    def set(self, **fields: Any) -> None:
+        """Attach additional fields to the span"""
+        self.fields.update(fields)
+
+    def set_outcome(self, outcome: str) -> None:
+        """
+        Record the outcome explicitly
+
+        Args:
+            outcome: e.g. "ok", "failed", "skipped"; exceptions always give "error"
+        """
+        self.outcome = outcome
+
+    def to_dict(self, duration: float) -> Dict[str, Any]:
+        """Structured representation written to the JSON-lines sink"""
+        return {
+            'span': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'start': self.start_time,
+            'end': self.start_time + duration,
+            'duration': round(duration, 6),
+            'bytes': self.bytes,
+            'outcome': self.outcome,
+            'fields': self.fields,
+        }
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats each record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            'ts': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+        }
+        span = getattr(record, 'span', None)
+        if span is not None:
+            entry['event'] = 'span'
+            entry.update(span)
+        else:
+            entry['event'] = 'log'
+            entry['message'] = record.getMessage()
+            if record.exc_text:
+                entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _not_span_record(record: logging.LogRecord) -> bool:
+    """Console filter: spans only go to the log files"""
+    return not hasattr(record, 'span')
+
+
+def _not_captured_record(record: logging.LogRecord) -> bool:
+    """Console filter: inside capture_output() records are collected instead of printed"""
+    messages = captured_messages()
+    if messages is None:
+        return True
+    record_message(messages, record.levelname, record.getMessage())
+    return False
+
+
+class _FileQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps LazyMessage objects unresolved
+
+    The stock prepare() formats the record in the calling thread, which
+    would defeat lazy messages. Only tracebacks are rendered here, since
+    exc_info must not outlive the caller's frame.
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# Listeners still running; stopped (and drained) at interpreter exit
+_active_listeners: Set[logging.handlers.QueueListener] = set()
+_listeners_lock = threading.Lock()
+
+
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Drain and stop a listener, ignoring ones that already stopped"""
+    with _listeners_lock:
+        if listener not in _active_listeners:
+            return
+        _active_listeners.discard(listener)
+    listener.stop()
+
+
+@atexit.register
+def _shutdown_listeners() -> None:
+    """Flush every pending log record before the process exits"""
+    with _listeners_lock:
+        listeners = list(_active_listeners)
+    for listener in listeners:
+        _stop_listener(listener)
+
+
 class Logger:
     """Enhanced logger with console and file output"""
     
@@ -40,16 +280,23 @@ class Logger:
         self.file_level = file_level
         self.session_start = datetime.now()
         
-        # Create logger
+        # Create logger; it owns its handlers, so records must not also
+        # bubble up to a parent logger (e.g. "superclaude.registry")
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)  # Accept all levels, handlers will filter
+        self.logger.propagate = False
         
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
         
         # Setup handlers
+        self.console_handler: Optional[logging.Handler] = None
+        self.file_handler: Optional[logging.Handler] = None
+        self.json_handler: Optional[logging.Handler] = None
+        self.queue_handler: Optional[logging.Handler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
         self._setup_console_handler()
         self._setup_file_handler()
+        self._update_logger_level()
         
         self.log_counts: Dict[str, int] = {
             'debug': 0,
@@ -71,6 +318,7 @@ class Logger:
                 colors = {
                     'DEBUG': Colors.WHITE,
                     'INFO': Colors.BLUE,
+                    'SUCCESS': Colors.GREEN,
                     'WARNING': Colors.YELLOW,
                     'ERROR': Colors.RED,
                     'CRITICAL': Colors.RED + Colors.BRIGHT
@@ -80,6 +328,7 @@ class Logger:
                 prefixes = {
                     'DEBUG': '[DEBUG]',
                     'INFO': '[INFO]',
+                    'SUCCESS': '[OK]',
                     'WARNING': '[!]',
                     'ERROR': '[ERROR]',
                     'CRITICAL': '[CRITICAL]'
@@ -91,7 +340,10 @@ class Logger:
                 return f"{color}{prefix} {record.getMessage()}{Colors.RESET}"
         
         handler.setFormatter(ColorFormatter())
+        handler.addFilter(_not_span_record)
+        handler.addFilter(_not_captured_record)
         self.logger.addHandler(handler)
+        self.console_handler = handler
     
     def _setup_file_handler(self) -> None:
         """Setup file handler with rotation"""
@@ -113,8 +365,30 @@ class Logger:
             )
             handler.setFormatter(formatter)
             
-            self.logger.addHandler(handler)
+            # Machine-readable twin of the text log, including timing spans
+            json_file = self.log_dir / f"{self.name}_{timestamp}.jsonl"
+            json_handler = logging.FileHandler(json_file, encoding='utf-8')
+            json_handler.setLevel(self.file_level.value)
+            json_handler.setFormatter(JsonLinesFormatter())
+            
+            # File writes happen on a dedicated thread; callers only enqueue.
+            # The console stays synchronous so log lines keep their order
+            # relative to print()-based UI output such as progress bars.
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+            queue_handler = _FileQueueHandler(log_queue)
+            queue_handler.setLevel(self.file_level.value)
+            listener = logging.handlers.QueueListener(log_queue, handler, json_handler, respect_handler_level=True)
+            listener.start()
+            with _listeners_lock:
+                _active_listeners.add(listener)
+            
+            self.logger.addHandler(queue_handler)
+            self.file_handler = handler
+            self.json_handler = json_handler
+            self.queue_handler = queue_handler
+            self.listener = listener
             self.log_file = log_file
+            self.json_log_file = json_file
             
             # Clean up old log files (keep last 10)
             self._cleanup_old_logs()
@@ -123,26 +397,55 @@ class Logger:
             # If file logging fails, continue with console only
             print(f"{Colors.YELLOW}[!] Could not setup file logging: {e}{Colors.RESET}")
             self.log_file = None
+            self.json_log_file = None
     
     def _cleanup_old_logs(self, keep_count: int = 10) -> None:
         """Clean up old log files"""
         try:
             # Get all log files for this logger
-            log_files = list(self.log_dir.glob(f"{self.name}_*.log"))
-            
-            # Sort by modification time, newest first
-            log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            # Remove old files
-            for old_file in log_files[keep_count:]:
-                try:
-                    old_file.unlink()
-                except OSError:
-                    pass  # Ignore errors when cleaning up
+            for pattern in (f"{self.name}_*.log", f"{self.name}_*.jsonl"):
+                log_files = list(self.log_dir.glob(pattern))
+                
+                # Sort by modification time, newest first
+                log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+                
+                # Remove old files
+                for old_file in log_files[keep_count:]:
+                    try:
+                        old_file.unlink()
+                    except OSError:
+                        pass  # Ignore errors when cleaning up
                     
         except Exception:
             pass  # Ignore cleanup errors
     
+    def _update_logger_level(self) -> None:
+        """
+        Set the logger level to the lowest handler level
+
+        Records below every handler's level are then rejected by the logger
+        itself, before a LogRecord is even created.
+        """
+        levels = [handler.level for handler in (self.console_handler, self.queue_handler) if handler]
+        self.logger.setLevel(min(levels) if levels else logging.DEBUG)
+
+    # Build a localized message that is only resolved if it is emitted. A
+    # plain class attribute, so the call costs no extra bound-method hop:
+    #     logger.debug(logger.lazy("component.install.copying", name, target))
+    lazy = LazyMessage
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Check whether a message of the given level would be emitted
+
+        Args:
+            level: Level to check
+
+        Returns:
+            True if at least one handler accepts the level
+        """
+        return self.logger.isEnabledFor(level.value)
+
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message"""
         self.logger.debug(message, **kwargs)
@@ -169,24 +472,8 @@ class Logger:
         self.log_counts['critical'] += 1
     
     def success(self, message: str, **kwargs) -> None:
-        """Log success message (info level with special formatting)"""
-        # Use a custom success formatter for console
-        if self.logger.handlers:
-            console_handler = self.logger.handlers[0]
-            if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
-                def success_format(record):
-                    return f"{Colors.GREEN}[OK] {record.getMessage()}{Colors.RESET}"
-                
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
-            else:
-                self.logger.info(f"SUCCESS: {message}", **kwargs)
-        else:
-            self.logger.info(f"SUCCESS: {message}", **kwargs)
-        
+        """Log success message (SUCCESS level, shown as [OK] on the console)"""
+        self.logger.log(SUCCESS, message, **kwargs)
         self.log_counts['info'] += 1
     
     def step(self, step: int, total: int, message: str, **kwargs) -> None:
@@ -206,6 +493,33 @@ class Logger:
         self.logger.error(message, exc_info=exc_info, **kwargs)
         self.log_counts['error'] += 1
     
+    def span(self, name: str, **fields: Any) -> Span:
+        """
+        Time a section of work and record it in the JSON-lines log
+
+        Usage:
+            with logger.span("install.component", name="core") as span:
+                ...
+                span.add_bytes(size)
+
+        Args:
+            name: Dotted span name
+            **fields: Extra fields stored with the span
+
+        Returns:
+            Span context manager
+        """
+        return Span(self, name, fields)
+
+    def _emit_span(self, span: Span, duration: float) -> None:
+        """Send a finished span to the file sinks"""
+        data = span.to_dict(duration)
+        self.logger.log(
+            logging.INFO,
+            f"span {span.name} {span.outcome} {duration:.3f}s {span.bytes}B",
+            extra={'span': data}
+        )
+
     def log_system_info(self, info: Dict[str, Any]) -> None:
         """Log system information"""
         self.section("System Information")
@@ -238,25 +552,39 @@ class Logger:
             'log_counts': self.log_counts.copy(),
             'total_messages': sum(self.log_counts.values()),
             'log_file': str(self.log_file) if hasattr(self, 'log_file') and self.log_file else None,
-            'has_errors': self.log_counts['error'] + self.log_counts['critical'] > 0
+            'json_log_file': str(self.json_log_file) if getattr(self, 'json_log_file', None) else None,
+            'has_errors': self.log_counts['error'] + self.log_counts['critical'] > 0,
+            'subprocess': get_command_stats()
         }
     
     def set_console_level(self, level: LogLevel) -> None:
         """Change console logging level"""
         self.console_level = level
-        if self.logger.handlers:
-            self.logger.handlers[0].setLevel(level.value)
+        if self.console_handler:
+            self.console_handler.setLevel(level.value)
+        self._update_logger_level()
     
     def set_file_level(self, level: LogLevel) -> None:
         """Change file logging level"""
         self.file_level = level
-        if len(self.logger.handlers) > 1:
-            self.logger.handlers[1].setLevel(level.value)
+        if self.file_handler:
+            self.file_handler.setLevel(level.value)
+            self.json_handler.setLevel(level.value)
+            self.queue_handler.setLevel(level.value)
+        self._update_logger_level()
     
     def flush(self) -> None:
-        """Flush all handlers"""
-        for handler in self.logger.handlers:
-            if hasattr(handler, 'flush'):
+        """Write out all pending records, waiting for the file writer thread"""
+        # Held throughout so close() or the exit hook cannot stop the listener
+        # between the check and the restart
+        with _listeners_lock:
+            if self.listener is not None and self.listener in _active_listeners:
+                # QueueListener has no drain call; stop() processes everything
+                # queued so far and joins the thread, then we resume
+                self.listener.stop()
+                self.listener.start()
+        for handler in (self.console_handler, self.file_handler, self.json_handler):
+            if handler is not None:
                 handler.flush()
     
     def close(self) -> None:
@@ -268,26 +596,43 @@ class Logger:
         self.info(f"Messages logged: {stats['total_messages']}")
         if stats['has_errors']:
             self.warning(f"Errors/warnings: {stats['log_counts']['error'] + stats['log_counts']['warning']}")
-        
+        subprocess_stats = stats['subprocess']
+        if subprocess_stats['calls'] or subprocess_stats['cache_hits']:
+            self.info(f"External commands: {subprocess_stats['calls']} run "
+                      f"({subprocess_stats['total_seconds']:.1f}s), "
+                      f"{subprocess_stats['cache_hits']} cached")
+
         if stats['log_file']:
             self.info(f"Full log saved to: {stats['log_file']}")
         
-        # Close all handlers
+        # Drain the writer thread, then close all handlers
+        if self.listener is not None:
+            _stop_listener(self.listener)
         for handler in self.logger.handlers[:]:
-            handler.close()
             self.logger.removeHandler(handler)
+            handler.close()
+        for handler in (self.file_handler, self.json_handler):
+            if handler is not None:
+                handler.close()
 
 
 # Global logger instance
 _global_logger: Optional[Logger] = None
 
+# Loggers created so far, by name. Each one owns a log file and a writer
+# thread, so switching between names must not rebuild them.
+_loggers: Dict[str, Logger] = {}
+
 
 def get_logger(name: str = "superclaude") -> Logger:
     """Get or create global logger instance"""
     global _global_logger
     
     if _global_logger is None or _global_logger.name != name:
-        _global_logger = Logger(name)
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = _loggers[name] = Logger(name)
+        _global_logger = logger
     
     return _global_logger
 
@@ -295,7 +640,13 @@ def get_logger(name: str = "superclaude") -> Logger:
 def setup_logging(name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG) -> Logger:
     """Setup logging with specified configuration"""
     global _global_logger
-    _global_logger = Logger(name, log_dir, console_level, file_level)
+    previous = _loggers.get(name)
+    if previous is not None and previous.listener is not None:
+        # The new instance takes over the stdlib logger; let the old writer finish
+        _stop_listener(previous.listener)
+        previous.file_handler.close()
+        previous.json_handler.close()
+    _global_logger = _loggers[name] = Logger(name, log_dir, console_level, file_level)
     return _global_logger
 
 
@@ -0,0 +1,138 @@
+"""
+Per-context suppression of terminal output
+
+The installer, components and managers report progress with print(),
+display_*() and the console log handler. Code embedding the installer (see
+SuperClaude.api) runs that code inside capture_output() instead: within the
+block, everything the current thread (or context) would print is recorded
+as messages and nothing reaches the terminal. Other threads keep printing
+normally, so a service can run captured installs next to regular output.
+"""
+
+import contextlib
+import contextvars
+import re
+import sys
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+_ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+# Messages of the active capture block, None outside of one
+_captured: "contextvars.ContextVar[Optional[List[Dict[str, str]]]]" = contextvars.ContextVar(
+    "superclaude_captured_output", default=None
+)
+
+_install_lock = threading.Lock()
+
+# Active capture blocks in all threads; the streams are routed while it is > 0
+_active_captures = 0
+
+
+class _RoutedStream:
+    """Stream wrapper that diverts writes made inside capture_output()"""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+        self._pending: Dict[int, str] = {}
+
+    def write(self, text: str) -> int:
+        messages = _captured.get()
+        if messages is None:
+            return self._stream.write(text)
+        # Collect whole lines; print() writes the text and the newline separately
+        ident = threading.get_ident()
+        buffered = self._pending.pop(ident, "") + text
+        *lines, rest = buffered.split("\n")
+        for line in lines:
+            record(messages, "output", line)
+        if rest:
+            self._pending[ident] = rest
+        return len(text)
+
+    def take_pending(self) -> str:
+        """Remove and return this thread's text after its last newline"""
+        return self._pending.pop(threading.get_ident(), "")
+
+    def flush(self) -> None:
+        if _captured.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def _install() -> None:
+    """Route sys.stdout and sys.stderr (again, if something replaced them)"""
+    global _active_captures
+    with _install_lock:
+        _active_captures += 1
+        if not isinstance(sys.stdout, _RoutedStream):
+            sys.stdout = _RoutedStream(sys.stdout)
+        if not isinstance(sys.stderr, _RoutedStream):
+            sys.stderr = _RoutedStream(sys.stderr)
+
+
+def _uninstall() -> None:
+    """Put the original streams back once the last capture block exited"""
+    global _active_captures
+    with _install_lock:
+        _active_captures -= 1
+        if _active_captures:
+            return
+        # Streams replaced by someone else in the meantime are left alone
+        if isinstance(sys.stdout, _RoutedStream):
+            sys.stdout = sys.stdout._stream
+        if isinstance(sys.stderr, _RoutedStream):
+            sys.stderr = sys.stderr._stream
+
+
+def record(messages: List[Dict[str, str]], level: str, text: str) -> None:
+    """Append a message, without color codes or trailing space; blank lines are dropped"""
+    text = _ANSI_PATTERN.sub("", text).rstrip()
+    if text:
+        messages.append({"level": level, "message": text})
+
+
+def is_captured() -> bool:
+    """True inside a capture_output() block of the current context"""
+    return _captured.get() is not None
+
+
+def captured_messages() -> Optional[List[Dict[str, str]]]:
+    """Message list of the active capture block, None outside of one"""
+    return _captured.get()
+
+
+@contextlib.contextmanager
+def capture_output() -> Iterator[List[Dict[str, str]]]:
+    """
+    Record instead of print everything written in this context
+
+    Usage:
+        with capture_output() as messages:
+            installer.install_components(...)
+        # messages: [{"level": "output", "message": "..."}, ...]
+
+    Log records from the console handler keep their level ("INFO",
+    "WARNING", ...); plain prints and display_*() calls have level
+    "output". Prompts (confirm, Menu) must not be reached inside the block.
+    sys.stdout and sys.stderr are wrapped while any thread is inside a
+    capture block and restored when the last one exits.
+
+    Yields:
+        List the messages are appended to
+    """
+    _install()
+    messages: List[Dict[str, str]] = []
+    token = _captured.set(messages)
+    try:
+        yield messages
+    finally:
+        # Keep a last line written without a newline, and do not leak it
+        # into the thread's next capture block
+        for stream in (sys.stdout, sys.stderr):
+            if isinstance(stream, _RoutedStream):
+                record(messages, "output", stream.take_pending())
+        _captured.reset(token)
+        _uninstall()
@@ -0,0 +1,155 @@
+"""
+cProfile / tracemalloc wrapper for hub operations
+
+Only imported when --perf-profile is given, so normal runs pay nothing.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+
+class OperationProfiler:
+    """
+    Runs a callable under cProfile and optionally tracemalloc
+
+    With memory tracking, a sampler thread snapshots the traced allocations
+    whenever they exceed the largest amount seen so far, so the summary shows
+    the allocation sites at the peak rather than what survived the operation.
+    """
+
+    def __init__(self, output_dir: Path, name: str, track_memory: bool = False, top: int = 25,
+                 sample_interval: float = 0.05):
+        """
+        Initialize profiler
+
+        Args:
+            output_dir: Directory receiving the .prof file and summary
+            name: Operation name, used in the file names
+            track_memory: Also record allocations with tracemalloc
+            top: Number of entries in each summary table
+            sample_interval: Seconds between checks of the traced memory
+        """
+        self.output_dir = output_dir
+        self.name = name
+        self.track_memory = track_memory
+        self.top = top
+        self.sample_interval = sample_interval
+        self.profile = cProfile.Profile()
+        self.memory_peak: Optional[int] = None
+        self.memory_snapshot: Optional[tracemalloc.Snapshot] = None
+        # Traced memory when memory_snapshot was taken, and what holding it costs
+        self.snapshot_memory = 0
+        self._snapshot_overhead = 0
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call func with profiling enabled
+
+        Args:
+            func: Operation to profile
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        stop = threading.Event()
+        sampler = None
+        if self.track_memory:
+            tracemalloc.start()
+            sampler = threading.Thread(target=self._sample_memory, args=(stop,),
+                                       name="superclaude-memory-sampler", daemon=True)
+            sampler.start()
+        self.profile.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.profile.disable()
+            if sampler is not None:
+                stop.set()
+                sampler.join()
+                # Operations shorter than the interval are caught here
+                self._sample()
+                _, self.memory_peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+    def _sample_memory(self, stop: threading.Event) -> None:
+        """Sampler thread: check the traced memory until stop is set"""
+        while not stop.wait(self.sample_interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        """Snapshot the traced allocations if they exceed the largest sample so far"""
+        current, _ = tracemalloc.get_traced_memory()
+        # The held snapshot is itself traced; leave it out of the comparison
+        if self.memory_snapshot is not None and current - self._snapshot_overhead <= self.snapshot_memory:
+            return
+        self.memory_snapshot = None
+        before, _ = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        after, _ = tracemalloc.get_traced_memory()
+        self.memory_snapshot = snapshot
+        self.snapshot_memory = before
+        self._snapshot_overhead = max(0, after - before)
+
+    def format_summary(self) -> str:
+        """
+        Build the human-readable report
+
+        Returns:
+            Top functions by cumulative time and, with memory tracking,
+            peak traced memory and the largest allocation sites at the peak
+        """
+        out = io.StringIO()
+        out.write(f"Profile of '{self.name}' ({datetime.now().isoformat(timespec='seconds')})\n\n")
+
+        out.write(f"Top {self.top} functions by cumulative time\n")
+        out.write("=" * 60 + "\n")
+        stats = pstats.Stats(self.profile, stream=out)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+
+        out.write(f"Top {self.top} functions by internal time\n")
+        out.write("=" * 60 + "\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top)
+
+        if self.memory_snapshot is not None:
+            out.write("Memory\n")
+            out.write("=" * 60 + "\n")
+            out.write(f"Peak traced memory: {self.memory_peak / 1024:.1f} KiB\n\n")
+            out.write(f"Top {self.top} allocation sites at the largest sample "
+                      f"({self.snapshot_memory / 1024:.1f} KiB traced)\n")
+            snapshot = self.memory_snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ))
+            for stat in snapshot.statistics('lineno')[:self.top]:
+                out.write(f"  {stat}\n")
+
+        return out.getvalue()
+
+    def save(self) -> Tuple[Path, Path]:
+        """
+        Write the raw profile and the summary
+
+        Returns:
+            Tuple of (.prof path, summary path)
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = self.output_dir / f"profile_{self.name}_{timestamp}"
+
+        prof_file = base.with_suffix(".prof")
+        self.profile.dump_stats(str(prof_file))
+
+        summary_file = base.with_suffix(".txt")
+        summary_file.write_text(self.format_summary(), encoding="utf-8")
+
+        return prof_file, summary_file
+
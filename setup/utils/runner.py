@@ -0,0 +1,241 @@
+"""
+Single entry point for external commands (node, npm, claude, which, ...)
+
+Every subprocess started by the installer goes through run_command so that
+timeouts, result caching, statistics and tracing are handled in one place.
+Keyword arguments are passed to subprocess.run unchanged, apart from the
+timeout which is filled in from COMMAND_TIMEOUTS when the caller gives none.
+"""
+
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .trace import get_tracer, trace_span
+
+
+# Timeouts (seconds) by command prefix; the longest matching prefix wins
+COMMAND_TIMEOUTS: Dict[Tuple[str, ...], float] = {
+    ("claude", "mcp", "add"): 120,
+    ("claude", "mcp", "remove"): 60,
+    ("claude", "mcp", "list"): 15,
+    ("which",): 5,
+    ("where",): 5,
+}
+DEFAULT_TIMEOUT = 10
+
+# Suggested cache lifetimes (seconds) for callers opting into caching
+VERSION_CHECK_TTL = 300.0
+MCP_LIST_TTL = 30.0
+
+# Commands that change what other commands report; running one drops
+# every cached result
+INVALIDATING_COMMANDS: Tuple[Tuple[str, ...], ...] = (
+    ("claude", "mcp", "add"),
+    ("claude", "mcp", "remove"),
+)
+
+# Number of individual runs kept for inspection
+HISTORY_SIZE = 200
+
+_lock = threading.Lock()
+_cache: Dict[Tuple, Tuple[float, subprocess.CompletedProcess]] = {}
+_stats: Dict[str, Dict[str, Any]] = {}
+_history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_SIZE)
+
+
+def _matches(cmd: Sequence[str], prefix: Tuple[str, ...]) -> bool:
+    return tuple(str(part) for part in cmd[:len(prefix)]) == prefix
+
+
+def get_command_timeout(cmd: Sequence[str]) -> float:
+    """
+    Timeout applied to a command when the caller does not pass one
+
+    Args:
+        cmd: Command and arguments
+
+    Returns:
+        Timeout in seconds
+    """
+    best: Optional[Tuple[str, ...]] = None
+    for prefix in COMMAND_TIMEOUTS:
+        if _matches(cmd, prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return COMMAND_TIMEOUTS[best] if best is not None else DEFAULT_TIMEOUT
+
+
+def _command_label(cmd: Sequence[str]) -> str:
+    """Short name used for statistics and trace events"""
+    return " ".join(str(part) for part in cmd[:3])
+
+
+def _output_size(result: Any) -> int:
+    size = 0
+    for stream in (getattr(result, 'stdout', None), getattr(result, 'stderr', None)):
+        if isinstance(stream, (str, bytes)):
+            size += len(stream)
+    return size
+
+
+def _record(label: str, cmd: Sequence[str], duration: float, returncode: Optional[int],
+            output_bytes: int, outcome: str) -> None:
+    """Update counters for one command run (outcome: ok, failed, timeout, error, cached)"""
+    with _lock:
+        stats = _stats.get(label)
+        if stats is None:
+            stats = _stats[label] = {
+                'calls': 0, 'cache_hits': 0, 'failures': 0, 'timeouts': 0, 'errors': 0,
+                'total_seconds': 0.0, 'max_seconds': 0.0, 'output_bytes': 0
+            }
+
+        if outcome == 'cached':
+            stats['cache_hits'] += 1
+        else:
+            stats['calls'] += 1
+            stats['total_seconds'] += duration
+            stats['max_seconds'] = max(stats['max_seconds'], duration)
+            stats['output_bytes'] += output_bytes
+            if outcome == 'failed':
+                stats['failures'] += 1
+            elif outcome == 'timeout':
+                stats['timeouts'] += 1
+            elif outcome == 'error':
+                stats['errors'] += 1
+
+        _history.append({
+            'command': [str(part) for part in cmd],
+            'duration': duration,
+            'returncode': returncode,
+            'output_bytes': output_bytes,
+            'outcome': outcome
+        })
+
+
+def run_command(cmd: Sequence[str], cache_ttl: Optional[float] = None,
+                **kwargs: Any) -> subprocess.CompletedProcess:
+    """
+    Run an external command through subprocess.run
+
+    Exceptions (FileNotFoundError, TimeoutExpired, CalledProcessError, ...)
+    propagate to the caller exactly as with subprocess.run.
+
+    Args:
+        cmd: Command and arguments
+        cache_ttl: Reuse a result of the same command and arguments for
+            this many seconds. Only use for read-only commands such as
+            version checks or listings; None disables caching.
+        **kwargs: Passed through to subprocess.run
+
+    Returns:
+        CompletedProcess from subprocess.run (or the cache)
+    """
+    if 'timeout' not in kwargs:
+        kwargs['timeout'] = get_command_timeout(cmd)
+
+    label = _command_label(cmd)
+    cache_key = None
+    if cache_ttl is not None:
+        cache_key = (tuple(str(part) for part in cmd), tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        with _lock:
+            cached = _cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            _record(label, cmd, 0.0, cached[1].returncode, 0, 'cached')
+            return cached[1]
+
+    if any(_matches(cmd, prefix) for prefix in INVALIDATING_COMMANDS):
+        clear_command_cache()
+
+    start = time.perf_counter()
+    try:
+        if get_tracer() is None:
+            result = subprocess.run(cmd, **kwargs)
+        else:
+            with trace_span(label, "subprocess", cmd=[str(part) for part in cmd]) as span:
+                result = subprocess.run(cmd, **kwargs)
+                span.set(returncode=getattr(result, 'returncode', None))
+    except subprocess.TimeoutExpired:
+        _record(label, cmd, time.perf_counter() - start, None, 0, 'timeout')
+        raise
+    except subprocess.CalledProcessError as e:
+        _record(label, cmd, time.perf_counter() - start, e.returncode, _output_size(e), 'failed')
+        raise
+    except Exception:
+        _record(label, cmd, time.perf_counter() - start, None, 0, 'error')
+        raise
+
+    returncode = getattr(result, 'returncode', None)
+    _record(label, cmd, time.perf_counter() - start, returncode, _output_size(result),
+            'ok' if returncode == 0 else 'failed')
+
+    if cache_key is not None:
+        with _lock:
+            _cache[cache_key] = (time.monotonic(), result)
+
+    return result
+
+
+def start_command(cmd: Sequence[str], **kwargs: Any) -> subprocess.Popen:
+    """
+    Start a long-running command with subprocess.Popen
+
+    Only the start is counted; the caller owns the process and its timeout.
+
+    Args:
+        cmd: Command and arguments
+        **kwargs: Passed through to subprocess.Popen
+
+    Returns:
+        The Popen object
+    """
+    start = time.perf_counter()
+    try:
+        process = subprocess.Popen(cmd, **kwargs)
+    except Exception:
+        _record(_command_label(cmd), cmd, time.perf_counter() - start, None, 0, 'error')
+        raise
+    _record(_command_label(cmd), cmd, time.perf_counter() - start, None, 0, 'ok')
+    return process
+
+
+def clear_command_cache() -> None:
+    """Forget all cached command results"""
+    with _lock:
+        _cache.clear()
+
+
+def get_command_stats() -> Dict[str, Any]:
+    """
+    Counters for all commands run in this process
+
+    Returns:
+        Dict with totals and per-command counters keyed by the first three
+        command words (e.g. "claude mcp list")
+    """
+    with _lock:
+        commands = {label: dict(stats) for label, stats in _stats.items()}
+
+    return {
+        'calls': sum(s['calls'] for s in commands.values()),
+        'cache_hits': sum(s['cache_hits'] for s in commands.values()),
+        'failures': sum(s['failures'] for s in commands.values()),
+        'timeouts': sum(s['timeouts'] for s in commands.values()),
+        'total_seconds': sum(s['total_seconds'] for s in commands.values()),
+        'commands': commands
+    }
+
+
+def get_command_history() -> List[Dict[str, Any]]:
+    """Most recent command runs, oldest first"""
+    with _lock:
+        return list(_history)
+
+
+def reset_command_stats() -> None:
+    """Clear counters, history and cache"""
+    with _lock:
+        _stats.clear()
+        _history.clear()
+        _cache.clear()
@@ -29,11 +29,19 @@ Architecture:
 
 import re
 import os
+import contextlib
+import contextvars
 from pathlib import Path
-from typing import List, Optional, Tuple, Set
+from typing import Iterable, Iterator, List, Optional, Tuple, Set
 import urllib.parse
 from setup.utils.localization import get_string
 
+# Directories outside the current user's home that may hold installation
+# targets (other users' homes, container roots). Empty unless a caller opted
+# in with SecurityValidator.foreign_roots(); a context variable so concurrent
+# installs only see their own opt-in.
+_foreign_roots = contextvars.ContextVar("superclaude_foreign_roots", default=())
+
 
 class SecurityValidator:
     """Security validation utilities"""
@@ -460,12 +468,16 @@ class SecurityValidator:
                     
                 except ValueError:
                     # Not under current user's home directory
-                    if os.name == 'nt':
-                        errors.append(get_string("security.validate_target.claude_must_be_in_user_dir_windows"))
+                    if cls.foreign_root_of(abs_target) is not None:
+                        # Opted-in foreign target: fall through to the regular checks
+                        cls._log_security_decision("ALLOW", get_string("security.validate_target.log_foreign_root", abs_target))
                     else:
-                        errors.append(get_string("security.validate_target.claude_must_be_in_home_dir"))
-                    cls._log_security_decision("DENY", get_string("security.validate_target.log_claude_dir_outside_home", abs_target))
-                    return False, errors
+                        if os.name == 'nt':
+                            errors.append(get_string("security.validate_target.claude_must_be_in_user_dir_windows"))
+                        else:
+                            errors.append(get_string("security.validate_target.claude_must_be_in_home_dir"))
+                        cls._log_security_decision("DENY", get_string("security.validate_target.log_claude_dir_outside_home", abs_target))
+                        return False, errors
         
         # Validate path for non-.claude directories
         is_safe, msg = cls.validate_path(target_dir)
@@ -492,6 +504,27 @@ class SecurityValidator:
                 errors.append(get_string("security.validate_target.insufficient_perms_unix", missing, target_dir))
         
         # Check if it's a system directory with enhanced messages
+        sys_dir = cls.system_directory_of(abs_target)
+        if sys_dir is not None:
+            if os.name == 'nt':
+                errors.append(get_string("security.validate_target.cannot_install_to_windows_system_dir", sys_dir))
+            else:
+                errors.append(get_string("security.validate_target.cannot_install_to_system_dir", sys_dir))
+            cls._log_security_decision("DENY", get_string("security.validate_target.log_system_dir_attempt", sys_dir))
+        
+        return len(errors) == 0, errors
+
+    @classmethod
+    def system_directory_of(cls, path: Path) -> Optional[Path]:
+        """
+        System directory containing a path
+        
+        Args:
+            path: Absolute path to check
+            
+        Returns:
+            The system directory (e.g. /etc), or None if path is not in one
+        """
         system_dirs = [
             Path('/etc'), Path('/bin'), Path('/sbin'), Path('/usr/bin'), Path('/usr/sbin'),
             Path('/var'), Path('/tmp'), Path('/dev'), Path('/proc'), Path('/sys')
@@ -503,24 +536,53 @@ class SecurityValidator:
             ])
         
         for sys_dir in system_dirs:
+            # Path.is_relative_to is not available in older Python versions
             try:
-                if abs_target.is_relative_to(sys_dir):
-                    if os.name == 'nt':
-                        errors.append(get_string("security.validate_target.cannot_install_to_windows_system_dir", sys_dir))
-                    else:
-                        errors.append(get_string("security.validate_target.cannot_install_to_system_dir", sys_dir))
-                    cls._log_security_decision("DENY", get_string("security.validate_target.log_system_dir_attempt", sys_dir))
-                    break
-            except (ValueError, AttributeError):
-                # is_relative_to not available in older Python versions
-                try:
-                    abs_target.relative_to(sys_dir)
-                    errors.append(get_string("security.validate_target.cannot_install_to_system_dir", sys_dir))
-                    break
-                except ValueError:
-                    continue
+                path.relative_to(sys_dir)
+                return sys_dir
+            except ValueError:
+                continue
+        return None
+
+    @classmethod
+    @contextlib.contextmanager
+    def foreign_roots(cls, roots: Iterable[Path]) -> Iterator[None]:
+        """
+        Allow installation targets outside the current user's home directory
         
-        return len(errors) == 0, errors
+        Within the block, a .claude directory below one of roots is accepted
+        like one in the home directory (for provisioning other users' homes
+        or container roots). Every other check, including the system
+        directory denylist, still applies. The opt-in is scoped to the
+        current thread or context.
+        
+        Args:
+            roots: Directories that may contain foreign installation targets
+        """
+        token = _foreign_roots.set(tuple(Path(root).expanduser().resolve() for root in roots))
+        try:
+            yield
+        finally:
+            _foreign_roots.reset(token)
+
+    @classmethod
+    def foreign_root_of(cls, path: Path) -> Optional[Path]:
+        """
+        Allowed foreign root containing a path
+        
+        Args:
+            path: Absolute path to check
+            
+        Returns:
+            The root given to foreign_roots(), or None if path is not below one
+        """
+        for root in _foreign_roots.get():
+            try:
+                path.relative_to(root)
+                return root
+            except ValueError:
+                continue
+        return None
     
     @classmethod
     def validate_component_files(cls, file_list: List[Tuple[Path, Path]], base_source_dir: Path, base_target_dir: Path) -> Tuple[bool, List[str]]:
@@ -0,0 +1,109 @@
+"""
+Token estimation for framework files loaded into Claude's context
+
+The default estimator is an offline heuristic tuned for English Markdown
+(roughly one token per four characters of a word, one per punctuation mark,
+one per non-ASCII character). Exact counts need a real tokenizer, which can
+be registered under a name and selected per call.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+Tokenizer = Callable[[str], int]
+
+DEFAULT_TOKENIZER = "heuristic"
+
+# Words, single punctuation marks and single non-ASCII characters
+_PIECE_PATTERN = re.compile(r"[A-Za-z0-9_]+|[^\sA-Za-z0-9_]")
+
+
+def heuristic_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in text without a tokenizer
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    count = 0
+    for piece in _PIECE_PATTERN.findall(text):
+        # Long words are split into several sub-word tokens
+        count += (len(piece) + 3) // 4 if len(piece) > 1 else 1
+    return count
+
+
+_tokenizers: Dict[str, Tokenizer] = {DEFAULT_TOKENIZER: heuristic_tokens}
+
+
+def _tiktoken_factory() -> Optional[Tokenizer]:
+    """cl100k_base counter when tiktoken is installed"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use; offline hosts have none
+        return None
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+_factories: Dict[str, Callable[[], Optional[Tokenizer]]] = {"tiktoken": _tiktoken_factory}
+
+
+def register_tokenizer(name: str, tokenizer: Tokenizer) -> None:
+    """
+    Make a token counter available under name
+
+    Args:
+        name: Name used to select it (e.g. via --tokenizer)
+        tokenizer: Callable returning the token count of a string
+    """
+    _tokenizers[name] = tokenizer
+
+
+def available_tokenizers() -> List[str]:
+    """Names of registered and known optional tokenizers"""
+    return sorted(set(_tokenizers) | set(_factories))
+
+
+def get_tokenizer(name: Optional[str] = None) -> Tokenizer:
+    """
+    Look up a token counter
+
+    Args:
+        name: Tokenizer name (default: the offline heuristic)
+
+    Returns:
+        Token counting callable
+
+    Raises:
+        ValueError: If the tokenizer is unknown or its dependency is missing
+    """
+    name = name or DEFAULT_TOKENIZER
+    tokenizer = _tokenizers.get(name)
+    if tokenizer is None and name in _factories:
+        tokenizer = _factories[name]()
+        if tokenizer is not None:
+            _tokenizers[name] = tokenizer
+    if tokenizer is None:
+        raise ValueError(f"Tokenizer not available: {name}")
+    return tokenizer
+
+
+def count_tokens(text: str, tokenizer: Optional[str] = None) -> int:
+    """
+    Count tokens in text
+
+    Args:
+        text: Text to measure
+        tokenizer: Tokenizer name (default: the offline heuristic)
+
+    Returns:
+        Token count
+    """
+    return get_tokenizer(tokenizer)(text)
@@ -0,0 +1,234 @@
+"""
+Chrome Trace Event recorder for SuperClaude runs
+
+Enabled with the global --trace FILE flag. Phases are recorded as complete
+("X") events and saved as JSON that loads in Perfetto (ui.perfetto.dev) or
+chrome://tracing. When tracing is disabled every helper is a cheap no-op.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Tracer:
+    """Collects trace events in memory until saved"""
+
+    def __init__(self):
+        """Initialize tracer; timestamps are relative to its creation"""
+        self.pid = os.getpid()
+        self.events: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._thread_names: Dict[int, str] = {}
+
+    def now_us(self) -> float:
+        """Microseconds since the tracer started"""
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def timestamp_us(self, counter: float) -> float:
+        """Convert a time.perf_counter() value to trace microseconds"""
+        return (counter - self._origin) * 1e6
+
+    def add_complete(self, name: str, category: str, start_us: float, duration_us: float,
+                     args: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a finished phase
+
+        Args:
+            name: Event name shown on the timeline
+            category: Comma-separated categories (used for filtering)
+            start_us: Start timestamp from now_us()
+            duration_us: Duration in microseconds
+            args: Extra data shown when the event is selected
+        """
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round(start_us, 3),
+            'dur': round(duration_us, 3),
+            'pid': self.pid,
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = args
+        with self.lock:
+            self.events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def add_instant(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a point-in-time event
+
+        Args:
+            name: Event name shown on the timeline
+            category: Comma-separated categories
+            args: Extra data shown when the event is selected
+        """
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'i',
+            's': 't',
+            'ts': round(self.now_us(), 3),
+            'pid': self.pid,
+            'tid': thread.ident,
+        }
+        if args:
+            event['args'] = args
+        with self.lock:
+            self.events.append(event)
+            self._thread_names.setdefault(thread.ident, thread.name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Trace in Chrome Trace Event JSON object format"""
+        with self.lock:
+            events = list(self.events)
+            thread_names = dict(self._thread_names)
+
+        metadata = [{
+            'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+            'args': {'name': 'SuperClaude'}
+        }]
+        for tid, thread_name in thread_names.items():
+            metadata.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                'args': {'name': thread_name}
+            })
+
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+
+    def save(self, path: Path) -> Path:
+        """
+        Write the trace to a JSON file
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        if path.parent and not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, default=str)
+        return path
+
+
+class _TraceSpan:
+    """Context manager recording one complete event"""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> "_TraceSpan":
+        self.start = self.tracer.now_us()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is not None:
+            self.args['error'] = f"{exc_type.__name__}: {exc_value}"
+        self.tracer.add_complete(self.name, self.category, self.start,
+                                 self.tracer.now_us() - self.start, self.args)
+        return False
+
+    def set(self, **args: Any) -> None:
+        """Attach extra data to the event"""
+        self.args.update(args)
+
+
+class _NullSpan:
+    """Stand-in used while tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_tracer: Optional[Tracer] = None
+
+
+def enable_tracing() -> Tracer:
+    """Start recording trace events for this process"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Active tracer, or None when tracing is disabled"""
+    return _tracer
+
+
+def disable_tracing() -> Optional[Tracer]:
+    """Stop recording and return the tracer that was active"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def trace_span(name: str, category: str, **args: Any):
+    """
+    Time a phase on the trace timeline
+
+    Usage:
+        with trace_span("registry.discover", "registry", components_dir=str(path)):
+            ...
+
+    Args:
+        name: Event name
+        category: Event category
+        **args: Extra data stored with the event
+
+    Returns:
+        Context manager (a shared no-op when tracing is disabled)
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _TraceSpan(_tracer, name, category, args)
+
+
+def traced(name: str, category: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording every call of a function as a trace event
+
+    Args:
+        name: Event name
+        category: Event category
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _TraceSpan(_tracer, name, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
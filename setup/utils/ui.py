@@ -51,8 +51,14 @@ class Colors:
 
 class ProgressBar:
     """Cross-platform progress bar with customizable display"""
-    
-    def __init__(self, total: int, width: int = 50, prefix: str = '', suffix: str = ''):
+
+    # Minimum seconds between plain-text lines when output is not a terminal
+    PLAIN_INTERVAL = 5.0
+    # Percentage step that always produces a plain-text line
+    PLAIN_STEP = 10
+
+    def __init__(self, total: int, width: int = 50, prefix: str = '', suffix: str = '',
+                 max_refresh_hz: float = 10.0, stream=None):
         """
         Initialize progress bar
         
@@ -61,6 +67,8 @@ class ProgressBar:
             width: Width of progress bar in characters
             prefix: Text to display before progress bar
             suffix: Text to display after progress bar
+            max_refresh_hz: Maximum number of redraws per second (0 disables throttling)
+            stream: Output stream (defaults to sys.stdout)
         """
         self.total = total
         self.width = width
@@ -68,58 +76,112 @@ class ProgressBar:
         self.suffix = suffix
         self.current = 0
         self.start_time = time.time()
-        
+        self.stream = stream if stream is not None else sys.stdout
+        self.min_interval = 1.0 / max_refresh_hz if max_refresh_hz > 0 else 0.0
+
+        try:
+            self.is_tty = self.stream.isatty()
+        except (AttributeError, ValueError):
+            self.is_tty = False
+
         # Get terminal width for responsive display
         try:
             self.terminal_width = shutil.get_terminal_size().columns
         except OSError:
             self.terminal_width = 80
-    
-    def update(self, current: int, message: str = '') -> None:
+
+        # Color codes never change, so their share of the line length is fixed
+        self._color_length = len(Colors.GREEN) + len(Colors.WHITE) + len(Colors.RESET)
+        self._last_render = 0.0
+        self._last_state = None
+        self._last_plain_step = -1
+        self.render_count = 0
+
+    def update(self, current: int, message: str = '', force: bool = False) -> None:
         """
         Update progress bar
         
+        Redraws are throttled to max_refresh_hz and skipped when nothing
+        visible changed, so callers can report every single event.
+
         Args:
             current: Current progress value
             message: Optional message to display
+            force: Redraw even if throttled
         """
         self.current = current
-        percent = min(100, (current / self.total) * 100) if self.total > 0 else 100
-        
-        # Calculate filled and empty portions
-        filled_width = int(self.width * current / self.total) if self.total > 0 else self.width
+        now = time.time()
+        if not force and now - self._last_render < self.min_interval:
+            return
+
+        if self.total > 0:
+            filled_width = min(self.width, int(self.width * current / self.total))
+            percent = min(100.0, (current / self.total) * 100)
+        else:
+            filled_width = self.width
+            percent = 100.0
+
+        state = (filled_width, int(percent * 10), message)
+        if not force and state == self._last_state:
+            return
+
+        if self.is_tty:
+            self._render_tty(filled_width, percent, message, now)
+        elif not self._render_plain(percent, message, now, force):
+            return
+
+        self._last_state = state
+        self._last_render = now
+        self.render_count += 1
+
+    def _eta_string(self, current: int, now: float) -> str:
+        """ETA suffix from the average rate so far"""
+        if current <= 0 or self.total <= 0:
+            return ""
+        elapsed = now - self.start_time
+        eta = (elapsed / current) * max(0, self.total - current)
+        return f" {get_string('progress.eta', self._format_time(eta))}"
+
+    def _render_tty(self, filled_width: int, percent: float, message: str, now: float) -> None:
+        """Redraw the bar in place"""
         filled = '#' * filled_width
         empty = '-' * (self.width - filled_width)
-        
-        # Calculate elapsed time and ETA
-        elapsed = time.time() - self.start_time
-        if current > 0:
-            eta = (elapsed / current) * (self.total - current)
-            eta_str = f" {get_string('progress.eta', self._format_time(eta))}"
-        else:
-            eta_str = ""
-        
-        # Format progress line
-        if message:
-            status = f" {message}"
-        else:
-            status = ""
-        
+        status = f" {message}" if message else ""
+        eta_str = self._eta_string(self.current, now)
+
         progress_line = (
             f"\r{self.prefix}[{Colors.GREEN}{filled}{Colors.WHITE}{empty}{Colors.RESET}] "
             f"{percent:5.1f}%{status}{eta_str}"
         )
-        
-        # Truncate if too long for terminal
+
+        # Truncate if too long for terminal, measuring without color codes
         max_length = self.terminal_width - 5
-        if len(progress_line) > max_length:
-            # Remove color codes for length calculation
-            plain_line = progress_line.replace(Colors.GREEN, '').replace(Colors.WHITE, '').replace(Colors.RESET, '')
-            if len(plain_line) > max_length:
-                progress_line = progress_line[:max_length] + "..."
-        
-        print(progress_line, end='', flush=True)
-    
+        if len(progress_line) - self._color_length > max_length:
+            progress_line = progress_line[:max_length + self._color_length] + "..."
+
+        self.stream.write(progress_line)
+        self.stream.flush()
+
+    def _render_plain(self, percent: float, message: str, now: float, force: bool) -> bool:
+        """
+        Emit a plain progress line for logs and pipes
+
+        Only writes on every PLAIN_STEP percent, after PLAIN_INTERVAL seconds
+        or when forced, since carriage returns are useless in a file.
+
+        Returns:
+            True if a line was written
+        """
+        step = int(percent) // self.PLAIN_STEP
+        if not force and step == self._last_plain_step and now - self._last_render < self.PLAIN_INTERVAL:
+            return False
+
+        self._last_plain_step = step
+        status = f" {message}" if message else ""
+        self.stream.write(f"{self.prefix}{percent:5.1f}%{status}{self._eta_string(self.current, now)}\n")
+        self.stream.flush()
+        return True
+
     def increment(self, message: str = '') -> None:
         """
         Increment progress by 1
@@ -129,15 +191,19 @@ class ProgressBar:
         """
         self.update(self.current + 1, message)
     
-    def finish(self, message: str = get_string('progress.complete')) -> None:
+    def finish(self, message: Optional[str] = None) -> None:
         """
         Complete progress bar
         
         Args:
-            message: Completion message
+            message: Completion message (defaults to the localized "complete")
         """
-        self.update(self.total, message)
-        print()  # New line after completion
+        if message is None:
+            message = get_string('progress.complete')
+        self.update(self.total, message, force=True)
+        if self.is_tty:
+            self.stream.write("\n")  # New line after completion
+            self.stream.flush()
     
     def _format_time(self, seconds: float) -> str:
         """Format time duration as human-readable string"""
@@ -151,6 +217,147 @@ class ProgressBar:
             return f"{hours:.0f}{get_string('time.hours')} {minutes:.0f}{get_string('time.minutes')}"
 
 
+class MultiProgressBar:
+    """Several progress bars drawn as a block, for concurrent installs (e.g. one per fleet target)"""
+
+    def __init__(self, max_refresh_hz: float = 10.0, stream=None):
+        """
+        Initialize multi-bar display
+        
+        Args:
+            max_refresh_hz: Maximum number of redraws per second for the block
+            stream: Output stream (defaults to sys.stdout)
+        """
+        import threading
+
+        self.stream = stream if stream is not None else sys.stdout
+        self.min_interval = 1.0 / max_refresh_hz if max_refresh_hz > 0 else 0.0
+        self.bars: Dict[str, ProgressBar] = {}
+        self.messages: Dict[str, str] = {}
+        self.lock = threading.Lock()
+        self._lines_drawn = 0
+        self._last_render = 0.0
+        self._dirty = False
+
+        try:
+            self.is_tty = self.stream.isatty()
+        except (AttributeError, ValueError):
+            self.is_tty = False
+
+    def add_bar(self, key: str, total: int, prefix: str = '', width: int = 30) -> ProgressBar:
+        """
+        Add a bar to the block
+        
+        Args:
+            key: Identifier used in later update calls
+            total: Total number of items for this bar
+            prefix: Text to display before the bar
+            width: Width of the bar in characters
+            
+        Returns:
+            The created ProgressBar
+        """
+        with self.lock:
+            # On a terminal the block redraws all bars together; otherwise each
+            # bar writes its own periodic plain-text lines
+            bar = ProgressBar(total, width=width, prefix=prefix, stream=self.stream)
+            self.bars[key] = bar
+            self.messages[key] = ''
+            self._dirty = True
+            return bar
+
+    def update(self, key: str, current: int, message: str = '', force: bool = False) -> None:
+        """
+        Update one bar, redrawing the block at most max_refresh_hz times a second
+        
+        Args:
+            key: Bar identifier
+            current: Current progress value
+            message: Optional message to display
+            force: Redraw even if throttled
+        """
+        with self.lock:
+            bar = self.bars[key]
+            if not self.is_tty:
+                bar.update(current, message, force=force)
+                return
+
+            if bar.current != current or self.messages[key] != message:
+                bar.current = current
+                self.messages[key] = message
+                self._dirty = True
+
+            now = time.time()
+            if self._dirty and (force or now - self._last_render >= self.min_interval):
+                self._render(now)
+
+    def finish(self, key: Optional[str] = None, message: str = '') -> None:
+        """
+        Complete one bar, or the whole block when key is None
+        
+        Args:
+            key: Bar identifier, or None to finish every bar
+            message: Completion message
+        """
+        keys = [key] if key is not None else list(self.bars)
+        for name in keys:
+            self.update(name, self.bars[name].total, message, force=True)
+
+        if key is None:
+            self.close()
+
+    def set_total(self, key: str, total: int) -> None:
+        """
+        Change the total of a bar once it is known
+        
+        Args:
+            key: Bar identifier
+            total: New total number of items
+        """
+        with self.lock:
+            self.bars[key].total = total
+            self._dirty = True
+
+    def close(self) -> None:
+        """End the block below the last drawn line, leaving each bar as it is"""
+        if self.is_tty:
+            with self.lock:
+                self.stream.write("\n")
+                self.stream.flush()
+                self._lines_drawn = 0
+
+    def _render(self, now: float) -> None:
+        """Redraw every bar in place; caller holds the lock"""
+        lines = []
+        for key, bar in self.bars.items():
+            if bar.total > 0:
+                filled_width = min(bar.width, int(bar.width * bar.current / bar.total))
+                percent = min(100.0, (bar.current / bar.total) * 100)
+            else:
+                filled_width = bar.width
+                percent = 100.0
+            message = self.messages[key]
+            status = f" {message}" if message else ""
+            line = (
+                f"{bar.prefix}[{Colors.GREEN}{'#' * filled_width}{Colors.WHITE}"
+                f"{'-' * (bar.width - filled_width)}{Colors.RESET}] {percent:5.1f}%{status}"
+            )
+            max_length = bar.terminal_width - 5
+            if len(line) - bar._color_length > max_length:
+                line = line[:max_length + bar._color_length] + "..."
+            lines.append(line)
+
+        # Move back to the first line of the block, then overwrite each line
+        output = f"\x1b[{self._lines_drawn - 1}F" if self._lines_drawn > 1 else "\r"
+        output += "\n".join(f"\x1b[2K{line}" for line in lines)
+        self.stream.write(output)
+        self.stream.flush()
+
+        self._lines_drawn = len(lines)
+        self._last_render = now
+        self._dirty = False
+
+
 class Menu:
     """Interactive menu system with keyboard navigation"""
     
@@ -340,8 +547,10 @@ def display_table(headers: List[str], rows: List[List[str]], title: str = '') ->
     print()
 
 
-def wait_for_key(message: str = get_string("general.press_enter_to_continue")) -> None:
+def wait_for_key(message: Optional[str] = None) -> None:
     """Wait for user to press a key"""
+    if message is None:
+        message = get_string("general.press_enter_to_continue")
     try:
         input(f"{Colors.BLUE}{message}{Colors.RESET}")
     except KeyboardInterrupt:
@@ -357,14 +566,14 @@ def clear_screen() -> None:
 class StatusSpinner:
     """Simple status spinner for long operations"""
     
-    def __init__(self, message: str = get_string("spinner.working")):
+    def __init__(self, message: Optional[str] = None):
         """
         Initialize spinner
         
         Args:
-            message: Message to display with spinner
+            message: Message to display with spinner (defaults to the localized "working")
         """
-        self.message = message
+        self.message = message if message is not None else get_string("spinner.working")
         self.spinning = False
         self.chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
         self.current = 0
@@ -0,0 +1,122 @@
+import pytest
+
+from setup.base.installer import Installer
+from setup.base.component import Component
+from setup.base.events import InstallEvent
+
+
+class FileComponent(Component):
+    """Writes a single marker file into whatever install_dir it points at"""
+
+    def __init__(self, install_dir=None, content="new", fail=False):
+        super().__init__(install_dir)
+        self.content = content
+        self.fail = fail
+
+    def get_metadata(self):
+        return {"name": "files", "description": "Test component", "version": "1.0"}
+    def get_dependencies(self):
+        return []
+    def validate_prerequisites(self, installSubPath=None):
+        return True, []
+    def _install(self, config):
+        if self.fail:
+            return False
+        (self.install_dir / "marker.md").write_text(self.content)
+        self.emit(InstallEvent.FILE_COPIED, component="files", source=None,
+                  target=self.install_dir / "marker.md", bytes=len(self.content))
+        return True
+    def _post_install(self): return True
+    def uninstall(self): return True
+    def _get_source_dir(self): return None
+    def validate_installation(self):
+        return (self.install_dir / "marker.md").exists(), []
+
+
+@pytest.fixture
+def existing_install(tmp_path):
+    install_dir = tmp_path / ".claude"
+    install_dir.mkdir()
+    (install_dir / "marker.md").write_text("old")
+    (install_dir / "user-notes.md").write_text("keep me")
+    (install_dir / "logs").mkdir()
+    (install_dir / "logs" / "previous.log").write_text("log")
+    return install_dir
+
+
+def _staging_leftovers(install_dir):
+    return [p for p in install_dir.parent.iterdir() if p.name.startswith(f".{install_dir.name}.")]
+
+
+def test_staged_install_swaps_tree_on_success(existing_install):
+    installer = Installer(existing_install, staged=True)
+    component = FileComponent(existing_install)
+    installer.register_component(component)
+
+    assert installer.install_components(["files"]) is True
+
+    assert (existing_install / "marker.md").read_text() == "new"
+    assert (existing_install / "user-notes.md").read_text() == "keep me"
+    assert (existing_install / "logs" / "previous.log").exists()
+    assert component.install_dir == existing_install
+    assert _staging_leftovers(existing_install) == []
+    assert installer.get_installation_summary()['staged'] is True
+
+
+def test_staged_install_only_stages_owned_files(existing_install):
+    live_writes = existing_install / "projects" / "session.jsonl"
+
+    class ConcurrentWriteComponent(FileComponent):
+        def _install(self, config):
+            # Only the component's own files are staged, not unrelated user data
+            assert not (self.install_dir / "user-notes.md").exists()
+            # Claude Code keeps writing to the live tree while the install runs
+            live_writes.parent.mkdir()
+            live_writes.write_text("session")
+            return super()._install(config)
+
+    installer = Installer(existing_install, staged=True)
+    installer.register_component(ConcurrentWriteComponent(existing_install))
+
+    assert installer.install_components(["files"]) is True
+
+    assert (existing_install / "marker.md").read_text() == "new"
+    assert live_writes.read_text() == "session"
+    assert (existing_install / "user-notes.md").read_text() == "keep me"
+    assert _staging_leftovers(existing_install) == []
+
+
+def test_staged_install_keeps_original_on_failure(existing_install):
+    installer = Installer(existing_install, staged=True)
+    component = FileComponent(existing_install, fail=True)
+    installer.register_component(component)
+
+    assert installer.install_components(["files"]) is False
+
+    assert (existing_install / "marker.md").read_text() == "old"
+    assert component.install_dir == existing_install
+    assert installer.staging_dir is None
+    assert _staging_leftovers(existing_install) == []
+
+
+def test_installer_emits_progress_events(tmp_path):
+    install_dir = tmp_path / ".claude"
+    install_dir.mkdir()
+    installer = Installer(install_dir)
+    installer.register_component(FileComponent(install_dir))
+
+    events = []
+    installer.add_listener(lambda event, data: events.append((event, data)))
+
+    assert installer.install_components(["files"], {}) is True
+
+    assert [event for event, _ in events] == [
+        InstallEvent.INSTALL_START,
+        InstallEvent.COMPONENT_START,
+        InstallEvent.FILE_COPIED,
+        InstallEvent.COMPONENT_FINISH,
+        InstallEvent.INSTALL_FINISH,
+    ]
+    assert events[0][1]['components'] == ["files"]
+    assert events[2][1]['bytes'] == 3
+    assert events[3][1]['success'] is True
@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from setup.core.bundle import CoreBundleCompiler, normalize_whitespace, split_sections
+
+PRECEDENCE = "\n".join(f"{i}. Rule number {i} takes precedence over the ones below it" for i in range(1, 5))
+
+
+def write_core(tmp_path: Path) -> Path:
+    (tmp_path / "FLAGS.md").write_text(
+        "# FLAGS.md\n\n\nIntro   \n\n## Flag Precedence\n\n" + PRECEDENCE + "\n\n"
+        "## MCP Server Control Flags\n\n**`--seq`**\n\n### Fallbacks\n\n- native tools\n\n"
+        "## Scope Flags\n\n```\n# not a heading\n\n\nkeep   \n```\n"
+    )
+    (tmp_path / "ORCHESTRATOR.md").write_text(
+        "# ORCHESTRATOR.md\n\n#### Flag Precedence Rules\n\n" + PRECEDENCE + "\n"
+    )
+    (tmp_path / "MCP.md").write_text("# MCP.md - Server Reference\n\n## Context7\n\nDocs lookup\n")
+    return tmp_path
+
+
+def test_whitespace_is_normalized_outside_code_blocks():
+    text = "# Title\n\n\nline   \n\n\n\nnext\n```\na  \n\n\nb\n```\n\n"
+
+    assert normalize_whitespace(text) == "# Title\nline\n\nnext\n```\na  \n\n\nb\n```\n"
+    assert [heading for _, heading, _ in split_sections("# A\n```\n# code\n```\n## B\n")] == ["# A", "## B"]
+
+
+def test_repeated_sections_are_replaced_by_references(tmp_path: Path):
+    source = write_core(tmp_path)
+    compiler = CoreBundleCompiler(source, ["FLAGS.md", "ORCHESTRATOR.md", "MCP.md"])
+
+    bundle = compiler.compile()
+
+    assert PRECEDENCE in bundle["FLAGS.md"]
+    assert PRECEDENCE not in bundle["ORCHESTRATOR.md"]
+    assert '_Same as "Flag Precedence" in FLAGS.md._' in bundle["ORCHESTRATOR.md"]
+    assert "# not a heading\n\n\nkeep   \n" in bundle["FLAGS.md"]
+    assert "Context7" in bundle["MCP.md"]
+    assert compiler.stats["duplicates"] == 1
+    assert compiler.stats["bytes_after"] < compiler.stats["bytes_before"]
+    assert compiler.stats["tokens_after"] < compiler.stats["tokens_before"]
+
+
+def test_docs_of_missing_components_are_stripped(tmp_path: Path):
+    source = write_core(tmp_path)
+    compiler = CoreBundleCompiler(source, ["FLAGS.md", "MCP.md"], installed_components=["core"])
+
+    bundle = compiler.compile()
+
+    assert "--seq" not in bundle["FLAGS.md"]
+    assert "native tools" not in bundle["FLAGS.md"]
+    assert "## Scope Flags" in bundle["FLAGS.md"]
+    assert bundle["MCP.md"].startswith("# MCP.md - Server Reference\n")
+    assert "Context7" not in bundle["MCP.md"]
+    assert compiler.stats["stripped"] == ["FLAGS.md: MCP Server Control Flags", "MCP.md"]
+
+    with_mcp = CoreBundleCompiler(source, ["FLAGS.md"], installed_components=["core", "mcp"]).compile()
+    assert "--seq" in with_mcp["FLAGS.md"]
+
+
+def test_profile_selection_trims_sections_and_files(tmp_path: Path):
+    (tmp_path / "PERSONAS.md").write_text(
+        "# PERSONAS.md\n## Overview\nAll personas\n"
+        "## `--persona-architect`\nSystems\n### Priority\nLong-term\n"
+        "## `--persona-qa`\nTesting\n### Priority\nQuality\n"
+    )
+    (tmp_path / "MODES.md").write_text("# MODES.md\n## Task Management\nTodos\n")
+    selection = {
+        "exclude": ["MODES.md"],
+        "sections": {"PERSONAS.md": {"drop": ["--persona-*"], "keep": ["--PERSONA-ARCHITECT"]}}
+    }
+
+    bundle = CoreBundleCompiler(tmp_path, ["PERSONAS.md", "MODES.md"], selection=selection).compile()
+
+    assert "Systems" in bundle["PERSONAS.md"] and "Long-term" in bundle["PERSONAS.md"]
+    assert "Testing" not in bundle["PERSONAS.md"] and "Quality" not in bundle["PERSONAS.md"]
+    assert "All personas" in bundle["PERSONAS.md"]
+    assert bundle["MODES.md"] == "# MODES.md\n_Omitted by the installation profile._\n"
+
+
+def test_builds_are_cached_per_name_and_source_hash(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "src").mkdir()
+    source = write_core(tmp_path / "src")
+    files = ["FLAGS.md", "MCP.md"]
+
+    first = CoreBundleCompiler(source, files, ["core"])
+    bundle = first.compile_cached("slim")
+    second = CoreBundleCompiler(source, files, ["core"])
+    assert second.compile_cached("slim") == bundle
+    assert (first.from_cache, second.from_cache) == (False, True)
+    assert second.stats == first.stats
+
+    (source / "MCP.md").write_text("# MCP.md\nchanged\n")
+    third = CoreBundleCompiler(source, files, ["core"])
+    third.compile_cached("slim")
+    assert not third.from_cache
+    assert len(list((tmp_path / "cache" / "core").glob("slim-*.json"))) == 1
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+from setup.core.command_index import (
+    build_command_index, load_command_index, parse_frontmatter, search_commands, write_command_index
+)
+
+BUILD = """---
+allowed-tools: [Read, Bash, Edit]
+description: "Build, compile and package projects"
+wave-enabled: true
+complexity-threshold: 0.7
+---
+
+# /sc:build - Project Builder
+
+## Usage
+```
+/sc:build [target] [--type dev|prod] [--clean]
+```
+
+## Arguments
+- `--clean` - Clean artifacts first
+- `--verbose` - Verbose output
+"""
+
+LEGACY = """# Command: add_mcp
+
+## Description
+Installs MCP servers
+from the registry.
+
+## Usage
+`/sc:add_mcp [server_name]`
+"""
+
+
+def test_frontmatter_values_are_parsed():
+    meta, body = parse_frontmatter(BUILD)
+
+    assert meta == {
+        "allowed-tools": ["Read", "Bash", "Edit"],
+        "description": "Build, compile and package projects",
+        "wave-enabled": True,
+        "complexity-threshold": 0.7,
+    }
+    assert body.lstrip().startswith("# /sc:build")
+    assert parse_frontmatter(LEGACY) == ({}, LEGACY)
+
+
+def test_index_entries_and_search(tmp_path: Path):
+    (tmp_path / "build.md").write_text(BUILD)
+    (tmp_path / "add_mcp.md").write_text(LEGACY)
+
+    index = build_command_index(tmp_path, ["build.md", "add_mcp.md"])
+    add_mcp, build = index["commands"]
+
+    assert build["usage"] == "/sc:build [target] [--type dev|prod] [--clean]"
+    assert build["flags"] == ["--type", "--clean", "--verbose"]
+    assert build["allowed_tools"] == ["Read", "Bash", "Edit"]
+    assert build["meta"] == {"wave-enabled": True, "complexity-threshold": 0.7}
+    assert build["bytes"] == len(BUILD.encode("utf-8"))
+    assert add_mcp["description"] == "Installs MCP servers from the registry."
+    assert add_mcp["usage"] == "/sc:add_mcp [server_name]"
+
+    assert [c["name"] for c in search_commands(index, "BASH package")] == ["build"]
+    assert [c["name"] for c in search_commands(index, "mcp")] == ["add_mcp"]
+    assert len(search_commands(index)) == 2
+
+    index_path = tmp_path / "commands" / "sc-index.json"
+    write_command_index(index, index_path)
+    assert load_command_index(index_path) == index
+    assert load_command_index(tmp_path / "missing.json") is None
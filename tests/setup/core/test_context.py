@@ -0,0 +1,53 @@
+from pathlib import Path
+
+from setup.core.context import analyze_files, compare_reports, load_report, save_report
+from setup.utils.tokens import count_tokens, register_tokenizer
+
+
+def write_files(tmp_path: Path):
+    (tmp_path / "RULES.md").write_text("# RULES.md\nShort intro\n## Big\n" + "word " * 200 + "\n## Small\ntiny\n")
+    (tmp_path / "sc").mkdir()
+    (tmp_path / "sc" / "build.md").write_text("---\ndescription: Build\n---\n# /sc:build\nBuild things\n")
+    return [
+        ("core", "RULES.md", tmp_path / "RULES.md"),
+        ("commands", "sc/build.md", tmp_path / "sc" / "build.md"),
+        ("commands", "sc/missing.md", tmp_path / "sc" / "missing.md"),
+    ]
+
+
+def test_report_lists_files_and_largest_sections(tmp_path: Path):
+    report = analyze_files(write_files(tmp_path), root=tmp_path)
+
+    assert sorted(report["files"]) == ["RULES.md", "sc/build.md"]
+    assert report["totals"]["tokens"] == sum(entry["tokens"] for entry in report["files"].values())
+    assert report["components"]["commands"]["files"] == 1
+    assert report["files"]["RULES.md"]["tokens"] == count_tokens((tmp_path / "RULES.md").read_text())
+    assert (report["sections"][0]["file"], report["sections"][0]["heading"]) == ("RULES.md", "Big")
+
+
+def test_custom_tokenizer_is_used(tmp_path: Path):
+    register_tokenizer("chars", len)
+
+    report = analyze_files(write_files(tmp_path), tokenizer="chars")
+
+    assert report["tokenizer"] == "chars"
+    assert report["files"]["sc/build.md"]["tokens"] == len((tmp_path / "sc" / "build.md").read_text())
+
+
+def test_growth_against_saved_baseline(tmp_path: Path):
+    files = write_files(tmp_path)
+    baseline_path = tmp_path / "logs" / "baseline.json"
+    save_report(analyze_files(files), baseline_path)
+
+    with open(tmp_path / "RULES.md", "a") as f:
+        f.write("## Added\n" + "more words here " * 50)
+    (tmp_path / "sc" / "build.md").unlink()
+
+    comparison = compare_reports(analyze_files(files), load_report(baseline_path))
+
+    assert comparison["tokens_delta"] > 0
+    assert comparison["growth_percent"] > 0
+    assert [(change["file"], change["status"]) for change in comparison["files"]] == [
+        ("RULES.md", "changed"), ("sc/build.md", "removed")
+    ]
+    assert load_report(tmp_path / "nothing.json") is None
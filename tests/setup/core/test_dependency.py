@@ -0,0 +1,50 @@
+import pytest
+
+from setup.core.dependency import DependencyGraph
+
+
+def test_order_follows_request_where_dependencies_allow():
+    graph = DependencyGraph({
+        "core": [],
+        "commands": ["core"],
+        "mcp": [],
+        "hooks": ["core", "mcp"],
+    })
+
+    order, levels = graph.resolve(["hooks", "commands"])
+
+    assert order == ["core", "mcp", "hooks", "commands"]
+    assert levels == [["core", "mcp"], ["hooks", "commands"]]
+    assert graph.resolve(["core", "commands", "mcp"])[0] == ["core", "commands", "mcp"]
+
+
+def test_results_are_memoized_and_copied():
+    graph = DependencyGraph({"a": [], "b": ["a"]})
+
+    order, _ = graph.resolve(["b"])
+    order.append("mutated")
+
+    assert graph.resolve(["b"])[0] == ["a", "b"]
+    assert list(graph._resolved) == [("b",)]
+
+
+def test_all_cycles_are_reported():
+    graph = DependencyGraph({
+        "a": ["b"], "b": ["a"],
+        "c": ["d"], "d": ["e"], "e": ["c"],
+        "f": ["f"],
+        "ok": [],
+    })
+
+    assert graph.find_cycles() == [["a", "b"], ["c", "d", "e"], ["f"]]
+    with pytest.raises(ValueError, match="Circular dependency detected") as excinfo:
+        graph.resolve(["a", "c", "ok"])
+    assert "a -> b -> a" in str(excinfo.value)
+    assert "c -> d -> e -> c" in str(excinfo.value)
+
+
+def test_unknown_dependency():
+    graph = DependencyGraph({"a": ["missing"]})
+
+    with pytest.raises(ValueError, match="missing"):
+        graph.resolve(["a"])
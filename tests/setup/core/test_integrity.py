@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from setup.base.component import Component
+from setup.base.installer import Installer
+from setup.components.commands import CommandsComponent
+from setup.components.core import CoreComponent
+from setup.core.integrity import is_intact, scan_components
+
+
+@pytest.fixture
+def install_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    # The security checks refuse anything below /tmp
+    monkeypatch.setattr(Component, "validate_prerequisites", lambda self, installSubPath=None: (True, []))
+    install_dir = tmp_path / ".claude"
+    installer = Installer(install_dir)
+    installer.register_components([CoreComponent(install_dir), CommandsComponent(install_dir)])
+    assert installer.install_components(["core", "commands"], {"force": True})
+    return install_dir
+
+
+def scan(install_dir: Path, deep: bool):
+    return scan_components([CoreComponent(install_dir), CommandsComponent(install_dir)], deep, max_workers=2)
+
+
+def test_fresh_install_is_intact(install_dir: Path):
+    for deep in (False, True):
+        reports = scan(install_dir, deep)
+        assert all(is_intact(report) and report["manifest"] for report in reports.values())
+        assert reports["commands"]["checked"] > 0 and not reports["commands"]["extra"]
+
+
+def test_reports_modified_missing_and_extra_files(install_dir: Path):
+    rules = install_dir / "RULES.md"
+    rules.write_text(rules.read_text().upper())
+    touched = install_dir / "FLAGS.md"
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (install_dir / "MODES.md").unlink()
+    (install_dir / "commands" / "sc" / "mine.md").write_text("# Mine\n")
+
+    quick = scan(install_dir, deep=False)
+    deep = scan(install_dir, deep=True)
+
+    assert quick["core"]["modified"] == ["FLAGS.md", "RULES.md"]
+    assert deep["core"]["modified"] == ["RULES.md"]
+    assert quick["core"]["missing"] == deep["core"]["missing"] == ["MODES.md"]
+    assert deep["commands"]["extra"] == ["commands/sc/mine.md"]
+    assert is_intact(deep["commands"]) and not is_intact(deep["core"])
+    assert any("RULES.md" in error for error in CoreComponent(install_dir).integrity_errors(deep=True))
@@ -0,0 +1,79 @@
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from setup.core import plugins
+from setup.core.registry import ComponentRegistry
+
+COMPONENTS_DIR = Path(__file__).resolve().parents[3] / "setup" / "components"
+
+PLUGIN_MODULE = textwrap.dedent('''
+    from pathlib import Path
+    from setup.base.component import Component
+
+    class OrgDocsComponent(Component):
+        def get_metadata(self):
+            return {"name": "org_docs", "version": "1.0", "description": "Org docs", "category": "core"}
+        def get_dependencies(self):
+            return ["core"]
+        def _install(self, config): return True
+        def _post_install(self): return True
+        def uninstall(self): return True
+        def _get_source_dir(self): return Path(__file__).parent
+''')
+
+
+@pytest.fixture
+def plugin_site(tmp_path, monkeypatch):
+    """A sys.path entry holding one installed component pack"""
+    site = tmp_path / "site"
+    dist_info = site / "acme_pack-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: acme-pack\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[superclaude.components]\norg_docs = acme_pack:OrgDocsComponent\n"
+    )
+    (site / "acme_pack.py").write_text(PLUGIN_MODULE)
+
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.syspath_prepend(str(site))
+    yield site
+    sys.modules.pop("acme_pack", None)
+
+
+def test_plugin_components_join_resolution(plugin_site):
+    registry = ComponentRegistry(COMPONENTS_DIR)
+
+    assert "org_docs" in registry.list_components()
+    assert registry.resolve_dependencies(["org_docs"]) == ["core", "org_docs"]
+    assert registry.get_installation_order(["org_docs", "mcp"]) == [["core"], ["org_docs", "mcp"]]
+
+    # A second registry is served from the manifest and imports the pack lazily
+    sys.modules.pop("acme_pack", None)
+    cached = ComponentRegistry(COMPONENTS_DIR)
+    assert cached.get_component_metadata("org_docs")["description"] == "Org docs"
+    assert cached.manifest_loaded
+    assert "acme_pack" not in sys.modules
+    assert cached.get_component_class("org_docs").__name__ == "OrgDocsComponent"
+
+
+def test_entry_point_index_is_cached(plugin_site, mocker):
+    first = plugins.discover_plugins()
+    assert [entry["name"] for entry in first] == ["org_docs"]
+    assert first[0]["dist"] == "acme-pack"
+
+    scan = mocker.spy(plugins, "scan_entry_points")
+    assert plugins.discover_plugins() == first
+    scan.assert_not_called()
+
+    # Installing another distribution touches the site directory
+    (plugin_site / "other-2.0.dist-info").mkdir()
+    plugins.discover_plugins()
+    scan.assert_called_once()
+
+
+def test_plugins_can_be_disabled(plugin_site, monkeypatch):
+    monkeypatch.setenv("SUPERCLAUDE_NO_PLUGINS", "1")
+    assert plugins.discover_plugins() == []
@@ -1,3 +1,4 @@
+import json
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -108,3 +109,68 @@ def test_circular_dependency(mocker):
     registry = ComponentRegistry(Path("/fake/dir"))
     with pytest.raises(ValueError, match="Circular dependency detected"):
         registry.resolve_dependencies(["component_c"])
+
+
+# --- Manifest cache ---
+
+COMPONENTS_DIR = Path(__file__).resolve().parents[3] / "setup" / "components"
+
+
+def test_manifest_skips_imports_on_second_run(tmp_path, monkeypatch):
+    """Test that a cached manifest answers discovery without importing components."""
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path))
+
+    first = ComponentRegistry(COMPONENTS_DIR)
+    first.discover_components()
+    assert not first.manifest_loaded
+    assert list((tmp_path / "registry").glob("components-*.json"))
+
+    second = ComponentRegistry(COMPONENTS_DIR)
+    second.discover_components()
+    assert second.manifest_loaded
+    assert second.list_components() == first.list_components()
+    assert second.get_component_metadata("core") == first.get_component_metadata("core")
+    assert second.get_dependencies("commands") == first.get_dependencies("commands")
+    assert second.component_classes == {}
+
+    # Classes are imported on demand
+    assert second.get_component_class("core") is first.get_component_class("core")
+    assert second.get_component_instance("core", tmp_path).install_dir == tmp_path
+
+
+def test_stale_manifest_triggers_rescan(tmp_path, monkeypatch):
+    """Test that a manifest built from other sources is ignored."""
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path))
+
+    ComponentRegistry(COMPONENTS_DIR).discover_components()
+    manifest_file = next((tmp_path / "registry").glob("components-*.json"))
+    data = json.loads(manifest_file.read_text(encoding="utf-8"))
+    data["sources"]["core.py"] = [0, 0]
+    data["components"] = {}
+    manifest_file.write_text(json.dumps(data), encoding="utf-8")
+
+    registry = ComponentRegistry(COMPONENTS_DIR)
+    registry.discover_components()
+    assert not registry.manifest_loaded
+    assert "core" in registry.list_components()
+
+
+def test_instances_are_pooled_per_install_dir(tmp_path, monkeypatch):
+    """Test that instances are reused per directory and created lazily."""
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    registry = ComponentRegistry(COMPONENTS_DIR)
+
+    first = registry.get_component_instance("mcp", tmp_path / "a")
+    assert registry.get_component_instance("mcp", tmp_path / "a") is first
+    assert registry.get_component_instance("mcp", tmp_path / "b") is not first
+
+    # Expensive fields are only built on first access
+    assert "mcp_servers" not in vars(first)
+    assert "settings_manager" not in vars(first)
+    assert first.settings_manager.install_dir == tmp_path / "a"
+
+    first.set_install_dir(tmp_path / "staging")
+    assert first.settings_manager.install_dir == tmp_path / "staging"
+
+    registry.clear_instance_pool()
+    assert registry.get_component_instance("mcp", tmp_path / "a") is not first
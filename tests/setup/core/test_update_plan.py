@@ -0,0 +1,73 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from setup import PROJECT_ROOT
+from setup.base.component import Component
+from setup.base.installer import Installer
+from setup.components.core import CoreComponent
+from setup.core.update_plan import ADD, DELETE, MODIFY, UNCHANGED, has_changes
+
+
+@pytest.fixture
+def source_dir(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    # The security checks refuse anything below /tmp
+    monkeypatch.setattr(Component, "validate_prerequisites", lambda self, installSubPath=None: (True, []))
+    source = tmp_path / "Core"
+    shutil.copytree(PROJECT_ROOT / "SuperClaude" / "Core", source)
+    monkeypatch.setattr(CoreComponent, "_get_source_dir", lambda self: source)
+    return source
+
+
+def run_installer(install_dir: Path, update: bool = False) -> bool:
+    installer = Installer(install_dir)
+    installer.register_component(CoreComponent(install_dir))
+    config = {"force": True}
+    if update:
+        return installer.update_components(["core"], config)
+    return installer.install_components(["core"], config)
+
+
+def test_fresh_install_has_nothing_to_update(tmp_path: Path, source_dir: Path):
+    install_dir = tmp_path / ".claude"
+    assert run_installer(install_dir)
+
+    plan = CoreComponent(install_dir).plan_update()
+
+    assert not has_changes(plan)
+    assert plan["counts"][UNCHANGED] == len(list(source_dir.glob("*.md")))
+
+
+def test_plan_separates_source_changes_from_local_edits(tmp_path: Path, source_dir: Path):
+    install_dir = tmp_path / ".claude"
+    assert run_installer(install_dir)
+    untouched = install_dir / "PRINCIPLES.md"
+    untouched_mtime = untouched.stat().st_mtime_ns
+
+    (source_dir / "RULES.md").write_text("# Rules\n\nnew rules\n")
+    (install_dir / "FLAGS.md").write_text("# Flags\n\nmy own flags\n")
+    (source_dir / "EXTRA.md").write_text("# Extra\n")
+    (source_dir / "MODES.md").unlink()
+
+    plan = CoreComponent(install_dir).plan_update()
+    actions = {entry["path"]: (entry["action"], entry["local_edit"]) for entry in plan["files"]}
+
+    assert actions["RULES.md"] == (MODIFY, False)
+    assert actions["FLAGS.md"] == (MODIFY, True)
+    assert actions["EXTRA.md"] == (ADD, False)
+    assert actions["MODES.md"] == (DELETE, False)
+    assert actions["PRINCIPLES.md"] == (UNCHANGED, False)
+    assert plan["local_edits"] == 1
+
+    assert run_installer(install_dir, update=True)
+
+    assert (install_dir / "RULES.md").read_text() == "# Rules\n\nnew rules\n"
+    assert (install_dir / "FLAGS.md").read_bytes() == (source_dir / "FLAGS.md").read_bytes()
+    assert (install_dir / "FLAGS.md.backup").read_text() == "# Flags\n\nmy own flags\n"
+    assert (install_dir / "EXTRA.md").exists()
+    assert not (install_dir / "MODES.md").exists()
+    assert untouched.stat().st_mtime_ns == untouched_mtime
+    assert not has_changes(CoreComponent(install_dir).plan_update())
@@ -122,3 +122,57 @@ def test_invalid_json_error(mock_config_dir: Path):
     manager = ConfigManager(mock_config_dir)
     with pytest.raises(ValidationError, match="Invalid JSON in"):
         manager.load_features()
+
+def test_cache_is_shared_between_instances(mock_config_dir: Path, mock_profile_path: Path, mocker):
+    ConfigManager(mock_config_dir).clear_cache()
+    json_load_spy = mocker.spy(json, 'load')
+
+    for _ in range(3):
+        manager = ConfigManager(mock_config_dir)
+        manager.load_features()
+        manager.load_requirements()
+        manager.load_profile(mock_profile_path)
+
+    assert json_load_spy.call_count == 3
+
+def test_cache_reloads_modified_file(mock_config_dir: Path):
+    manager = ConfigManager(mock_config_dir)
+    assert "disabled_feature" in manager.load_features()["components"]
+
+    features = json.loads(json.dumps(MOCK_FEATURES))
+    del features["components"]["disabled_feature"]
+    (mock_config_dir / "features.json").write_text(json.dumps(features, indent=2))
+
+    assert "disabled_feature" not in ConfigManager(mock_config_dir).load_features()["components"]
+
+def test_schema_rejects_unknown_component_fields(mock_config_dir: Path):
+    features = json.loads(json.dumps(MOCK_FEATURES))
+    features["components"]["core"]["unexpected"] = True
+    (mock_config_dir / "features.json").write_text(json.dumps(features))
+
+    manager = ConfigManager(mock_config_dir)
+    with pytest.raises(ValidationError, match="Invalid features schema"):
+        manager.load_features()
+
+def test_profile_core_section_is_validated(mock_config_dir: Path, tmp_path: Path):
+    profile = dict(MOCK_PROFILE, core={"exclude": ["MODES.md"], "sections": {"PERSONAS.md": {"drop": ["--persona-*"]}}})
+    profile_file = tmp_path / "slim.json"
+    profile_file.write_text(json.dumps(profile))
+
+    manager = ConfigManager(mock_config_dir)
+    assert manager.load_profile(profile_file)["core"]["exclude"] == ["MODES.md"]
+
+    profile["core"]["sections"]["PERSONAS.md"]["only"] = ["x"]
+    bad_file = tmp_path / "bad.json"
+    bad_file.write_text(json.dumps(profile))
+    with pytest.raises(ValidationError, match="only"):
+        manager.load_profile(bad_file)
+
+def test_callers_cannot_change_the_cached_data(mock_config_dir: Path, mock_profile_path: Path):
+    manager = ConfigManager(mock_config_dir)
+    manager.load_features()["components"].clear()
+    manager.load_profile(mock_profile_path)["components"].append("mcp")
+
+    fresh = ConfigManager(mock_config_dir)
+    assert fresh.load_features() == MOCK_FEATURES
+    assert fresh.load_profile(mock_profile_path) == MOCK_PROFILE
@@ -0,0 +1,95 @@
+import argparse
+from pathlib import Path
+
+from setup import PROJECT_ROOT
+from setup.base.component import Component
+from setup.core.registry import ComponentRegistry
+from setup.operations.install_logic.fleet import check_target, install_fleet, load_targets
+from setup.operations.install_logic.progress import FleetProgress
+from setup.utils.security import SecurityValidator
+
+
+def make_args(**kwargs) -> argparse.Namespace:
+    args = argparse.Namespace(force=True, no_backup=True, dry_run=False, components=["core"],
+                              profile=None, quick=False, install_dir=None)
+    for key, value in kwargs.items():
+        setattr(args, key, value)
+    return args
+
+
+def test_targets_file_skips_comments_and_duplicates(tmp_path: Path):
+    targets_file = tmp_path / "targets.txt"
+    targets_file.write_text(f"# users\n{tmp_path}/a/.claude\n\n{tmp_path}/b/.claude\n{tmp_path}/a/.claude\n")
+
+    assert load_targets(targets_file) == [tmp_path / "a" / ".claude", tmp_path / "b" / ".claude"]
+
+
+def test_fleet_installs_every_target_with_one_source_hash(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    # The security checks refuse anything below /tmp
+    monkeypatch.setattr(Component, "validate_prerequisites", lambda self, installSubPath=None: (True, []))
+    targets = [tmp_path / "a" / ".claude", tmp_path / "b" / ".claude", Path("/nonexistent-home/.claude")]
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+
+    summary = install_fleet(targets, ["core"], make_args(), registry, max_workers=2)
+
+    assert (summary["targets"], summary["succeeded"], summary["failed"]) == (3, 2, 1)
+    assert summary["source"]["files"] > 0 and not summary["source"]["errors"]
+    assert [result["target"] for result in summary["results"]] == [str(target) for target in targets]
+    for result, target in zip(summary["results"][:2], targets):
+        assert result["success"] and result["installed"] == ["core"]
+        assert (target / "RULES.md").read_bytes() == (PROJECT_ROOT / "SuperClaude" / "Core" / "RULES.md").read_bytes()
+    assert "home directory" in summary["results"][2]["error"]
+    assert not Path("/nonexistent-home").exists()
+
+
+def test_fleet_installs_foreign_targets_below_an_allowed_root(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "provisioner"))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    # tmp_path is below the /tmp system directory
+    monkeypatch.setattr(Component, "validate_prerequisites", lambda self, installSubPath=None: (True, []))
+    monkeypatch.setattr(SecurityValidator, "system_directory_of", classmethod(lambda cls, path: None))
+    users = tmp_path / "home"
+    targets = [users / "alice" / ".claude", tmp_path / "elsewhere" / ".claude"]
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+
+    summary = install_fleet(targets, ["core"], make_args(foreign_roots=[users]), registry)
+
+    assert (summary["succeeded"], summary["failed"]) == (1, 1)
+    assert (targets[0] / "RULES.md").exists()
+    assert "foreign roots" in summary["results"][1]["error"]
+
+
+def test_foreign_roots_keep_the_system_directory_denylist():
+    assert "system directory" in check_target(Path("/etc/skel/.claude"), [Path("/etc")])
+
+
+def test_fleet_rejects_components_that_change_the_invoking_user(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    targets = [tmp_path / "a" / ".claude"]
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+
+    summary = install_fleet(targets, ["mcp"], make_args(components=["mcp"]), registry)
+
+    assert summary["failed"] == 1 and summary["results"] == []
+    assert "mcp" in summary["errors"][0]
+    assert not targets[0].exists()
+
+
+def test_fleet_drives_one_bar_per_target_and_captures_worker_output(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(Component, "validate_prerequisites", lambda self, installSubPath=None: (True, []))
+    targets = [tmp_path / "a" / ".claude", Path("/nonexistent-home/.claude")]
+    registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+    progress = FleetProgress(targets)
+
+    summary = install_fleet(targets, ["core"], make_args(), registry, progress=progress)
+
+    done, failed = (progress.bars.bars[str(target)] for target in targets)
+    assert done.total > 1 and done.current == done.total
+    assert failed.current == 0
+    assert any(message["level"] == "SUCCESS" for message in summary["results"][0]["messages"])
+    assert "Installing core..." not in capsys.readouterr().out
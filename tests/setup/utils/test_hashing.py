@@ -0,0 +1,84 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from setup.managers.file_manager import FileManager
+from setup.utils import hashing
+from setup.utils.hashing import MMAP_THRESHOLD, HashCache, HashService, hash_file
+
+
+def make_old(path: Path) -> None:
+    """Move the mtime out of the window in which digests are not cached"""
+    past = time.time() - 60
+    os.utime(path, (past, past))
+
+
+def test_hash_file_matches_hashlib_for_small_mapped_and_empty_files(tmp_path: Path):
+    for name, data in (("small", b"abc" * 100), ("large", os.urandom(MMAP_THRESHOLD + 4096)), ("empty", b"")):
+        path = tmp_path / name
+        path.write_bytes(data)
+        assert hash_file(path) == hashlib.blake2b(data).hexdigest()
+        assert hash_file(path, "sha256") == hashlib.sha256(data).hexdigest()
+
+
+def test_batch_hashing_reports_missing_files(tmp_path: Path):
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"f{i}.md"
+        path.write_text(f"file {i}")
+        paths.append(path)
+    missing = tmp_path / "missing.md"
+
+    digests = HashService(max_workers=4).hash_files(paths + [missing, tmp_path])
+
+    assert digests[missing] is None and digests[tmp_path] is None
+    assert all(digests[path] == hashlib.blake2b(path.read_bytes()).hexdigest() for path in paths)
+
+
+def test_cache_is_reused_across_runs_until_the_file_changes(tmp_path: Path, monkeypatch):
+    cache_file = tmp_path / "hashes.json"
+    path = tmp_path / "RULES.md"
+    path.write_text("rules")
+    make_old(path)
+    expected = HashService(cache=HashCache(cache_file)).hash_files([path])[path]
+    assert cache_file.exists()
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("cached digest expected")
+
+    monkeypatch.setattr(hashing, "hash_file", no_reads)
+    assert HashService(cache=HashCache(cache_file)).hash_file(path) == expected
+
+    monkeypatch.undo()
+    path.write_text("changed rules")
+    make_old(path)
+    service = HashService(cache=HashCache(cache_file))
+    assert service.hash_file(path) == hashlib.blake2b(b"changed rules").hexdigest()
+
+
+def test_recently_modified_files_are_not_cached(tmp_path: Path):
+    path = tmp_path / "fresh.md"
+    path.write_text("fresh")
+    cache = HashCache(tmp_path / "hashes.json")
+
+    HashService(cache=cache).hash_files([path])
+
+    assert cache.get(path.stat()) is None
+    assert not (tmp_path / "hashes.json").exists()
+
+
+def test_file_manager_defaults_to_sha256_and_verifies_without_the_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "RULES.md"
+    path.write_bytes(b"rules")
+    make_old(path)
+    expected = hashlib.sha256(b"rules").hexdigest()
+    manager = FileManager()
+
+    assert manager.get_file_hash(path) == expected
+    hashing.get_hash_service("sha256").cache.put(os.stat(path), "stale")
+
+    assert manager.get_file_hash(path) == "stale"
+    assert manager.verify_file_integrity(path, expected)
+    assert not manager.verify_file_integrity(path, expected, "no-such-algorithm")
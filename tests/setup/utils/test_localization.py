@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from setup.utils import localization
+
+
+@pytest.fixture(autouse=True)
+def isolated_catalogs(tmp_path, monkeypatch):
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    localization._catalogs.clear()
+    localization.set_language("en")
+    yield tmp_path / "cache" / "locales"
+    localization._catalogs.clear()
+    localization.set_language("en")
+
+
+def test_catalog_is_loaded_lazily(isolated_catalogs):
+    localization.set_language("ja")
+    assert "ja" not in localization._catalogs
+
+    assert localization.get_string("progress.complete") != "progress.complete"
+    assert "ja" in localization._catalogs
+    assert (isolated_catalogs / "ja.catalog").exists()
+
+
+def test_compiled_catalog_is_reused(isolated_catalogs, mocker):
+    translations, path = localization.compile_catalog("en")
+    assert path is not None
+
+    localization._catalogs.clear()
+    spy = mocker.spy(json, "loads")
+    assert localization.load_catalog("en") == translations
+    assert spy.call_count == 0
+
+
+def test_stale_catalog_is_rebuilt(isolated_catalogs, mocker):
+    _, path = localization.compile_catalog("en")
+    with open(path, "r+b") as f:
+        f.write(b"XXXX")
+
+    localization._catalogs.clear()
+    spy = mocker.spy(json, "loads")
+    assert localization.get_string("progress.complete") == "Complete"
+    assert spy.call_count == 1
+
+
+def test_get_string_formatting():
+    assert localization.get_string("install.perform.installed", "core") == "Installed core"
+    assert localization.get_string("missing.key", 1) == "missing.key: 1"
+    assert localization.get_string("install.perform.installed") == "Installed {0}"
+
+
+def test_templates_are_parsed_once_and_render_like_str_format(mocker):
+    parse = mocker.spy(localization.string.Formatter, "parse")
+    template = localization._compile_template("{0:.1f}% of {1!r}, {{literal}}")
+
+    assert template.render((12.345, "core")) == "12.3% of 'core', {literal}"
+    assert template.render(("x", "core")) is None
+    assert template.render((1.0,)) is None
+    assert localization._compile_template("broken {0").render(("x",)) is None
+    assert localization._compile_template("plain text") is None
+
+    localization.set_language("en")
+    parse.reset_mock()
+    for _ in range(3):
+        assert localization.get_string("install.perform.installed", "core") == "Installed core"
+    assert parse.call_count == 1
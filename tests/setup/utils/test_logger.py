@@ -0,0 +1,133 @@
+from setup.utils.logger import Logger, LogLevel, LazyMessage
+
+
+def test_lazy_message_not_resolved_when_filtered(tmp_path, mocker):
+    logger = Logger("test_lazy_filtered", tmp_path, LogLevel.INFO, LogLevel.INFO)
+    resolve = mocker.patch("setup.utils.logger.get_string", return_value="text")
+
+    logger.debug(logger.lazy("component.install.copying", "a.md", tmp_path))
+
+    assert resolve.call_count == 0
+    logger.close()
+
+
+def test_lazy_message_resolved_once_for_all_handlers(tmp_path, mocker):
+    logger = Logger("test_lazy_emitted", tmp_path, LogLevel.DEBUG, LogLevel.DEBUG)
+    resolve = mocker.patch("setup.utils.logger.get_string", return_value="copied a.md")
+
+    logger.debug(logger.lazy("component.install.copying", "a.md"))
+    logger.flush()
+
+    assert resolve.call_count == 1
+    assert "copied a.md" in logger.log_file.read_text(encoding="utf-8")
+    logger.close()
+
+
+def test_lazy_message_str():
+    message = LazyMessage("install.perform.installed", "core")
+    assert str(message) == "Installed core"
+
+
+def test_success_uses_dedicated_level(tmp_path, capsys):
+    logger = Logger("test_success_level", tmp_path, LogLevel.INFO, LogLevel.DEBUG)
+
+    logger.success("all done")
+    logger.info("plain")
+    logger.flush()
+
+    out = capsys.readouterr().out
+    assert "[OK] all done" in out
+    assert "[INFO] plain" in out
+    assert "| SUCCESS  |" in logger.log_file.read_text(encoding="utf-8")
+    logger.close()
+
+
+def test_file_writes_from_many_threads_are_flushed(tmp_path):
+    import threading
+
+    logger = Logger("test_threaded", tmp_path, LogLevel.ERROR, LogLevel.DEBUG)
+
+    def work(worker):
+        for i in range(50):
+            logger.debug(f"worker {worker} line {i}")
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.flush()
+
+    lines = logger.log_file.read_text(encoding="utf-8").splitlines()
+    assert sum("worker" in line for line in lines) == 200
+    logger.close()
+
+
+def test_close_during_flush_waits_for_the_writer_to_restart(tmp_path, capsys):
+    import threading
+
+    from setup.utils.logger import _active_listeners
+
+    logger = Logger("test_flush_close", tmp_path, LogLevel.ERROR, LogLevel.DEBUG)
+    listener = logger.listener
+    stop = listener.stop
+    closer = threading.Thread(target=logger.close)
+
+    def stop_while_closing():
+        # close() from another thread right between flush's check and stop()
+        if closer.ident is None:
+            closer.start()
+            closer.join(0.2)
+        stop()
+
+    listener.stop = stop_while_closing
+    logger.flush()
+    closer.join()
+
+    assert listener not in _active_listeners and listener._thread is None
+
+
+def test_spans_nest_and_roll_up_bytes(tmp_path, capsys):
+    import json
+
+    logger = Logger("test_spans", tmp_path, LogLevel.INFO, LogLevel.DEBUG)
+
+    with logger.span("install.operation", components=["core"]):
+        with logger.span("install.component", component="core") as component:
+            with logger.span("install.files", files=2) as batch:
+                batch.add_bytes(100)
+                batch.add_bytes(50)
+            component.set_outcome("failed")
+    logger.flush()
+
+    records = [json.loads(line) for line in logger.json_log_file.read_text(encoding="utf-8").splitlines()]
+    spans = {r['span']: r for r in records if r['event'] == 'span'}
+
+    assert spans['install.files']['parent_id'] == spans['install.component']['span_id']
+    assert spans['install.component']['parent_id'] == spans['install.operation']['span_id']
+    assert spans['install.operation']['parent_id'] is None
+    assert spans['install.operation']['bytes'] == 150
+    assert spans['install.component']['outcome'] == 'failed'
+    assert spans['install.operation']['outcome'] == 'ok'
+    assert spans['install.files']['fields'] == {'files': 2}
+    assert spans['install.operation']['duration'] >= spans['install.files']['duration']
+
+    # Spans are for the log files only
+    assert "span install" not in capsys.readouterr().out
+    logger.close()
+
+
+def test_span_records_exceptions(tmp_path):
+    import json
+    import pytest
+
+    logger = Logger("test_span_error", tmp_path, LogLevel.ERROR, LogLevel.DEBUG)
+    with pytest.raises(RuntimeError):
+        with logger.span("backup.create"):
+            raise RuntimeError("disk full")
+    logger.flush()
+
+    record = json.loads(logger.json_log_file.read_text(encoding="utf-8").splitlines()[-1])
+    assert record['outcome'] == 'error'
+    assert record['fields']['error'] == "RuntimeError: disk full"
+    logger.close()
@@ -0,0 +1,52 @@
+import sys
+import threading
+
+from setup.utils.logger import get_logger
+from setup.utils.output import capture_output, is_captured
+from setup.utils.ui import display_warning
+
+
+def test_prints_and_log_records_are_captured(capsys):
+    with capture_output() as messages:
+        print("plain \x1b[92mline\x1b[0m")
+        display_warning("careful")
+        get_logger().error("broken")
+        assert is_captured()
+
+    assert not is_captured()
+    assert messages[0] == {"level": "output", "message": "plain line"}
+    assert "careful" in messages[1]["message"]
+    assert messages[2] == {"level": "ERROR", "message": "broken"}
+    assert capsys.readouterr().out == ""
+
+
+def test_other_threads_keep_printing(capsys):
+    with capture_output() as messages:
+        worker = threading.Thread(target=print, args=("from worker",))
+        worker.start()
+        worker.join()
+        print("captured")
+
+    assert messages == [{"level": "output", "message": "captured"}]
+    assert "from worker" in capsys.readouterr().out
+
+
+def test_original_streams_are_restored_after_the_last_capture():
+    stdout, stderr = sys.stdout, sys.stderr
+
+    with capture_output():
+        with capture_output():
+            pass
+        assert sys.stdout is not stdout
+
+    assert sys.stdout is stdout and sys.stderr is stderr
+
+
+def test_text_without_a_final_newline_is_kept():
+    with capture_output() as outer:
+        with capture_output() as messages:
+            sys.stdout.write("partial")
+        sys.stdout.write("next\n")
+
+    assert messages == [{"level": "output", "message": "partial"}]
+    assert outer == [{"level": "output", "message": "next"}]
@@ -0,0 +1,56 @@
+import pstats
+import time
+
+import pytest
+
+from setup.utils.profiling import OperationProfiler
+
+
+def allocate_and_sum(n):
+    data = [str(i) * 10 for i in range(n)]
+    return sum(len(item) for item in data)
+
+
+def allocate_spike():
+    spike = [bytes(1000) for _ in range(5000)]
+    time.sleep(0.2)
+    return len(spike)
+
+
+def test_profile_and_memory_summary_are_written(tmp_path):
+    profiler = OperationProfiler(tmp_path / "logs", "install", track_memory=True, top=5)
+
+    assert profiler.run(allocate_and_sum, 1000) > 0
+
+    prof_file, summary_file = profiler.save()
+    assert prof_file.suffix == ".prof"
+    stats = pstats.Stats(str(prof_file))
+    assert any(func[2] == "allocate_and_sum" for func in stats.stats)
+
+    summary = summary_file.read_text(encoding="utf-8")
+    assert "allocate_and_sum" in summary
+    assert "Peak traced memory" in summary
+
+
+def test_profiling_stops_when_operation_raises(tmp_path):
+    profiler = OperationProfiler(tmp_path, "update")
+
+    def fail(_):
+        raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        profiler.run(fail, None)
+
+    _, summary_file = profiler.save()
+    assert "Peak traced memory" not in summary_file.read_text(encoding="utf-8")
+
+
+def test_memory_summary_shows_the_sites_at_the_peak(tmp_path):
+    profiler = OperationProfiler(tmp_path, "install", track_memory=True, top=3)
+
+    profiler.run(allocate_spike)
+
+    # The spike was freed before the operation returned
+    assert profiler.snapshot_memory > 5000 * 1000
+    sites = profiler.format_summary().split("allocation sites at the largest sample")[1]
+    assert "test_profiling.py" in sites.splitlines()[1]
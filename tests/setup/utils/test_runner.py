@@ -0,0 +1,71 @@
+import subprocess
+
+import pytest
+
+from setup.utils import runner, trace
+
+
+@pytest.fixture(autouse=True)
+def clean_runner():
+    runner.reset_command_stats()
+    yield
+    runner.reset_command_stats()
+
+
+def completed(cmd, stdout=""):
+    return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+
+def test_kwargs_pass_through_with_table_timeout(mocker):
+    mock_run = mocker.patch("subprocess.run", return_value=completed(["claude"], "ok"))
+
+    runner.run_command(["claude", "mcp", "list"], capture_output=True, text=True)
+    runner.run_command(["node", "--version"], capture_output=True, timeout=3)
+
+    assert mock_run.call_args_list == [
+        mocker.call(["claude", "mcp", "list"], capture_output=True, text=True, timeout=15),
+        mocker.call(["node", "--version"], capture_output=True, timeout=3),
+    ]
+    stats = runner.get_command_stats()
+    assert stats['calls'] == 2
+    assert stats['commands']["claude mcp list"]['output_bytes'] == 2
+
+
+def test_cache_is_opt_in_and_cleared_by_mcp_add(mocker):
+    mock_run = mocker.patch("subprocess.run", side_effect=lambda cmd, **kw: completed(cmd))
+
+    for _ in range(3):
+        runner.run_command(["claude", "mcp", "list"], cache_ttl=60)
+    assert mock_run.call_count == 1
+
+    runner.run_command(["claude", "mcp", "list"])
+    assert mock_run.call_count == 2
+
+    runner.run_command(["claude", "mcp", "add", "-s", "user", "--", "x", "npx"])
+    runner.run_command(["claude", "mcp", "list"], cache_ttl=60)
+    assert mock_run.call_count == 4
+    assert runner.get_command_stats()['cache_hits'] == 2
+
+
+def test_timeouts_are_counted_and_reraised(mocker):
+    mocker.patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="npm", timeout=10))
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run_command(["npm", "--version"], cache_ttl=60)
+
+    assert runner.get_command_stats()['timeouts'] == 1
+    assert runner.get_command_history()[-1]['outcome'] == 'timeout'
+
+
+def test_runs_are_traced(mocker):
+    mocker.patch("subprocess.run", return_value=completed(["claude"]))
+    tracer = trace.enable_tracing()
+    try:
+        runner.run_command(["claude", "mcp", "list"])
+    finally:
+        trace.disable_tracing()
+
+    event = tracer.events[-1]
+    assert event['name'] == "claude mcp list"
+    assert event['cat'] == "subprocess"
+    assert event['args']['returncode'] == 0
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from setup.utils import trace
+
+
+@pytest.fixture
+def tracer():
+    tracer = trace.enable_tracing()
+    yield tracer
+    trace.disable_tracing()
+
+
+def test_helpers_are_noops_when_disabled():
+    assert trace.get_tracer() is None
+    with trace.trace_span("anything", "test") as span:
+        span.set(value=1)
+
+
+def test_trace_file_is_chrome_trace_format(tracer, tmp_path):
+    @trace.traced("decorated", "test")
+    def work():
+        return 42
+
+    with trace.trace_span("outer", "test", detail="x"):
+        assert work() == 42
+
+    path = tracer.save(tmp_path / "trace.json")
+    data = json.loads(path.read_text(encoding="utf-8"))
+
+    complete = {e['name']: e for e in data['traceEvents'] if e['ph'] == 'X'}
+    assert set(complete) == {"outer", "decorated"}
+    assert complete['outer']['args'] == {"detail": "x"}
+    assert complete['outer']['ts'] <= complete['decorated']['ts']
+    assert complete['outer']['dur'] >= complete['decorated']['dur']
+    assert any(e['ph'] == 'M' and e['name'] == 'thread_name' for e in data['traceEvents'])
+
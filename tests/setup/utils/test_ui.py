@@ -0,0 +1,59 @@
+import io
+
+from setup.utils.ui import ProgressBar, MultiProgressBar
+
+
+class TTYStream(io.StringIO):
+    def isatty(self):
+        return True
+
+
+def test_progress_bar_skips_unchanged_redraws():
+    stream = TTYStream()
+    bar = ProgressBar(total=1000, stream=stream, max_refresh_hz=0)
+
+    for i in range(10):
+        bar.update(1, "same")
+
+    assert bar.render_count == 1
+
+
+def test_progress_bar_throttles_redraws():
+    stream = TTYStream()
+    bar = ProgressBar(total=1000, stream=stream, max_refresh_hz=1)
+
+    for i in range(1, 1001):
+        bar.update(i)
+    bar.finish("done")
+
+    # First draw plus the forced final draw
+    assert bar.render_count == 2
+    assert stream.getvalue().endswith("\n")
+
+
+def test_progress_bar_writes_plain_lines_without_tty():
+    stream = io.StringIO()
+    bar = ProgressBar(total=10, prefix="Installing: ", stream=stream)
+
+    bar.update(5, "core")
+    bar.finish("done")
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("Installing:  50.0% core")
+    assert lines[-1].startswith("Installing: 100.0% done")
+    assert "\r" not in stream.getvalue()
+
+
+def test_multi_progress_bar_redraws_block():
+    stream = TTYStream()
+    bars = MultiProgressBar(stream=stream, max_refresh_hz=0)
+    bars.add_bar("core", 10, "core ")
+    bars.add_bar("hooks", 10, "hooks ")
+
+    bars.update("core", 5, "copying")
+    bars.update("hooks", 2, "copying")
+    bars.finish()
+
+    output = stream.getvalue()
+    assert "core [" in output and "hooks [" in output
+    assert "\x1b[1F" in output
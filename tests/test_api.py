@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from SuperClaude import api
+from setup.base.component import Component
+from setup.utils.security import SecurityValidator
+
+
+@pytest.fixture
+def home(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SUPERCLAUDE_CACHE_DIR", str(tmp_path / "cache"))
+    # The security checks refuse anything below /tmp
+    monkeypatch.setattr(Component, "validate_prerequisites", lambda self, installSubPath=None: (True, []))
+    return tmp_path
+
+
+def test_install_returns_structured_result_without_printing(home: Path, capsys):
+    events = []
+
+    result = api.install(["core"], home / "user" / ".claude", {"force": True},
+                         on_event=lambda name, data: events.append(name))
+
+    assert result["success"], result["errors"]
+    assert result["installed"] == ["core"]
+    assert (home / "user" / ".claude" / "RULES.md").exists()
+    assert events[0] == "install_start" and events[-1] == "install_finish"
+    assert [event["event"] for event in result["events"]] == events
+    assert any(message["level"] == "SUCCESS" for message in result["messages"])
+    assert capsys.readouterr().out == ""
+
+
+def test_errors_are_reported_in_the_result(home: Path):
+    outside = api.install(["core"], Path("/nonexistent-home/.claude"))
+    unknown = api.install(["nope"], home / ".claude")
+
+    assert not outside["success"] and "home directory" in outside["errors"][0]
+    assert not unknown["success"] and "nope" in unknown["errors"][0]
+    with pytest.raises(ValueError):
+        api.install(["core"], home / ".claude", {"colour": True})
+
+
+def test_install_outside_the_home_directory_below_a_foreign_root(home: Path, monkeypatch):
+    monkeypatch.setenv("HOME", str(home / "service"))
+    # tmp_path is below the /tmp system directory
+    monkeypatch.setattr(SecurityValidator, "system_directory_of", classmethod(lambda cls, path: None))
+    target = home / "users" / "alice" / ".claude"
+    assert Path.home() not in target.parents
+
+    refused = api.install(["core"], target, {"force": True})
+    result = api.install(["core"], target, {"force": True, "foreign_roots": [home / "users"]})
+
+    assert not refused["success"] and "home directory" in refused["errors"][0]
+    assert result["success"], result["errors"]
+    assert (target / "RULES.md").exists()
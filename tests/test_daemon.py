@@ -0,0 +1,93 @@
+import argparse
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from SuperClaude import daemon
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="needs Unix domain sockets")
+
+
+def make_server(path: Path, calls: list) -> daemon.DaemonServer:
+    parser = argparse.ArgumentParser(prog="SuperClaude")
+    subparsers = parser.add_subparsers(dest="operation")
+    subparsers.add_parser("update").add_argument("--check", action="store_true")
+    subparsers.add_parser("install").add_argument("--components", nargs="+")
+
+    def run_update(args):
+        calls.append((os.getcwd(), os.environ.get("SC_TEST_VALUE")))
+        print("  checked")
+        return 3
+
+    return daemon.DaemonServer(path, parser, {"update": run_update, "install": run_update}, lambda args: None)
+
+
+def test_cli_invocations_are_served_by_the_daemon(tmp_path: Path, monkeypatch, capsys):
+    monkeypatch.delenv("SUPERCLAUDE_NO_DAEMON", raising=False)
+    path = tmp_path / "sc.sock"
+    calls = []
+    server = make_server(path, calls)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    try:
+        monkeypatch.setenv("SC_TEST_VALUE", "client")
+        monkeypatch.chdir(tmp_path)
+
+        assert daemon.forward(["update", "--check"], path) == 3
+        assert capsys.readouterr().out == "  checked\n"
+        assert calls == [(str(tmp_path), "client")]
+        assert os.environ.get("SC_TEST_VALUE") == "client"
+
+        # Interactive operations are declined and run by the caller
+        assert daemon.forward(["update"], path) is None
+        assert daemon.forward(["install", "--components", "update"], path) is None
+        assert len(calls) == 1
+
+        assert daemon.request_status(path)["requests"] == 3
+    finally:
+        assert daemon.request_stop(path)
+        thread.join(5)
+        server.server_close()
+
+    assert not thread.is_alive()
+    assert not path.exists()
+    assert daemon.forward(["update", "--check"], path) is None
+
+
+def test_daemon_with_changed_sources_declines_and_asks_for_a_restart(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("SUPERCLAUDE_NO_DAEMON", raising=False)
+    path = tmp_path / "sc.sock"
+    calls = []
+    server = make_server(path, calls)
+    # As if the source tree was edited after the daemon loaded it
+    server.fingerprint = "loaded-before-git-pull"
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    try:
+        assert daemon.forward(["update", "--check"], path) is None
+        thread.join(5)
+        assert not thread.is_alive()
+        assert server.restart_requested
+        assert calls == []
+    finally:
+        server.server_close()
+
+
+def test_operation_crash_is_logged_with_its_traceback(tmp_path: Path, mocker):
+    server = make_server(tmp_path / "sc.sock", [])
+
+    def crash(args):
+        raise RuntimeError("boom")
+
+    server.operations["update"] = crash
+    exception = mocker.spy(daemon.get_logger(), "exception")
+    try:
+        reply = server.run_cli(["update", "--check"], None, None)
+    finally:
+        server.server_close()
+
+    assert reply["exit_code"] == 1
+    assert {"level": "ERROR", "message": "Unhandled error: boom"} in reply["output"]
+    assert exception.call_count == 1